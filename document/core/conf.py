@@ -499,3 +499,8 @@ rst_prolog = """
 mathjax3_config = {
     'tex': { 'maxBuffer': 30*1024 },
 }
+
+# util/mathdef.py can also render the math with KaTeX at build time, so that
+# the pages need no MathJax: sphinx-build -D html_math_renderer=katex.
+# https://www.sphinx-doc.org/en/master/usage/configuration.html#confval-html_math_renderer
+html_math_renderer = 'mathjax'
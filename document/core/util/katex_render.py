@@ -0,0 +1,243 @@
+# KaTeX rendering shared by mathjax2katex.py and the Sphinx HTML build
+# (see mathdef.py): the fragment cache, the katex servers and the expansion
+# of the mathdef macros.
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import threading
+import time
+
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+# Update this to invalidate the cache, e.g. when changing the rendering in
+# mathjax2katex.py or mathdef.py. Cache keys include the katex version, so
+# updating katex does not need it.
+CACHE_VERSION = 3
+# Least recently used fragments are evicted from the cache past this size.
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# TeX that MathJax takes but KaTeX does not, as (old, new) pairs, replaced in
+# both builds.
+TEX_FIXUPS = [
+    ('\\hfill', ''),
+    ('\\mbox', '\\text'),
+    ('\\begin{split}', '\\begin{aligned}'),
+    ('\\end{split}', '\\end{aligned}'),
+    ('{array}[t]', '{array}'),
+    ('{array}[b]', '{array}'),
+    ('@{~}', ''),
+    ('@{}', ''),
+    ('@{\\qquad}', ''),
+    ('@{\\qquad\\qquad}', ''),
+]
+
+
+def KatexVersion():
+  try:
+    with open(os.path.join(SCRIPT_DIR, 'katex', 'package.json')) as f:
+      return json.load(f)['version']
+  except (OSError, ValueError, KeyError):
+    return 'unknown'
+
+
+class FragmentCache(object):
+  """Rendered fragments in a SQLite database, keyed by a hash of the TeX,
+  the katex version and CACHE_VERSION.
+
+  The database is in WAL mode and each thread has its own connection, so the
+  worker threads, and other processes, can use the same cache file at once,
+  e.g. the builds of several documents or successive CI runs. Closing the
+  cache records the access time of the fragments used and evicts the least
+  recently used ones past max_bytes.
+  """
+
+  def __init__(self, filename, max_bytes=CACHE_MAX_BYTES):
+    self.filename = filename
+    self.max_bytes = max_bytes
+    self.salt = '%d\0%s\0' % (CACHE_VERSION, KatexVersion())
+    self.local = threading.local()
+    self.lock = threading.Lock()
+    self.connections = []
+    self.used = set()
+    db = self.Connection()
+    db.execute('CREATE TABLE IF NOT EXISTS fragments ('
+               'key TEXT PRIMARY KEY, html TEXT NOT NULL, '
+               'size INTEGER NOT NULL, accessed REAL NOT NULL)')
+    db.execute('CREATE INDEX IF NOT EXISTS fragments_accessed '
+               'ON fragments (accessed)')
+
+  def Connection(self):
+    db = getattr(self.local, 'db', None)
+    if db is None:
+      db = sqlite3.connect(self.filename, timeout=60, isolation_level=None,
+                           check_same_thread=False)
+      db.execute('PRAGMA journal_mode=WAL')
+      db.execute('PRAGMA synchronous=NORMAL')
+      self.local.db = db
+      with self.lock:
+        self.connections.append(db)
+    return db
+
+  def Key(self, tex):
+    return hashlib.sha256((self.salt + tex).encode('utf-8')).hexdigest()
+
+  def Get(self, tex):
+    key = self.Key(tex)
+    row = self.Connection().execute(
+        'SELECT html FROM fragments WHERE key = ?', (key,)).fetchone()
+    if row is None:
+      return None
+    with self.lock:
+      self.used.add(key)
+    return row[0]
+
+  def Put(self, tex, html):
+    self.Connection().execute(
+        'INSERT OR REPLACE INTO fragments VALUES (?, ?, ?, ?)',
+        (self.Key(tex), html, len(html.encode('utf-8')), time.time()))
+
+  def Close(self):
+    db = self.Connection()
+    now = time.time()
+    db.execute('BEGIN IMMEDIATE')
+    db.executemany('UPDATE fragments SET accessed = ? WHERE key = ?',
+                   [(now, key) for key in self.used])
+    total = db.execute('SELECT COALESCE(SUM(size), 0) FROM fragments').fetchone()[0]
+    if total > self.max_bytes:
+      evicted = []
+      for key, size in db.execute(
+          'SELECT key, size FROM fragments ORDER BY accessed'):
+        if total <= self.max_bytes:
+          break
+        evicted.append((key,))
+        total -= size
+      db.executemany('DELETE FROM fragments WHERE key = ?', evicted)
+    db.execute('COMMIT')
+    for connection in self.connections:
+      connection.close()
+
+
+class KatexServer(object):
+  """A node process that loads KaTeX once and renders fragments sent to it,
+  one JSON line per request and reply (see katex_server.js). Fragments are
+  rendered as display math unless display_mode is False."""
+
+  def __init__(self, display_mode=True):
+    self.proc = subprocess.Popen(
+        ['node', os.path.join(SCRIPT_DIR, 'katex_server.js')] +
+        (['--display-mode'] if display_mode else []) + ['--trust'],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        text=True, encoding='utf-8')
+
+  def Render(self, tex):
+    """Returns (html, error message, seconds), one of html and error is
+    None. seconds is the time katex took to render the fragment."""
+    self.proc.stdin.write(json.dumps({'tex': tex}) + '\n')
+    self.proc.stdin.flush()
+    line = self.proc.stdout.readline()
+    if not line:
+      return (None, 'katex server exited with %s' % self.proc.wait(), 0.0)
+    reply = json.loads(line)
+    return (reply.get('html'), reply.get('error'), reply.get('seconds', 0.0))
+
+  def Close(self):
+    self.proc.stdin.close()
+    self.proc.wait()
+
+
+BRACE_RE = re.compile('[{}]')
+CONTROL_WORD_RE = re.compile(r'\\[0-9A-Za-z]+\Z')
+INVOCATION_RE = re.compile(r'\\[0-9A-Za-z]+\{')
+
+
+def GroupEnd(data, start):
+  """Index just after the brace group opened by the first brace at or after
+  start."""
+  total = 0
+  for match in BRACE_RE.finditer(data, start):
+    if match.group() == '{':
+      total += 1
+    else:
+      total -= 1
+      if total == 0:
+        return match.end()
+  raise ValueError('unbalanced braces: ' + data[start:start+80])
+
+
+def ExpandMacros(data):
+  """Expand the \\def macros of mathdef.py, which katex does not support.
+
+  One pass collects and removes the definitions, a second one substitutes
+  the invocations, expanding the result of each substitution in turn, as
+  it can contain invocations from the argument or the body, in time linear
+  in the fragment size times the nesting depth of the invocations.
+
+  Unlike the earlier expansion macro by macro in definition order, this
+  also expands invocations of a macro that a later macro's substitution
+  produces, which that left for katex to fail on. The output is otherwise
+  the same.
+  """
+  macros = {}
+  parts = []
+  last = 0
+  start = data.find('\\def\\')
+  while start >= 0:
+    end = GroupEnd(data, start)
+    definition = data[start:end]
+    name_end = definition.find('#')
+    assert name_end > 0
+    macros[definition[len('\\def'):name_end]] = definition[name_end+len('#1'):]
+    parts.append(data[last:start])
+    last = end
+    start = data.find('\\def\\', end)
+  if not macros:
+    return data
+  parts.append(data[last:])
+
+  if all(CONTROL_WORD_RE.match(name) for name in macros):
+    # Find invocations as any control word followed by a brace, which is
+    # much faster than an alternative per name for large fragments.
+    invocation = INVOCATION_RE
+
+    def Trailing(text):
+      name = text[text.rfind('\\'):]
+      return name if name in macros else None
+  else:
+    invocation = re.compile('|'.join(re.escape(name + '{') for name in macros))
+
+    def Trailing(text):
+      return next((k for k in macros if text.endswith(k)), None)
+
+  def Expand(text):
+    out = []
+    pos = search = 0
+    while True:
+      match = invocation.search(text, search)
+      if match is None:
+        break
+      value = macros.get(match.group()[:-1])
+      if value is None:
+        search = match.end()
+        continue
+      end = GroupEnd(text, match.end() - 1)
+      before = text[pos:match.start()]
+      ret = Expand(value.replace('#1', text[match.end()-1:end]))
+      # The substitution starts with a brace, so it is the argument of a
+      # macro name right before it.
+      while True:
+        name = Trailing(before)
+        if name is None:
+          break
+        before = before[:-len(name)]
+        ret = Expand(macros[name].replace('#1', ret))
+      out.append(before)
+      out.append(ret)
+      pos = search = end
+    out.append(text[pos:])
+    return ''.join(out)
+
+  return Expand(''.join(parts))
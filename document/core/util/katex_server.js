@@ -0,0 +1,31 @@
+#! /usr/bin/env node
+// Long-lived KaTeX renderer for mathjax2katex.py.
+//
+// Loads KaTeX once, then reads one JSON request per line on stdin,
+// {"tex": "..."}, and answers each in order with one JSON line on stdout,
+// {"html": "..."} or {"error": "..."}, along with "seconds", the time the
+// rendering took. Takes the same rendering flags as katex/cli.js. Exits when
+// stdin is closed.
+
+const readline = require('readline');
+const katex = require('./katex');
+
+const options = {
+  displayMode: process.argv.includes('--display-mode'),
+  trust: process.argv.includes('--trust'),
+};
+
+const input = readline.createInterface({input: process.stdin, crlfDelay: Infinity});
+
+input.on('line', (line) => {
+  const request = JSON.parse(line);
+  const start = process.hrtime.bigint();
+  let reply;
+  try {
+    reply = {html: katex.renderToString(request.tex, options)};
+  } catch (e) {
+    reply = {error: String(e && e.message || e)};
+  }
+  reply.seconds = Number(process.hrtime.bigint() - start) / 1e9;
+  process.stdout.write(JSON.stringify(reply) + '\n');
+});
@@ -1,4 +1,8 @@
 from sphinx.directives.patches import MathDirective
+from sphinx.locale import _
+from sphinx.util import logging
+from sphinx.util.fileutil import copy_asset
+from sphinx.util.math import get_node_equation_number
 from sphinx.util.texescape import tex_replace_map
 from sphinx.writers.html5 import HTML5Translator
 from sphinx.writers.latex import LaTeXTranslator
@@ -6,8 +10,16 @@ from docutils import nodes
 from docutils.nodes import math
 from docutils.parsers.rst.directives.misc import Replace
 from six import text_type
+from multiprocessing.util import Finalize
+import os
 import re
 
+from .katex_render import (SCRIPT_DIR, TEX_FIXUPS, FragmentCache, KatexServer,
+                           ExpandMacros)
+
+
+logger = logging.getLogger(__name__)
+
 
 # Transform \xref in math nodes
 
@@ -35,35 +47,59 @@ def latex_transform_math_xref(node):
 
 def_re = re.compile('\\\\[A-Za-z][0-9A-Za-z]*', re.M)
 
-auxcounter = 0
+# The state is kept in the build environment, per document, so that documents
+# can be read in parallel: env.mathdefs maps each document to its definitions,
+# env.mathdef_counters to the number of auxiliary macros named for it. Names
+# only depend on the document, not on the order documents are read in.
 
-def lookup_mathdef(defs, name):
+def init_mathdefs(env):
+  if not hasattr(env, 'mathdefs'):
+    env.mathdefs = {}
+    env.mathdef_counters = {}
+
+def lookup_mathdef(env, defs, name):
   if name in defs:
     [arity, s] = defs[name]
     if arity > 0:
-      global auxcounter
-      auxcounter = auxcounter + 1
-      name = "\\mathdef%d" % auxcounter
+      counter = env.mathdef_counters.get(env.docname, 0) + 1
+      env.mathdef_counters[env.docname] = counter
+      name = "\\mathdef%d" % counter
       s = "\\def%s#%d{%s}%s" % (name, arity, s, name)
     return s
   return name
 
-def replace_mathdefs(doc, s):
-  if not hasattr(doc, 'mathdefs'):
+def replace_mathdefs(env, s):
+  init_mathdefs(env)
+  defs = env.mathdefs.get(env.docname)
+  if not defs:
     return s
-  return def_re.sub(lambda m: lookup_mathdef(doc.mathdefs, m.group(0)), s)
+  return def_re.sub(lambda m: lookup_mathdef(env, defs, m.group(0)), s)
+
+def purge_mathdefs(app, env, docname):
+  init_mathdefs(env)
+  env.mathdefs.pop(docname, None)
+  env.mathdef_counters.pop(docname, None)
+
+def merge_mathdefs(app, env, docnames, other):
+  init_mathdefs(env)
+  init_mathdefs(other)
+  for docname in docnames:
+    if docname in other.mathdefs:
+      env.mathdefs[docname] = other.mathdefs[docname]
+    if docname in other.mathdef_counters:
+      env.mathdef_counters[docname] = other.mathdef_counters[docname]
 
 def ext_math_role(role, raw, text, line, inliner, options = {}, content = []):
-  text = replace_mathdefs(inliner.document, raw.split('`')[1])
+  text = replace_mathdefs(inliner.document.settings.env, raw.split('`')[1])
   return [math(raw, text)], []
 
 class ExtMathDirective(MathDirective):
   def run(self):
-    doc = self.state.document
+    env = self.state.document.settings.env
     for i, s in enumerate(self.content):
-      self.content[i] = replace_mathdefs(doc, s)
+      self.content[i] = replace_mathdefs(env, s)
     for i, s in enumerate(self.arguments):
-      self.arguments[i] = replace_mathdefs(doc, s)
+      self.arguments[i] = replace_mathdefs(env, s)
     return super().run()
 
 class MathdefDirective(Replace):
@@ -75,13 +111,12 @@ class MathdefDirective(Replace):
     else:
       arity = 0
     name = name[0]
-    doc = self.state.document
-    if not hasattr(doc, 'mathdefs'):
-      doc.mathdefs = {}
+    env = self.state.document.settings.env
+    init_mathdefs(env)
     # TODO: we don't ever hit the case where len(self.content) > 1
     for i, s in enumerate(self.content):
-      self.content[i] = replace_mathdefs(doc, s)
-    doc.mathdefs[name] = [arity, ''.join(self.content)]
+      self.content[i] = replace_mathdefs(env, s)
+    env.mathdefs.setdefault(env.docname, {})[name] = [arity, ''.join(self.content)]
     self.content[0] = ':math:`' + self.content[0]
     self.content[-1] = self.content[-1] + '`'
     return super().run()
@@ -112,6 +147,109 @@ class WebAssemblyLaTeXTranslator(LaTeXTranslator):
     latex_transform_math_xref(node)
     super().visit_math_block(node)
 
+# Render math with KaTeX at build time, with html_math_renderer = 'katex'
+
+class KatexRenderer:
+  """
+  Render math through the fragment cache shared with mathjax2katex.py,
+  with one katex server for inline and one for display math.
+  """
+  def __init__(self, filename):
+    self.pid = os.getpid()
+    self.cache = FragmentCache(filename)
+    self.servers = {}
+    # Writer processes forked by -j exit without running atexit handlers or
+    # build-finished, but with multiprocessing finalizers: their renderer
+    # records its cache hits and stops its servers then.
+    self.finalizer = Finalize(self, self.finish, exitpriority=0)
+
+  def render(self, tex, display):
+    """Returns (html, error message), one of them is None."""
+    for old, new in TEX_FIXUPS:
+      tex = tex.replace(old, new)
+    # Keys differ from those of mathjax2katex.py, which renders differently.
+    key = ('sphinx-display:' if display else 'sphinx-inline:') + tex
+    html = self.cache.Get(key)
+    if html is not None:
+      return html, None
+    if display not in self.servers:
+      self.servers[display] = KatexServer(display)
+    try:
+      html, error = self.servers[display].Render(ExpandMacros(tex))[:2]
+    except ValueError as e:
+      return None, str(e)
+    if html is not None:
+      self.cache.Put(key, html)
+    return html, error
+
+  def finish(self):
+    for server in self.servers.values():
+      server.Close()
+    self.cache.Close()
+
+  def close(self):
+    # Runs finish at most once.
+    self.finalizer()
+
+def katex_render(self, node, tex, display):
+  builder = self.builder
+  # Parallel writes fork the builder, after it may have started a renderer:
+  # each process needs its own cache connection and servers.
+  katex = getattr(builder, 'katex', None)
+  if katex is None or katex.pid != os.getpid():
+    filename = os.path.join(builder.app.doctreedir, 'katex.cache.sqlite')
+    # The cache can be shared with other builds with KATEX_CACHE.
+    katex = builder.katex = KatexRenderer(os.environ.get('KATEX_CACHE', filename))
+  html, error = katex.render(tex, display)
+  if html is None:
+    logger.warning('KaTeX failed on %s: %s', tex, error, location=node)
+    return self.encode(tex)
+  return html
+
+def html_visit_math_katex(self, node):
+  self.body.append(self.starttag(node, 'span', '', CLASS='math notranslate nohighlight'))
+  self.body.append(katex_render(self, node, node.astext(), False) + '</span>')
+  raise nodes.SkipNode
+
+# Mirrors sphinx/ext/mathjax, without the HTML escaping
+def html_visit_displaymath_katex(self, node):
+  self.body.append(self.starttag(node, 'div', CLASS='math notranslate nohighlight'))
+  if node['nowrap']:
+    tex = node.astext()
+  else:
+    if node['number']:
+      number = get_node_equation_number(self, node)
+      self.body.append('<span class="eqno">(%s)' % number)
+      self.add_permalink_ref(node, _('Permalink to this equation'))
+      self.body.append('</span>')
+    parts = [prt for prt in node.astext().split('\n\n') if prt.strip()]
+    parts = ['\\begin{split}' + prt + '\\end{split}' if '\\\\' in prt else prt
+             for prt in parts]
+    tex = '\\\\'.join(parts)
+    if len(parts) > 1:
+      tex = '\\begin{align}\\begin{aligned}' + tex + '\\end{aligned}\\end{align}'
+  self.body.append(katex_render(self, node, tex, True))
+  self.body.append('</div>\n')
+  raise nodes.SkipNode
+
+def uses_katex(builder):
+  return builder.format == 'html' and builder.math_renderer_name == 'katex'
+
+def init_katex(app):
+  if uses_katex(app.builder):
+    app.add_css_file('katex/katex.css')
+
+def finish_katex(app, exception):
+  if hasattr(app.builder, 'katex'):
+    app.builder.katex.close()
+  # The math may all have been rendered by parallel writer processes.
+  # The css is left as it is: katex_fix.patch is for the standalone bikeshed
+  # page, to which it also adds table borders that would override the theme
+  # on every table here.
+  if exception is None and uses_katex(app.builder):
+    copy_asset(os.path.join(SCRIPT_DIR, 'katex', 'dist'),
+               os.path.join(app.outdir, '_static', 'katex'))
+
 # Setup
 
 def setup(app):
@@ -120,3 +258,15 @@ def setup(app):
   app.add_role('math', ext_math_role)
   app.add_directive('math', ExtMathDirective, override = True)
   app.add_directive('mathdef', MathdefDirective)
+  app.add_html_math_renderer('katex',
+                             (html_visit_math_katex, None),
+                             (html_visit_displaymath_katex, None))
+  app.connect('env-purge-doc', purge_mathdefs)
+  app.connect('env-merge-info', merge_mathdefs)
+  app.connect('builder-inited', init_katex)
+  app.connect('build-finished', finish_katex)
+  return {
+    'env_version': 1,
+    'parallel_read_safe': True,
+    'parallel_write_safe': True,
+  }
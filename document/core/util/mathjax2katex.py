@@ -1,118 +1,122 @@
 #! /usr/bin/env python3
 # -*- coding: latin-1 -*-
 
+import atexit
+import collections
+import json
+import mmap
 import queue
 import os
 import re
-import shelve
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
 import threading
+import time
+import traceback
+
+from katex_render import TEX_FIXUPS, FragmentCache, KatexServer, ExpandMacros
+from rewriter import Rewriter, Literal, Regex
 
 
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
-# Update this to invalidate the cache; e.g. when updating katex.
-CACHE_VERSION = 2
 
 
-def FindMatching(data, prefix):
-  start = data.find(prefix)
-  if start < 0:
-    return (None, None)
-  end = start + 1
-  total = 0
-  while True:
-    if data[end] == '{':
-      total += 1
-    elif data[end] == '}':
-      total -= 1
-      if total == 0:
-        end += 1
-        break
-    end += 1
-  return (start, end)
-
-
-def HasBalancedTags(s):
+# One server per worker thread, started on first use.
+servers = []
+servers_lock = threading.Lock()
+thread_state = threading.local()
+
+
+def RenderKatex(texs):
+  """Render texs with the server of the current thread."""
+  server = getattr(thread_state, 'server', None)
+  if server is None:
+    server = thread_state.server = KatexServer()
+    with servers_lock:
+      servers.append(server)
+  return [server.Render(tex) for tex in texs]
+
+
+def RenderKatexBatch(texs):
+  """Render texs with a katex process of their own, for when long-lived
+  servers are not an option."""
+  p = subprocess.Popen(
+      ['node', os.path.join(SCRIPT_DIR, 'katex_server.js'),
+       '--display-mode', '--trust'],
+      stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+      text=True, encoding='utf-8')
+  out = p.communicate(''.join(json.dumps({'tex': tex}) + '\n' for tex in texs))[0]
+  replies = [json.loads(line) for line in out.split('\n') if line]
+  results = [(reply.get('html'), reply.get('error'), reply.get('seconds', 0.0))
+             for reply in replies]
+  # Fragments without a reply fail, the others are kept.
+  error = 'katex exited with %d' % p.returncode
+  return results + [(None, error, 0.0)] * (len(texs) - len(results))
+
+
+def CloseServers():
+  for server in servers:
+    server.Close()
+
+
+def UnbalancedTag(s):
+  """Describe the first tag of the html s that does not nest, or return None
+  if they all do."""
   tt = re.findall(r'(</?\w+|/>)', s)
   tags = []
   for tag in tt:
     if tag == '/>':
       # self-closing tag.
-      tags.pop
-    elif tag[0] == '</':
+      if not tags:
+        return 'got "/>" with an empty tag stack'
+      tags.pop()
+    elif tag.startswith('</'):
       # closing tag
       tag = tag[2:]
       if len(tags) == 0 or tag != tags[-1]:
         expected = '"%s"' % tags[-1] if len(tags) else 'empty tag stack'
-        sys.stderr.write('expected %s, got "%s"\n' % (expected, tag))
-        sys.stderr.write('tags: %s\n' % tt)
-        sys.stderr.write('tag stack: %s\n' % tags)
-        sys.stderr.write('string: %s\n' % s)
-        return False
-
+        return 'expected %s, got "%s"' % (expected, tag)
       tags.pop()
     else:
       # opening tag
       tags.append(tag[1:])
-  return True
-
-
-def ReplaceMath(cache, data):
-  old = data
-  data = data.replace('\\\\', '\\DOUBLESLASH')
-  data = data.replace('\\(', '')
-  data = data.replace('\\)', '')
-  data = data.replace('\\[', '')
-  data = data.replace('\\]', '')
-  data = data.replace('\\DOUBLESLASH', '\\\\')
-  data = data.replace('’', '\\text{’}')
-  data = data.replace('‘', '\\text{‘}')
-  data = data.replace('\\hfill', '')
-  data = data.replace('\\mbox', '\\text')
-  data = data.replace('\\begin{split}', '\\begin{aligned}')
-  data = data.replace('\\end{split}', '\\end{aligned}')
-  data = data.replace('&amp;', '&')
-  data = data.replace('&lt;', '<')
-  data = data.replace('&gt;', '>')
-  data = data.replace('{array}[t]', '{array}')
-  data = data.replace('{array}[b]', '{array}')
-  data = data.replace('@{~}', '')
-  data = data.replace('@{}', '')
-  data = data.replace('@{\\qquad}', '')
-  data = data.replace('@{\\qquad\\qquad}', '')
+  if tags:
+    return 'unclosed tags: %s' % tags
+  return None
+
+
+MATH_RULES = Rewriter([
+    # Keep \\\\ from being taken for one of the delimiters.
+    Literal('\\\\', '\\\\'),
+    Literal('\\(', ''),
+    Literal('\\)', ''),
+    Literal('\\[', ''),
+    Literal('\\]', ''),
+    Literal('’', '\\text{’}'),
+    Literal('‘', '\\text{‘}'),
+] + [Literal(old, new) for old, new in TEX_FIXUPS] + [
+    # &amp; is unescaped before &lt; and &gt;.
+    Literal('&amp;lt;', '<'),
+    Literal('&amp;gt;', '>'),
+    Literal('&amp;', '&'),
+    Literal('&lt;', '<'),
+    Literal('&gt;', '>'),
+])
+
+
+def NormalizeMath(data):
+  """The TeX to render for a math fragment of the bikeshed output. Fragments
+  with the same normalized TeX render the same."""
+  data = MATH_RULES.Rewrite(data)
   data = re.sub('([^\\\\])[$]', '\\1', data)
-  data = '\\mathrm{' + data + '}'
+  return '\\mathrm{' + data + '}'
 
-  if data in cache:
-    return cache[data]
 
-  macros = {}
-  while True:
-    start, end = FindMatching(data, '\\def\\')
-    if start is None:
-      break
-    parts = data[start:end]
-    name_end = parts.find('#')
-    assert name_end > 0
-    name = parts[len('\\def'):name_end]
-    value = parts[name_end+len('#1'):end]
-    macros[name] = value
-    data = data[:start] + data[end:]
-  for k, v in macros.items():
-    while True:
-      start, end = FindMatching(data, k + '{')
-      if start is None:
-        break
-      data = data[:start] + v.replace('#1', data[start+len(k):end]) + data[end:]
-  p = subprocess.Popen(
-      ['node', os.path.join(SCRIPT_DIR, 'katex/cli.js'), '--display-mode', '--trust'],
-      stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
-  ret = p.communicate(input=data)[0]
-  if p.returncode != 0:
-    sys.stderr.write('BEFORE:\n' + old + '\n')
-    sys.stderr.write('AFTER:\n' + data + '\n')
-    raise Exception()
+def FixKatex(ret):
+  """Trim and fix up the html katex rendered."""
   ret = ret.strip()
   ret = ret[ret.find('<span class="katex-html"'):]
   ret = '<span class="katex-display"><span class="katex">' + ret
@@ -123,110 +127,360 @@ def ReplaceMath(cache, data):
   # Fix stray spans that come out of katex.
   ret = re.sub('[<]span class="vlist" style="height:[0-9.]+em;"[>]',
                '<span class="vlist">', ret)
-  assert HasBalancedTags(ret)
-
-  cache[data] = ret
   return ret
 
 
+def ReplaceMath(cache, fragments, render):
+  """Render the math fragments, a list of (normalized TeX, original text).
+
+  The fragments missing from the cache are rendered with a single call of
+  render, which takes a list of TeX and returns (html, error, seconds) for
+  each. Returns [html, cached, seconds] for each fragment, html is None for
+  the ones that failed; a failure does not affect the other fragments. A
+  rendered fragment takes the time katex took for it, the rest of the time
+  of the render call, e.g. starting katex, goes to the first one.
+  """
+  results = []
+  for data, old in fragments:
+    start = time.perf_counter()
+    ret = cache.Get(data)
+    results.append([ret, ret is not None, time.perf_counter() - start])
+  misses = [i for i, (ret, cached, seconds) in enumerate(results) if not cached]
+  if not misses:
+    return results
+  start = time.perf_counter()
+  texs = [ExpandMacros(fragments[i][0]) for i in misses]
+  rendered = render(texs)
+  results[misses[0]][2] += (time.perf_counter() - start -
+                            sum(seconds for ret, error, seconds in rendered))
+  for i, tex, (ret, error, seconds) in zip(misses, texs, rendered):
+    start = time.perf_counter()
+    data, old = fragments[i]
+    if error is None:
+      ret = FixKatex(ret)
+      unbalanced = UnbalancedTag(ret)
+      if unbalanced is not None:
+        error = 'Unbalanced tags in the KaTeX output, %s:\n%s' % (unbalanced, ret)
+    if error is not None:
+      sys.stderr.write('BEFORE:\n' + old + '\n')
+      sys.stderr.write('AFTER:\n' + tex + '\n')
+      sys.stderr.write('ERROR:\n' + error + '\n')
+    else:
+      cache.Put(data, ret)
+      results[i][0] = ret
+    results[i][2] += seconds + time.perf_counter() - start
+  return results
+
+
+# Math fragments of the bikeshed output: the classes around "math", the
+# spans before the TeX, and the TeX.
+MATH_RE = re.compile(
+    'class="([^"]*)math([^"]*)"[^>]*>'
+    '((?:[ ]*<span[^>]*>[^<]*</span>)*)([^<]*)<')
+
+# Most fragments waiting to be written, past which the page is not scanned
+# further until the first of them is rendered.
+MAX_PENDING = 1024
+
+# Characters of the page read at a time.
+PIECE_SIZE = 1 << 20
+
+# Characters of html of the last written fragments kept for their next
+# occurrences, past which the least recently used are loaded again from the
+# cache.
+RECENT_SIZE = 1 << 24
+
+
+class Fragment(object):
+  """A distinct math fragment, rendered once for all of its occurrences.
+  done is set once ok is, along with html, its size, whether it came from
+  the cache and the seconds it took. uses counts the occurrences waiting to
+  be written; html is dropped when none is left, and taken back from the
+  recently written ones or the cache for a later occurrence."""
+
+  def __init__(self, tex, old):
+    self.tex = tex
+    self.old = old
+    self.occurrences = 0
+    self.uses = 0
+    self.html = None
+    self.ok = False
+    self.size = 0
+    self.cached = False
+    self.seconds = 0.0
+    self.done = threading.Event()
+
+
+def Percentile(values, p):
+  """The nearest-rank p-th percentile of sorted values."""
+  if not values:
+    return 0.0
+  return values[min(len(values) - 1, max(0, -(-len(values) * p // 100) - 1))]
+
+
+def Snippet(text, length=60):
+  text = ' '.join(text.split())
+  return text if len(text) <= length else text[:length - 3] + '...'
+
+
+def ReportTimings(fragments, out, slowest=20):
+  """Write a summary of the rendering of the distinct fragments: cache hit
+  rate, latency percentiles and the slowest fragments."""
+  cached = sum(1 for fragment in fragments if fragment.cached)
+  failed = sum(1 for fragment in fragments if not fragment.ok)
+  seconds = sorted(fragment.seconds for fragment in fragments)
+  out.write('%d unique fragments: %d cached (%.1f%%), %d rendered, %d failed, '
+            '%.2f s in total.\n' %
+            (len(fragments), cached, 100.0 * cached / max(len(fragments), 1),
+             len(fragments) - cached, failed, sum(seconds)))
+  out.write('Latency: p50 %.1f ms, p95 %.1f ms, p99 %.1f ms, max %.1f ms.\n' %
+            tuple(1000 * Percentile(seconds, p) for p in (50, 95, 99, 100)))
+  out.write('Slowest fragments:\n')
+  for fragment in sorted(fragments, key=lambda f: -f.seconds)[:slowest]:
+    out.write('%9.1f ms %-6s %7d B %4dx  %s\n' % (
+        1000 * fragment.seconds, 'cached' if fragment.cached else 'render',
+        fragment.size, fragment.occurrences, Snippet(fragment.old)))
+
+
+def WriteTrace(fragments, filename):
+  """Write the timing of each distinct fragment as a JSON list."""
+  with open(filename, 'w') as f:
+    json.dump([{'source': fragment.old, 'tex': fragment.tex,
+                'ok': fragment.ok, 'cached': fragment.cached,
+                'seconds': fragment.seconds,
+                'size': fragment.size,
+                'occurrences': fragment.occurrences}
+               for fragment in fragments], f, indent=1)
+
+
+PRE_RULES = Rewriter([
+    Literal('\n<p><span class="k">case', '\n   <span class="k">case'),
+    Literal('<p>', ''),
+    Literal('</p>', ''),
+])
+
+
+def CountInFile(filename, s):
+  """The number of occurrences of the ASCII string s in a file."""
+  s = s.encode('ascii')
+  count = 0
+  with open(filename, 'rb') as f:
+    if os.fstat(f.fileno()).st_size == 0:
+      return 0
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+      pos = data.find(s)
+      while pos >= 0:
+        count += 1
+        pos = data.find(s, pos + len(s))
+  return count
+
+
+def PieceEnd(text):
+  """Where to cut text so that no rewriting rule or math fragment spans the
+  cut, or 0 if there is no such place.
+
+  The page is cut before a line that opens a tag, outside of <pre> blocks:
+  the TeX of a fragment is followed by a closing tag, and no rule matches a
+  newline followed by a tag outside of <pre>.
+  """
+  # The character after the '<' tells a closing tag.
+  end = len(text) - 1
+  while True:
+    i = text.rfind('\n<', 0, end)
+    if i < 0:
+      return 0
+    cut = i + 1
+    if text.startswith('</', cut):
+      end = cut
+      continue
+    pre = text.rfind('<pre>', 0, cut)
+    if pre >= 0:
+      close = text.find('</pre>', pre)
+      if close < 0 or close + len('</pre>') > cut:
+        end = pre + 1
+        continue
+    return cut
+
+
+def ReadPieces(f, size=PIECE_SIZE):
+  """Read a page size characters at a time, and yield it in pieces cut with
+  PieceEnd."""
+  text = ''
+  while True:
+    data = f.read(size)
+    if not data:
+      break
+    text += data
+    cut = PieceEnd(text)
+    if cut:
+      yield text[:cut]
+      text = text[cut:]
+  if text:
+    yield text
+
+
 def Main():
-  fixups = []
+  # The cache can be shared between documents and builds with KATEX_CACHE.
+  cache = FragmentCache(
+      os.environ.get('KATEX_CACHE', '%s.cache.sqlite' % sys.argv[1]))
 
-  # TODO(bradnelson, tabatkins): Fix bikeshed to not muck up <pre>.
-  def StripParas(match):
-    ret = match.group(1)
-    ret = ret.replace('\n<p><span class="k">case', '\n   <span class="k">case')
-    ret = ret.replace('<p>', '')
-    ret = ret.replace('</p>', '')
-    return ret
-
-  def ExtractMath(match):
-    fixups.append(
-        (match.group(1), match.group(2), match.group(3), match.group(4),
-         match.start(), match.end()))
-    return 'x' * len(match.group())
-
-  data = open(sys.argv[1]).read()
-  cache = shelve.open('%s.%d.cache' % (sys.argv[1], CACHE_VERSION))
-  # Drop index + search links.
-  data = data.replace(
-      '<link href="genindex.html" rel="index" title="Index">', '')
-  data = data.replace(
-      '<link href="search.html" rel="search" title="Search">', '')
-  # Drop Navigation.
-  data = data.replace(
-      '<h3 class="heading settled" id="navigation">'
-      '<span class="content">Navigation</span></h3>', '')
-  data = data.replace(
-      '<li class="nav-item nav-item-0"><a href="index.html#document-index">'
-      'WebAssembly 1.0</a> »', '')
-  # Drop sphinx css.
-  data = data.replace(
-      '<link href="_static/classic.css" rel="stylesheet" type="text/css">', '')
-  # Fix sphinx css
-  data = data.replace(
-      '<link href="_static/pygments.css" rel="stylesheet" type="text/css">',
-      '<link href="pygments.css" rel="stylesheet" type="text/css">')
-  # Bad duplicate meta.
-  data = ''.join(data.rsplit(
-      '<meta content="text/html; charset=utf-8" http-equiv="Content-Type">', 1))
-  # Drop several scripts.
-  data = re.sub('<script[^>]*text/javascript[^>]*>[^<]*</script>', '', data)
-  data = data.replace(
-      '<head>\n', '<head>\n<link rel="stylesheet" href="katex/dist/katex.css">')
-  # Drop duplicate title.
-  data = data.replace(
-      '<title>WebAssembly 1.0</title>', '')
-  # valign="top"/"bottom" fails w3c validator.
-  data = data.replace(' valign="top"', '')
-  data = data.replace(' valign="bottom"', '')
-  # frame="void" fails w3c validator.
-  data = data.replace(' frame="void"', '')
-  # rules="none" fails w3c validator.
-  data = data.replace(' rules="none"', '')
-  # width="*" angers w3c validator.
-  data = re.sub(' width="[0-9]+%"', '', data)
-  # border="1" angers w3c validator.
-  data = data.replace(' border="1"', '')
-  # Get rid of gray bars.
-  data = data.replace(
-      '<blockquote>', '<blockquote style="border-color: transparent">')
-  # Strip <p> in <pre>
-  data = re.sub('(<pre>.*?</pre>)', StripParas, data, 0, re.DOTALL)
+  # Bad duplicate meta. The page is read piece by piece, the last one is
+  # told by the number of occurrences in the whole page.
+  meta = '<meta content="text/html; charset=utf-8" http-equiv="Content-Type">'
+  metas = CountInFile(sys.argv[1], meta)
+  metas_seen = 0
 
+  def DropLastMeta(match):
+    nonlocal metas_seen
+    metas_seen += 1
+    return '' if metas_seen == metas else match.group()
+  rules = [
+      # Drop index + search links.
+      Literal('<link href="genindex.html" rel="index" title="Index">', ''),
+      Literal('<link href="search.html" rel="search" title="Search">', ''),
+      # Drop Navigation.
+      Literal('<h3 class="heading settled" id="navigation">'
+              '<span class="content">Navigation</span></h3>', ''),
+      Literal('<li class="nav-item nav-item-0"><a href="index.html#document-index">'
+              'WebAssembly 1.0</a> »', ''),
+      # Drop sphinx css.
+      Literal('<link href="_static/classic.css" rel="stylesheet" type="text/css">', ''),
+      # Fix sphinx css
+      Literal('<link href="_static/pygments.css" rel="stylesheet" type="text/css">',
+              '<link href="pygments.css" rel="stylesheet" type="text/css">'),
+      Literal(meta, DropLastMeta),
+      # Drop several scripts.
+      Regex('<script[^>]*text/javascript[^>]*>[^<]*</script>', ''),
+      Literal('<head>\n', '<head>\n<link rel="stylesheet" href="katex/dist/katex.css">'),
+      # Drop duplicate title.
+      Literal('<title>WebAssembly 1.0</title>', ''),
+      # valign="top"/"bottom" fails w3c validator.
+      Literal(' valign="top"', ''),
+      Literal(' valign="bottom"', ''),
+      # frame="void" fails w3c validator.
+      Literal(' frame="void"', ''),
+      # rules="none" fails w3c validator.
+      Literal(' rules="none"', ''),
+      # width="*" angers w3c validator.
+      Regex(' width="[0-9]+%"', ''),
+      # border="1" angers w3c validator.
+      Literal(' border="1"', ''),
+      # Get rid of gray bars.
+      Literal('<blockquote>', '<blockquote style="border-color: transparent">'),
+  ]
   # Work around W3C forcing links to have underline for math fragments.
-  data = data.replace('<style>',
-"""<style>/* mathjax2katex fixes */
+  fix_style = Literal('<style>', """<style>/* mathjax2katex fixes */
 .katex-display a[href] {
   border-bottom: 0;
 }
 </style>
-<style>""" , 1)
+<style>""", count=1)
+  # Inside <pre>, the rules above apply before stripping its <p>, and the
+  # style fix after, with the counts of the page.
+  in_pre = Rewriter(rules)
+  pre_style = Rewriter([fix_style])
+
+  # TODO(bradnelson, tabatkins): Fix bikeshed to not muck up <pre>.
+  def StripParas(match):
+    text = PRE_RULES.Rewrite(in_pre.Rewrite(match.group(1), page_counts))
+    return pre_style.Rewrite(text, page_counts)
+
+  page = Rewriter(rules + [
+      # Strip <p> in <pre>
+      Regex('(<pre>.*?</pre>)', StripParas, re.DOTALL),
+      fix_style,
+  ])
+  page_counts = page.NewCounts()
 
-  # Pull out math fragments.
-  data = re.sub(
-      'class="([^"]*)math([^"]*)"[^>]*>'
-      '((?:[ ]*<span[^>]*>[^<]*</span>)*)([^<]*)<',
-      ExtractMath, data)
+  # The page is written to a temporary file, so that a failed run leaves no
+  # partial page: it replaces the output file given as second argument, or
+  # is copied to stdout, once all the fragments are rendered.
+  output = sys.argv[2] if len(sys.argv) > 2 else None
+  if output:
+    temp = output + '.tmp'
+  else:
+    fd, temp = tempfile.mkstemp(suffix='.html')
+    os.close(fd)
+  out = open(temp, 'w')
 
-  sys.stderr.write('Processing %d fragments.\n' % len(fixups))
+  def RemoveTemp():
+    # Also when the run is interrupted or fails; it is gone after success.
+    if os.path.exists(temp):
+      os.remove(temp)
+  atexit.register(RemoveTemp)
+  signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
 
-  done_fixups = []
+  # Render the math fragments as they are found, each distinct one once for
+  # all of its occurrences, and write the page as they complete. pending
+  # holds (text before the fragment, start of the fragment, fragment), or
+  # (text, None, None) for the end of a piece.
+  fragments = {}
+  sources = {}
+  recent = collections.OrderedDict()
+  recent_size = 0
+  pending = collections.deque()
+  batch = []
+  count = 0
   success = True
 
+  # KATEX_BATCH=n renders n fragments per katex process instead of using
+  # a server per thread.
+  batch_size = int(os.environ.get('KATEX_BATCH', '0'))
+  render = RenderKatexBatch if batch_size > 0 else RenderKatex
+  step = max(batch_size, 1)
+
   def Worker():
-    nonlocal success
     while True:
-      cls_before, cls_after, spans, mth, start, end = q.get()
+      batch = q.get()
       try:
-        fixed = ('class="' + cls_before + ' ' + cls_after + '">' +
-                 spans + ReplaceMath(cache, mth) + '<')
-        done_fixups.append((start, end, fixed))
+        maths = ReplaceMath(
+            cache, [(fragment.tex, fragment.old) for fragment in batch], render)
+        for fragment, (math, cached, seconds) in zip(batch, maths):
+          fragment.html = math
+          fragment.ok = math is not None
+          fragment.size = len(math or '')
+          fragment.cached = cached
+          fragment.seconds = seconds
       except Exception:
-        success = False
+        # The fragments of the batch are left without html, and fail.
+        sys.stderr.write('ERROR:\n' + traceback.format_exc())
+      for fragment in batch:
+        fragment.done.set()
+      sys.stderr.write('.' * len(batch))
 
-      q.task_done()
-      sys.stderr.write('.')
+  def Write(limit):
+    """Write the page up to the first fragment not rendered yet, waiting
+    for the first ones while more than limit are pending."""
+    nonlocal success, recent_size, batch
+    while pending:
+      text, start, fragment = pending[0]
+      if fragment is not None and not fragment.done.is_set():
+        if len(pending) <= limit:
+          return
+        # A partial batch is sent before waiting, it may hold the fragment.
+        if batch:
+          q.put(batch)
+          batch = []
+        fragment.done.wait()
+      pending.popleft()
+      if fragment is None:
+        if success:
+          out.write(text)
+        continue
+      if fragment.html is None:
+        success = False
+      # Nothing more is written after a failure, but the remaining
+      # fragments are still rendered to report all the errors.
+      if success:
+        out.write(text)
+        out.write(start + fragment.html + '<')
+      fragment.uses -= 1
+      if fragment.uses == 0 and fragment.ok:
+        recent[fragment.tex] = fragment.html
+        recent_size += fragment.size
+        fragment.html = None
+        while recent_size > RECENT_SIZE:
+          recent_size -= len(recent.popitem(last=False)[1])
 
   q = queue.Queue()
   for i in range(len(os.sched_getaffinity(0))):
@@ -234,26 +488,77 @@ def Main():
     t.daemon = True
     t.start()
 
-  for item in fixups:
-    q.put(item)
-  q.join()
+  with open(sys.argv[1]) as f:
+    for piece in ReadPieces(f):
+      data = page.Rewrite(piece, page_counts)
+      last = 0
+      for match in MATH_RE.finditer(data):
+        count += 1
+        # Most fragments repeat as is, normalizing is only needed once for
+        # them.
+        fragment = sources.get(match.group(4))
+        if fragment is None:
+          tex = NormalizeMath(match.group(4))
+          fragment = fragments.get(tex)
+          if fragment is None:
+            fragment = fragments[tex] = Fragment(tex, match.group(4))
+            batch.append(fragment)
+          sources[match.group(4)] = fragment
+        if fragment.uses == 0 and fragment.ok:
+          # All the earlier occurrences are written and the html dropped.
+          fragment.html = recent.pop(fragment.tex, None)
+          if fragment.html is None:
+            fragment.html = ReplaceMath(
+                cache, [(fragment.tex, fragment.old)], render)[0][0]
+          else:
+            recent_size -= fragment.size
+        fragment.occurrences += 1
+        fragment.uses += 1
+        pending.append((data[last:match.start()],
+                        'class="' + match.group(1) + ' ' + match.group(2) +
+                        '">' + match.group(3), fragment))
+        last = match.end()
+        if len(batch) >= step:
+          q.put(batch)
+          batch = []
+        Write(MAX_PENDING)
+      pending.append((data[last:], None, None))
+      Write(MAX_PENDING)
+  Write(0)
+
+  CloseServers()
+
+  sys.stderr.write('\nProcessed %d fragments, %d unique (%.1f%% deduplicated).\n' %
+                   (count, len(fragments),
+                    100.0 * (count - len(fragments)) / max(count, 1)))
+  ReportTimings(list(fragments.values()), sys.stderr)
+  # KATEX_TRACE=file writes the timing of each fragment as JSON.
+  if os.environ.get('KATEX_TRACE'):
+    WriteTrace(list(fragments.values()), os.environ['KATEX_TRACE'])
 
   if not success:
       sys.stderr.write('\n!!! Error processing fragments\n')
-      cache.close()
+      out.close()
+      cache.Close()
       sys.exit(1)
 
-  result = []
-  last = 0
-  for start, end, value in sorted(done_fixups):
-    result.append(data[last:start])
-    result.append(value)
-    last = end
-  result.append(data[last:])
-
-  sys.stderr.write('\nProcessing Done.\n')
-  sys.stdout.write(''.join(result))
-  cache.close()
+  out.close()
+  if output:
+    os.replace(temp, output)
+  else:
+    with open(temp) as f:
+      shutil.copyfileobj(f, sys.stdout)
+    os.remove(temp)
+  sys.stderr.write('Processing Done.\n')
+  cache.Close()
+
+  # FIXUP_STATS=1 reports how often each rewriting rule applied.
+  if os.environ.get('FIXUP_STATS'):
+    page.Report(sys.stderr, 'Page')
+    in_pre.Report(sys.stderr, 'Pre')
+    pre_style.Report(sys.stderr, 'Pre style')
+    PRE_RULES.Report(sys.stderr, 'Pre paragraphs')
+    MATH_RULES.Report(sys.stderr, 'Math')
 
 
 Main()
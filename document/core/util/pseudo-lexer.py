@@ -30,3 +30,7 @@ class PseudoLexer(RegexLexer):
 
 def setup(app):
   lexers['pseudo'] = PseudoLexer()
+  return {
+    'parallel_read_safe': True,
+    'parallel_write_safe': True,
+  }
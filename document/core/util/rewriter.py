@@ -0,0 +1,134 @@
+# Single scan text rewriting for the HTML post-processing scripts.
+
+import collections
+import re
+
+
+class Rule(object):
+  """A literal or regex pattern and its replacement, a string used as is or
+  a function of the match object of the pattern."""
+
+  def __init__(self, pattern, replacement, regex=False, flags=0, count=None,
+               name=None):
+    self.literal = None if regex else pattern
+    self.regex = re.compile(pattern if regex else re.escape(pattern), flags)
+    self.replacement = replacement
+    self.count = count
+    self.name = name or pattern
+
+
+def Literal(pattern, replacement, **kwargs):
+  return Rule(pattern, replacement, **kwargs)
+
+
+def Regex(pattern, replacement, flags=0, **kwargs):
+  return Rule(pattern, replacement, regex=True, flags=flags, **kwargs)
+
+
+class Rewriter(object):
+  """Applies a table of rules to a text in a single scan, instead of one
+  str.replace or re.sub pass per rule that copies the whole text each time.
+
+  Each rule keeps the position of its next match, found with str.find or a
+  regex search, and the earliest one is applied; at the same position the
+  first rule of the table wins. A table gives the same result as applying
+  its rules one after the other as long as no rule creates or breaks a
+  match of a later one. A rule with a count only replaces its first count
+  matches in each rewritten text, or in all the texts rewritten with the
+  same counts, by any table holding the rule. As with re.sub, a rule that
+  matches the empty string is searched again one character further. hits
+  counts the replacements of each rule over all texts, for diagnostics.
+  """
+
+  def __init__(self, rules):
+    self.rules = rules
+    self.hits = [0] * len(rules)
+
+  def NewCounts(self):
+    # Keyed by rule, so that tables sharing a rule can share the counts.
+    return collections.Counter()
+
+  def Rewrite(self, text, counts=None):
+    # Next match of each rule at or after pos, as (start, rule index, match).
+    # Rules that cannot match are dropped up front, which matters for the
+    # many short texts of a page, e.g. math fragments.
+    matches = []
+    for i, rule in enumerate(self.rules):
+      if rule.literal is None or rule.literal in text:
+        found = self.Find(text, i, 0)
+        if found is not None:
+          matches.append(found)
+    if not matches:
+      return text
+    if counts is None:
+      counts = self.NewCounts()
+    out = []
+    pos = 0
+    while matches:
+      first = min(matches)
+      start, i, match = first
+      out.append(text[pos:start])
+      out.append(self.Replace(i, match, counts))
+      pos = match.end()
+      if pos == start:
+        # The rule would match the empty string at pos again.
+        matches.remove(first)
+        if pos < len(text):
+          found = self.Find(text, i, pos + 1)
+          if found is not None:
+            matches.append(found)
+      if any(found[0] < pos for found in matches):
+        matches = [found if found[0] >= pos else self.Find(text, found[1], pos)
+                   for found in matches]
+        matches = [found for found in matches if found is not None]
+    out.append(text[pos:])
+    return ''.join(out)
+
+  def Find(self, text, i, pos):
+    rule = self.rules[i]
+    if rule.literal is not None:
+      # str.find is much faster than a regex search for a literal.
+      start = text.find(rule.literal, pos)
+      if start < 0:
+        return None
+      return (start, i, LiteralMatch(text, start, rule.literal))
+    match = rule.regex.search(text, pos)
+    if match is None:
+      return None
+    return (match.start(), i, match)
+
+  def Replace(self, i, match, counts):
+    rule = self.rules[i]
+    if rule.count is not None and counts[rule] >= rule.count:
+      return match.group()
+    counts[rule] += 1
+    self.hits[i] += 1
+    if callable(rule.replacement):
+      return rule.replacement(match)
+    return rule.replacement
+
+  def Report(self, out, title):
+    out.write('%s rule hits:\n' % title)
+    for rule, hits in zip(self.rules, self.hits):
+      name = rule.name.replace('\n', '\\n')
+      out.write('%8d  %s\n' % (hits, name if len(name) <= 70 else name[:67] + '...'))
+
+
+class LiteralMatch(object):
+  """The parts of a match object the replacement functions use, for a
+  literal found with str.find."""
+
+  def __init__(self, string, start, literal):
+    self.string = string
+    self.pos = start
+    self.literal = literal
+
+  def start(self):
+    return self.pos
+
+  def end(self):
+    return self.pos + len(self.literal)
+
+  def group(self, index=0):
+    assert index == 0
+    return self.literal
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark the SIMD test generators.
+
+Every submodule of gen_tests.py generates its cases in memory, the output is
+counted and dropped instead of being written, so the tree is never touched.
+Reports cases/sec, bytes/sec and peak allocations for each submodule and
+compares them against a stored baseline.
+"""
+
+import sys
+import json
+import time
+import argparse
+import importlib
+import tracemalloc
+
+from simd import SIMD
+from simd_output import redirect_output
+from gen_tests import SUBMODULES
+
+
+class CountingSink:
+    """Output sink that only keeps the number of cases and bytes."""
+
+    def __init__(self):
+        self.cases = 0
+        self.bytes = 0
+
+    def __call__(self, wast_filename, text):
+        self.cases += text.count('(assert_')
+        self.bytes += len(text.encode())
+
+
+def run_once(mod):
+    sink = CountingSink()
+    # Start each repetition from a cold constant cache.
+    SIMD._v128_const.cache_clear()
+    with redirect_output(sink):
+        start = time.perf_counter()
+        mod.gen_test_cases()
+        seconds = time.perf_counter() - start
+    return seconds, sink
+
+
+def peak_memory(mod):
+    SIMD._v128_const.cache_clear()
+    tracemalloc.start()
+    try:
+        with redirect_output(CountingSink()):
+            mod.gen_test_cases()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_module(mod_name, repeat):
+    mod = importlib.import_module(mod_name)
+    runs = [run_once(mod) for _ in range(repeat)]
+    seconds = min(run[0] for run in runs)
+    sink = runs[0][1]
+    return {
+        'seconds': seconds,
+        'cases_per_sec': sink.cases / seconds,
+        'bytes_per_sec': sink.bytes / seconds,
+        'peak_bytes': peak_memory(mod),
+    }
+
+
+def regressions(result, baseline, threshold):
+    """Metrics of result that are worse than baseline by more than threshold
+    percent, as a list of (metric, baseline value, value)."""
+    worse = []
+    for metric, higher_is_better in (('cases_per_sec', True),
+                                     ('bytes_per_sec', True),
+                                     ('peak_bytes', False)):
+        old, new = baseline.get(metric), result[metric]
+        if not old:
+            continue
+        change = (old - new if higher_is_better else new - old) * 100.0 / old
+        if change > threshold:
+            worse.append((metric, old, new))
+    return worse
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the back-end scripts that generate SIMD tests')
+    parser.add_argument('-i', '--inst', dest='inst_group', choices=SUBMODULES,
+                        help='Only benchmark this back-end script')
+    parser.add_argument('-n', '--repeat', dest='repeat', type=int, default=5,
+                        help='Repetitions per module, the best one is reported, '
+                             'defaults to 5')
+    parser.add_argument('-b', '--baseline', dest='baseline', metavar='FILE',
+                        help='Baseline JSON file to compare the results with')
+    parser.add_argument('--save-baseline', dest='save_baseline', action='store_true',
+                        default=False,
+                        help='Store the results in the baseline file instead of '
+                             'comparing with it')
+    parser.add_argument('-t', '--threshold', dest='threshold', type=float, default=10.0,
+                        help='Regression threshold in percent, defaults to 10')
+    args = parser.parse_args()
+
+    mod_names = [args.inst_group] if args.inst_group else SUBMODULES
+    baseline = {}
+    if args.baseline and not args.save_baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+
+    results = {}
+    failed = False
+    print('{:<28} {:>10} {:>12} {:>12} {:>12}'.format(
+        'module', 'seconds', 'cases/s', 'bytes/s', 'peak bytes'))
+    for mod_name in mod_names:
+        result = bench_module(mod_name, args.repeat)
+        results[mod_name] = result
+        print('{:<28} {:>10.4f} {:>12.0f} {:>12.0f} {:>12}'.format(
+            mod_name, result['seconds'], result['cases_per_sec'],
+            result['bytes_per_sec'], result['peak_bytes']))
+        for metric, old, new in regressions(result, baseline.get(mod_name, {}),
+                                            args.threshold):
+            failed = True
+            print('  REGRESSION {}: {:.0f} -> {:.0f}'.format(metric, old, new))
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, 'w') as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+            fp.write('\n')
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
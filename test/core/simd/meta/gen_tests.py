@@ -4,9 +4,23 @@
 This script is used for generating WebAssembly SIMD test cases.
 It requires Python 3.6+.
 """
+import os
 import sys
+import difflib
+import hashlib
+import pstats
+import cProfile
 import argparse
 import importlib
+import tracemalloc
+from functools import partial
+from multiprocessing import Pool
+
+import simd_random
+from simd_lane_pack import pack_file
+from simd_dedup import AssertionDedup
+from simd_ir import ScriptRenderer, RENDERERS
+from simd_output import redirect_output, redirect_output_dir, record_written, write_file
 
 
 SUBMODULES = (
@@ -42,13 +56,123 @@ SUBMODULES = (
 )
 
 
-def gen_group_tests(mod_name):
+def gen_group_tests(mod_name, exhaustive=False):
     """mod_name is the back-end script name without the.py extension.
-    There must be a gen_test_cases() function in each module."""
+    There must be a gen_test_cases() function in each module.
+    With exhaustive, the module's gen_exhaustive_test_cases() is called
+    instead; modules without one are skipped."""
     mod = importlib.import_module(mod_name)
+    if exhaustive:
+        if hasattr(mod, 'gen_exhaustive_test_cases'):
+            mod.gen_exhaustive_test_cases()
+        return
     mod.gen_test_cases()
 
 
+def gen_rewritten_group_tests(mod_name, rewrites):
+    """Generate the tests of mod_name, then apply each rewrite, a function
+    taking a .wast filename, to every .wast file it wrote."""
+    written = []
+    with record_written(written):
+        gen_group_tests(mod_name)
+    for wast_filename in sorted(set(written)):
+        if wast_filename.endswith('.wast'):
+            for rewrite in rewrites:
+                rewrite(wast_filename)
+
+
+def gen_group_tests_in_memory(mod_name, out_dir=None):
+    """Generate the tests of mod_name without writing them, as a dict of
+    .wast filename to text."""
+    files = {}
+    with redirect_output_dir(out_dir), redirect_output(files.__setitem__):
+        gen_group_tests(mod_name)
+    return files
+
+
+def check_file(wast_filename, text, context_lines=40):
+    """Compare generated text with the file on disk. Returns None if they
+    match, else an excerpt of their unified diff."""
+    generated = text.encode()
+    try:
+        with open(wast_filename, 'rb') as fp:
+            existing = fp.read()
+    except FileNotFoundError:
+        return 'missing file {}\n'.format(wast_filename)
+    if hashlib.sha1(existing).digest() == hashlib.sha1(generated).digest():
+        return None
+
+    diff = difflib.unified_diff(existing.decode().splitlines(True),
+                                text.splitlines(True),
+                                wast_filename, '(generated)')
+    excerpt = []
+    for line in diff:
+        if len(excerpt) == context_lines:
+            excerpt.append('...\n')
+            break
+        excerpt.append(line if line.endswith('\n') else line + '\n\\ No newline at end of file\n')
+    return ''.join(excerpt)
+
+
+def check_group_tests(mod_names, jobs=None, out_dir=None):
+    """Check that the .wast files match their generators, generating them
+    in parallel. Nothing is written. Returns the number of mismatching
+    files."""
+    with Pool(jobs) as pool:
+        results = pool.map(partial(gen_group_tests_in_memory, out_dir=out_dir), mod_names)
+    mismatches = 0
+    for files in results:
+        for wast_filename, text in sorted(files.items()):
+            excerpt = check_file(wast_filename, text)
+            if excerpt is not None:
+                mismatches += 1
+                print('MISMATCH {}'.format(wast_filename))
+                print(excerpt, end='')
+    return mismatches
+
+
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profile')
+PROFILE_TOP = 20
+
+
+def profile_group_tests(mod_name, kind, gen=gen_group_tests):
+    """Run gen(mod_name) under cProfile (kind 'cpu') or tracemalloc
+    (kind 'mem'), dump the profile to PROFILE_DIR/<mod_name>.prof or
+    .snapshot and print the top hot functions or allocation sites. The
+    snapshot only holds the allocations still alive after gen returns, so
+    the peak of the traced memory is printed too."""
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    # Keep the import of the module out of the profile.
+    importlib.import_module(mod_name)
+    print('Profiling {} ({}):'.format(mod_name, kind))
+    if kind == 'cpu':
+        profiler = cProfile.Profile()
+        profiler.runcall(gen, mod_name)
+        prof_filename = os.path.join(PROFILE_DIR, mod_name + '.prof')
+        profiler.dump_stats(prof_filename)
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(PROFILE_TOP)
+    else:
+        tracemalloc.start()
+        try:
+            gen(mod_name)
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        print('    Traced memory: {:.1f} KiB at peak, {:.1f} KiB retained'.format(
+            peak / 1024, current / 1024))
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, importlib.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ))
+        prof_filename = os.path.join(PROFILE_DIR, mod_name + '.snapshot')
+        snapshot.dump(prof_filename)
+        for stat in snapshot.statistics('lineno')[:PROFILE_TOP]:
+            print('   ', stat)
+    print('Profile written to {}'.format(prof_filename))
+
+
 def main():
     """
     Default program entry
@@ -60,16 +184,99 @@ def main():
                         default=False, help='Generate all the tests')
     parser.add_argument('-i', '--inst', dest='inst_group', choices=SUBMODULES,
                         help='Back-end scripts that generate the SIMD tests')
+    parser.add_argument('-e', '--exhaustive', dest='exhaustive', action='store_true',
+                        default=False,
+                        help='Sweep the full operand space of narrow-lane ops, '
+                             'written as sharded files to ../exhaustive')
+    parser.add_argument('-p', '--pack', dest='pack', action='store_true',
+                        default=False,
+                        help='Pack independent splat assertions of lane-wise ops '
+                             'into the lanes of a single assertion')
+    parser.add_argument('-b', '--binary', dest='binary', action='store_true',
+                        default=False,
+                        help='Emit the test modules in the binary format, '
+                             'as (module binary ...), same as --format binary')
+    parser.add_argument('-f', '--format', dest='formats', action='append',
+                        choices=RENDERERS,
+                        help='Render the generated scripts in this format, can be '
+                             'given more than once. json goes to json/ next to the '
+                             '.wast files, defaults to wast')
+    parser.add_argument('-o', '--out-dir', dest='out_dir',
+                        help='Directory the tests are generated in, defaults to '
+                             'the parent of this directory')
+    parser.add_argument('-c', '--check', dest='check', action='store_true',
+                        default=False,
+                        help='Check that the .wast files match the generators, '
+                             'without writing anything')
+    parser.add_argument('-j', '--jobs', dest='jobs', type=int,
+                        help='Number of processes for --check, defaults to the '
+                             'number of CPUs')
+    parser.add_argument('-d', '--dedup', dest='dedup', action='store_true',
+                        default=False,
+                        help='Drop assert_return commands repeating an earlier one '
+                             'against the same module, in any generated file')
+    parser.add_argument('--dedup-stats', dest='dedup_stats', action='store_true',
+                        default=False,
+                        help='Report duplicate assert_return commands per file')
+    parser.add_argument('-r', '--random', dest='random_count', type=int, metavar='N',
+                        help='Generate N random cases per instruction for each '
+                             'instruction family, written to random/ in the output '
+                             'directory')
+    parser.add_argument('-s', '--seed', dest='seed', type=int, default=0,
+                        help='Seed of the random cases, defaults to 0')
+    parser.add_argument('--profile', dest='profile', nargs='?', const='cpu',
+                        choices=('cpu', 'mem'),
+                        help='Profile each back-end script with cProfile (cpu, '
+                             'the default) or tracemalloc (mem), dump the profiles '
+                             'to {}/ and print the top {} entries'.format(
+                                 PROFILE_DIR, PROFILE_TOP))
     args = parser.parse_args()
 
     if len(sys.argv) < 2:
         parser.print_help()
 
+    mod_names = []
     if args.inst_group:
-        gen_group_tests(args.inst_group)
+        mod_names.append(args.inst_group)
     if args.gen_all:
-        for mod_name in SUBMODULES:
-            gen_group_tests(mod_name)
+        mod_names.extend(SUBMODULES)
+
+    if args.check:
+        mismatches = check_group_tests(mod_names, args.jobs, args.out_dir)
+        print('{} of the generated files differ.'.format(mismatches))
+        sys.exit(1 if mismatches else 0)
+
+    rewrites = []
+    if args.pack:
+        rewrites.append(pack_file)
+
+    # Chain the output sinks, each one hands its output to the next.
+    sink = write_file
+    formats = set(args.formats or ['wast'])
+    if args.binary:
+        formats.add('binary')
+    if formats != {'wast'}:
+        sink = ScriptRenderer(formats, sink)
+    dedup = AssertionDedup(drop=args.dedup, write=sink)
+    if args.dedup or args.dedup_stats:
+        sink = dedup
+
+    with redirect_output_dir(args.out_dir), \
+            redirect_output(None if sink is write_file else sink):
+        for mod_name in mod_names:
+            if rewrites and not args.exhaustive:
+                gen = partial(gen_rewritten_group_tests, rewrites=rewrites)
+            else:
+                gen = partial(gen_group_tests, exhaustive=args.exhaustive)
+            if args.profile:
+                profile_group_tests(mod_name, args.profile, gen)
+            else:
+                gen(mod_name)
+        if args.random_count:
+            simd_random.gen_random_test_cases(args.random_count, args.seed)
+
+    if args.dedup or args.dedup_stats:
+        print(dedup.report())
 
 
 if __name__ == '__main__':
@@ -5,6 +5,15 @@ This python file is a tool class for SIMD and
 currently only supports generating v128 const constant data.
 """
 
+from functools import lru_cache
+
+
+# Number of lanes of each v128 lane type
+LANE_COUNT = {
+    'i8x16': 16, 'i16x8': 8, 'i32x4': 4, 'i64x2': 2,
+    'f32x4': 4, 'f64x2': 2,
+}
+
 
 class SIMD:
 
@@ -31,11 +40,29 @@ class SIMD:
         Params:
             value: constant data, string or list,
             lane_type: lane type, [e.g. i8x16, i16x8, i32x4, f32x4]
+
+        The generators call this with heavily repeated arguments, so the
+        text is memoized on the value and the lane type, for string values.
         """
-        if lane_type.lower().find('x') == -1:
-            return SIMD.const(value, lane_type)
+        if isinstance(value, str):
+            return SIMD._v128_const(value, lane_type, False)
+        if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            return SIMD._v128_const(tuple(value), lane_type, True)
+        # Other values are not cached: equal ones of another type, e.g. 0.0
+        # and -0.0 or 1 and 1.0, would share a cache entry.
+        return SIMD._v128_const.__wrapped__(value, lane_type, False)
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _v128_const(value, lane_type, is_list):
+        if is_list:
+            value = list(value)
 
-        lane_cnt = int(lane_type[1:].split('x')[1])
+        lane_cnt = LANE_COUNT.get(lane_type)
+        if lane_cnt is None:
+            if lane_type.lower().find('x') == -1:
+                return SIMD.const(value, lane_type)
+            lane_cnt = int(lane_type[1:].split('x')[1])
 
         # value is a string type, generating constant data
         # of value according to the number of lanes
@@ -48,7 +75,7 @@ class SIMD:
 
             # If it is an empty list, generate all constant data with 0x00
             if len(value) == 0:
-                return SIMD.v128_const('0x00', lane_type)
+                return SIMD._v128_const('0x00', lane_type, False)
 
             data_elem = []
 
@@ -82,3 +109,26 @@ class SIMD:
 
         # Returns v128 constant text
         return SIMD.V128_CONST.format(lane_type=lane_type, value=data_elem)
+
+
+if __name__ == '__main__':
+    # Per-call cost of v128_const with and without the cache, on a mix of
+    # repeated splat and list arguments like the generators use.
+    import timeit
+
+    args = [(str(v), 'i8x16') for v in range(-4, 4)] + \
+           [([str(v), str(-v)], 'i16x8') for v in range(4)] + \
+           [(['0x1p-149', '-0x0p+0', 'inf', 'nan'], 'f32x4'), ('0x1.fffffep+127', 'f32x4')]
+
+    def cached():
+        for value, lane_type in args:
+            SIMD.v128_const(value, lane_type)
+
+    def uncached():
+        for value, lane_type in args:
+            SIMD._v128_const.__wrapped__(value, lane_type, isinstance(value, list))
+
+    number = 20000
+    for name, func in (('uncached', uncached), ('cached', cached)):
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        print('{:>8}: {:.3f} us/call'.format(name, seconds / number / len(args) * 1e6))
@@ -8,12 +8,34 @@ operation cases. It provides a skeleton to generate the normal, invalid and
 combined cases. Subclasses only provide the test data sets. In some special
 cases, you may need to override the methods in base class to fulfill your
 case generation.
+
+Subclasses operating on narrow lanes can also generate an exhaustive sweep of
+the whole operand space, see gen_exhaustive_test_cases.
 """
 
+import os
+from itertools import product
+
 from simd import SIMD
 from test_assert import AssertReturn, AssertInvalid
 from simd_lane_value import LaneValue
 from simd_integer_op import ArithmeticOp
+from simd_op_table import OpTable
+from simd_output import write_wast
+
+
+def memoized_property(method):
+    """A read-only property computed once per instance, like
+    functools.cached_property, which needs Python 3.8."""
+    name = '_memo_' + method.__name__
+
+    def get(self):
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            value = self.__dict__[name] = method(self)
+            return value
+    return property(get, doc=method.__doc__)
 
 
 i8 = LaneValue(8)
@@ -31,6 +53,19 @@ class SimdArithmeticCase:
     TEST_FUNC_TEMPLATE_HEADER = (
             ';; Tests for {} arithmetic operations on major boundary values and all special values.\n\n')
 
+    # Exhaustive mode: binary ops are swept for lanes up to EXHAUSTIVE_BINARY_WIDTH
+    # bits and unary ops for lanes up to EXHAUSTIVE_UNARY_WIDTH bits. Independent
+    # cases are packed one per lane, and the packed assertions are split into
+    # shards of EXHAUSTIVE_SHARD_SIZE assertions each.
+    EXHAUSTIVE_DIR = 'exhaustive'
+    EXHAUSTIVE_FILENAME = 'simd_{lane_type}_arith_exhaustive_{shard:02d}.wast'
+    EXHAUSTIVE_BINARY_WIDTH = 8
+    EXHAUSTIVE_UNARY_WIDTH = 16
+    EXHAUSTIVE_SHARD_SIZE = 1024
+    EXHAUSTIVE_TEMPLATE_HEADER = (
+            ';; Exhaustive tests for {} arithmetic operations, shard {} of {}.\n'
+            ';; Generated by gen_tests.py --exhaustive, each lane is an independent case.\n\n')
+
     def op_name(self, op):
         """ Full instruction name.
         Subclasses can overwrite to provide custom instruction names that don't
@@ -58,12 +93,14 @@ class SimdArithmeticCase:
         else:
             return self.lane
 
-    @property
+    # The test data below is built once per instance, get_case_data and the
+    # subclasses read it repeatedly.
+    @memoized_property
     def normal_unary_op_test_data(self):
         lane = self.src_lane
         return [0, 1, -1, lane.max - 1, lane.min + 1, lane.min, lane.max, lane.mask]
 
-    @property
+    @memoized_property
     def normal_binary_op_test_data(self):
         lane = self.src_lane
         return [
@@ -95,14 +132,14 @@ class SimdArithmeticCase:
             (lane.mask, lane.mask)
         ]
 
-    @property
+    @memoized_property
     def bin_test_data(self):
         return [
             (self.normal_binary_op_test_data, [self.LANE_TYPE] * 3),
             (self.hex_binary_op_test_data, [self.LANE_TYPE] * 3)
         ]
 
-    @property
+    @memoized_property
     def unary_test_data(self):
         return [
             (self.normal_unary_op_test_data, [self.LANE_TYPE] * 2),
@@ -323,6 +360,69 @@ class SimdArithmeticCase:
         return self.gen_test_template().format(**case_data)
 
     def gen_test_cases(self):
-        wast_filename = '../simd_{lane_type}_arith.wast'.format(lane_type=self.LANE_TYPE)
-        with open(wast_filename, 'w') as fp:
-            fp.write(self.get_all_cases())
+        wast_filename = 'simd_{lane_type}_arith.wast'.format(lane_type=self.LANE_TYPE)
+        write_wast(wast_filename, self.get_all_cases())
+
+    def get_exhaustive_case_data(self):
+        """Packed cases covering every operand of the narrow-lane ops.
+
+        Each case is [op_name, [param, ...], result] where every element is a
+        list of LANE_LEN lane values, so one assertion checks LANE_LEN
+        independent operand combinations.
+        """
+        case_data = []
+        lane = self.src_lane
+        values = range(lane.min, lane.max + 1)
+
+        def packed(op_name, operands, compute):
+            for i in range(0, len(operands), self.LANE_LEN):
+                chunk = operands[i:i + self.LANE_LEN]
+                params = [[str(v[j]) for v in chunk] for j in range(len(chunk[0]))]
+                result = [str(compute(*v)) for v in chunk]
+                case_data.append([op_name, params, result])
+
+        # The expected results are looked up in precomputed tables.
+        if lane.lane_width <= self.EXHAUSTIVE_BINARY_WIDTH:
+            operands = list(product(values, repeat=2))
+            for op in self.BINARY_OPS:
+                table = OpTable.get(op, 2, self.src_lane, self.dst_lane)
+                packed(self.op_name(op), operands, lambda a, b: table[a, b])
+
+        if lane.lane_width <= self.EXHAUSTIVE_UNARY_WIDTH:
+            operands = [(v,) for v in values]
+            for op in self.UNARY_OPS:
+                table = OpTable.get(op, 1, self.src_lane, self.dst_lane)
+                packed(self.op_name(op), operands, lambda a: table[a])
+
+        return case_data
+
+    def get_exhaustive_shards(self):
+        """Split the packed exhaustive cases into self-contained wast texts."""
+        case_data = self.get_exhaustive_case_data()
+        shard_cnt = -(-len(case_data) // self.EXHAUSTIVE_SHARD_SIZE)
+        shards = []
+
+        for shard in range(shard_cnt):
+            template = self.gen_test_func_template()
+            template[0] = self.EXHAUSTIVE_TEMPLATE_HEADER.format(
+                    self.LANE_TYPE, shard + 1, shard_cnt)
+            cases = []
+            current_op = None
+            start = shard * self.EXHAUSTIVE_SHARD_SIZE
+            for op_name, params, ret in case_data[start:start + self.EXHAUSTIVE_SHARD_SIZE]:
+                if op_name != current_op:
+                    cases.append('\n;; {}'.format(op_name))
+                    current_op = op_name
+                v128_params = [SIMD.v128_const(p, self.LANE_TYPE) for p in params]
+                v128_result = SIMD.v128_const(ret, self.LANE_TYPE)
+                cases.append(str(AssertReturn(op_name, v128_params, v128_result)))
+            template.append('\n'.join(cases))
+            shards.append('\n'.join(template) + '\n')
+
+        return shards
+
+    def gen_exhaustive_test_cases(self):
+        for shard, text in enumerate(self.get_exhaustive_shards()):
+            wast_filename = os.path.join(self.EXHAUSTIVE_DIR, self.EXHAUSTIVE_FILENAME.format(
+                    lane_type=self.LANE_TYPE, shard=shard))
+            write_wast(wast_filename, text)
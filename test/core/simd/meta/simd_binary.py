@@ -0,0 +1,600 @@
+#!/usr/bin/env python3
+
+"""
+Encode the generated test modules in the binary format.
+
+Consumers of the generated .wast files parse every module from text. This
+script replaces each top-level module with an equivalent
+(module binary ...) form, using a small encoder for the subset of the text
+format the generators use: memories, active data segments, globals and
+functions with params, locals and exports, whose bodies are made of blocks,
+variable, memory, numeric constant and SIMD instructions, folded or plain.
+Modules using anything else are left as text.
+"""
+
+import re
+import sys
+from fractions import Fraction
+
+from simd_lane_pack import split_forms
+from simd_output import write_file
+
+
+class EncodeError(Exception):
+    """Raised for text outside of the subset the encoder supports, the
+    module is then left as text."""
+
+
+VAL_TYPES = {'i32': 0x7f, 'i64': 0x7e, 'f32': 0x7d, 'f64': 0x7c, 'v128': 0x7b}
+
+# Opcodes of the non-SIMD instructions.
+OPCODES = {
+    'nop': 0x01, 'block': 0x02, 'end': 0x0b, 'return': 0x0f, 'drop': 0x1a,
+    'local.get': 0x20, 'local.set': 0x21, 'local.tee': 0x22,
+    'global.get': 0x23, 'global.set': 0x24,
+    'i32.load': 0x28, 'i64.load': 0x29, 'f32.load': 0x2a, 'f64.load': 0x2b,
+    'i32.store': 0x36, 'i64.store': 0x37, 'f32.store': 0x38, 'f64.store': 0x39,
+    'i64.load8_u': 0x31, 'i64.load16_u': 0x33, 'i64.load32_u': 0x35,
+    'i64.store8': 0x3c, 'i64.store16': 0x3d, 'i64.store32': 0x3e,
+    'i32.const': 0x41, 'i64.const': 0x42, 'f32.const': 0x43, 'f64.const': 0x44,
+}
+
+# SIMD opcodes, all prefixed with 0xfd.
+SIMD_OPCODES = {
+    'v128.load': 0, 'v128.load8x8_s': 1, 'v128.load8x8_u': 2, 'v128.load16x4_s': 3,
+    'v128.load16x4_u': 4, 'v128.load32x2_s': 5, 'v128.load32x2_u': 6,
+    'v128.load8_splat': 7, 'v128.load16_splat': 8, 'v128.load32_splat': 9,
+    'v128.load64_splat': 10, 'v128.store': 11, 'v128.const': 12, 'i8x16.shuffle': 13,
+    'i8x16.swizzle': 14, 'i8x16.splat': 15, 'i16x8.splat': 16, 'i32x4.splat': 17,
+    'i64x2.splat': 18, 'f32x4.splat': 19, 'f64x2.splat': 20,
+    'i8x16.extract_lane_s': 21, 'i8x16.extract_lane_u': 22, 'i8x16.replace_lane': 23,
+    'i16x8.extract_lane_s': 24, 'i16x8.extract_lane_u': 25, 'i16x8.replace_lane': 26,
+    'i32x4.extract_lane': 27, 'i32x4.replace_lane': 28, 'i64x2.extract_lane': 29,
+    'i64x2.replace_lane': 30, 'f32x4.extract_lane': 31, 'f32x4.replace_lane': 32,
+    'f64x2.extract_lane': 33, 'f64x2.replace_lane': 34, 'i8x16.eq': 35, 'i8x16.ne': 36,
+    'i8x16.lt_s': 37, 'i8x16.lt_u': 38, 'i8x16.gt_s': 39, 'i8x16.gt_u': 40,
+    'i8x16.le_s': 41, 'i8x16.le_u': 42, 'i8x16.ge_s': 43, 'i8x16.ge_u': 44,
+    'i16x8.eq': 45, 'i16x8.ne': 46, 'i16x8.lt_s': 47, 'i16x8.lt_u': 48,
+    'i16x8.gt_s': 49, 'i16x8.gt_u': 50, 'i16x8.le_s': 51, 'i16x8.le_u': 52,
+    'i16x8.ge_s': 53, 'i16x8.ge_u': 54, 'i32x4.eq': 55, 'i32x4.ne': 56,
+    'i32x4.lt_s': 57, 'i32x4.lt_u': 58, 'i32x4.gt_s': 59, 'i32x4.gt_u': 60,
+    'i32x4.le_s': 61, 'i32x4.le_u': 62, 'i32x4.ge_s': 63, 'i32x4.ge_u': 64,
+    'f32x4.eq': 65, 'f32x4.ne': 66, 'f32x4.lt': 67, 'f32x4.gt': 68, 'f32x4.le': 69,
+    'f32x4.ge': 70, 'f64x2.eq': 71, 'f64x2.ne': 72, 'f64x2.lt': 73, 'f64x2.gt': 74,
+    'f64x2.le': 75, 'f64x2.ge': 76, 'v128.not': 77, 'v128.and': 78, 'v128.andnot': 79,
+    'v128.or': 80, 'v128.xor': 81, 'v128.bitselect': 82, 'v128.any_true': 83,
+    'v128.load8_lane': 84, 'v128.load16_lane': 85, 'v128.load32_lane': 86,
+    'v128.load64_lane': 87, 'v128.store8_lane': 88, 'v128.store16_lane': 89,
+    'v128.store32_lane': 90, 'v128.store64_lane': 91, 'v128.load32_zero': 92,
+    'v128.load64_zero': 93, 'f32x4.demote_f64x2_zero': 94,
+    'f64x2.promote_low_f32x4': 95, 'i8x16.abs': 96, 'i8x16.neg': 97,
+    'i8x16.popcnt': 98, 'i8x16.all_true': 99, 'i8x16.bitmask': 100,
+    'i8x16.narrow_i16x8_s': 101, 'i8x16.narrow_i16x8_u': 102, 'f32x4.ceil': 103,
+    'f32x4.floor': 104, 'f32x4.trunc': 105, 'f32x4.nearest': 106, 'i8x16.shl': 107,
+    'i8x16.shr_s': 108, 'i8x16.shr_u': 109, 'i8x16.add': 110, 'i8x16.add_sat_s': 111,
+    'i8x16.add_sat_u': 112, 'i8x16.sub': 113, 'i8x16.sub_sat_s': 114,
+    'i8x16.sub_sat_u': 115, 'f64x2.ceil': 116, 'f64x2.floor': 117, 'i8x16.min_s': 118,
+    'i8x16.min_u': 119, 'i8x16.max_s': 120, 'i8x16.max_u': 121, 'f64x2.trunc': 122,
+    'i8x16.avgr_u': 123, 'i16x8.extadd_pairwise_i8x16_s': 124,
+    'i16x8.extadd_pairwise_i8x16_u': 125, 'i32x4.extadd_pairwise_i16x8_s': 126,
+    'i32x4.extadd_pairwise_i16x8_u': 127, 'i16x8.abs': 128, 'i16x8.neg': 129,
+    'i16x8.q15mulr_sat_s': 130, 'i16x8.all_true': 131, 'i16x8.bitmask': 132,
+    'i16x8.narrow_i32x4_s': 133, 'i16x8.narrow_i32x4_u': 134,
+    'i16x8.extend_low_i8x16_s': 135, 'i16x8.extend_high_i8x16_s': 136,
+    'i16x8.extend_low_i8x16_u': 137, 'i16x8.extend_high_i8x16_u': 138,
+    'i16x8.shl': 139, 'i16x8.shr_s': 140, 'i16x8.shr_u': 141, 'i16x8.add': 142,
+    'i16x8.add_sat_s': 143, 'i16x8.add_sat_u': 144, 'i16x8.sub': 145,
+    'i16x8.sub_sat_s': 146, 'i16x8.sub_sat_u': 147, 'f64x2.nearest': 148,
+    'i16x8.mul': 149, 'i16x8.min_s': 150, 'i16x8.min_u': 151, 'i16x8.max_s': 152,
+    'i16x8.max_u': 153, 'i16x8.avgr_u': 155, 'i16x8.extmul_low_i8x16_s': 156,
+    'i16x8.extmul_high_i8x16_s': 157, 'i16x8.extmul_low_i8x16_u': 158,
+    'i16x8.extmul_high_i8x16_u': 159, 'i32x4.abs': 160, 'i32x4.neg': 161,
+    'i32x4.all_true': 163, 'i32x4.bitmask': 164, 'i32x4.extend_low_i16x8_s': 167,
+    'i32x4.extend_high_i16x8_s': 168, 'i32x4.extend_low_i16x8_u': 169,
+    'i32x4.extend_high_i16x8_u': 170, 'i32x4.shl': 171, 'i32x4.shr_s': 172,
+    'i32x4.shr_u': 173, 'i32x4.add': 174, 'i32x4.sub': 177, 'i32x4.mul': 181,
+    'i32x4.min_s': 182, 'i32x4.min_u': 183, 'i32x4.max_s': 184, 'i32x4.max_u': 185,
+    'i32x4.dot_i16x8_s': 186, 'i32x4.extmul_low_i16x8_s': 188,
+    'i32x4.extmul_high_i16x8_s': 189, 'i32x4.extmul_low_i16x8_u': 190,
+    'i32x4.extmul_high_i16x8_u': 191, 'i64x2.abs': 192, 'i64x2.neg': 193,
+    'i64x2.all_true': 195, 'i64x2.bitmask': 196, 'i64x2.extend_low_i32x4_s': 199,
+    'i64x2.extend_high_i32x4_s': 200, 'i64x2.extend_low_i32x4_u': 201,
+    'i64x2.extend_high_i32x4_u': 202, 'i64x2.shl': 203, 'i64x2.shr_s': 204,
+    'i64x2.shr_u': 205, 'i64x2.add': 206, 'i64x2.sub': 209, 'i64x2.mul': 213,
+    'i64x2.eq': 214, 'i64x2.ne': 215, 'i64x2.lt_s': 216, 'i64x2.gt_s': 217,
+    'i64x2.le_s': 218, 'i64x2.ge_s': 219, 'i64x2.extmul_low_i32x4_s': 220,
+    'i64x2.extmul_high_i32x4_s': 221, 'i64x2.extmul_low_i32x4_u': 222,
+    'i64x2.extmul_high_i32x4_u': 223, 'f32x4.abs': 224, 'f32x4.neg': 225,
+    'f32x4.sqrt': 227, 'f32x4.add': 228, 'f32x4.sub': 229, 'f32x4.mul': 230,
+    'f32x4.div': 231, 'f32x4.min': 232, 'f32x4.max': 233, 'f32x4.pmin': 234,
+    'f32x4.pmax': 235, 'f64x2.abs': 236, 'f64x2.neg': 237, 'f64x2.sqrt': 239,
+    'f64x2.add': 240, 'f64x2.sub': 241, 'f64x2.mul': 242, 'f64x2.div': 243,
+    'f64x2.min': 244, 'f64x2.max': 245, 'f64x2.pmin': 246, 'f64x2.pmax': 247,
+    'i32x4.trunc_sat_f32x4_s': 248, 'i32x4.trunc_sat_f32x4_u': 249,
+    'f32x4.convert_i32x4_s': 250, 'f32x4.convert_i32x4_u': 251,
+    'i32x4.trunc_sat_f64x2_s_zero': 252, 'i32x4.trunc_sat_f64x2_u_zero': 253,
+    'f64x2.convert_low_i32x4_s': 254, 'f64x2.convert_low_i32x4_u': 255,
+}
+
+# Natural alignment (log2 of the access size) of the memory instructions.
+NATURAL_ALIGN = {
+    'i32.load': 2, 'i64.load': 3, 'f32.load': 2, 'f64.load': 3,
+    'i32.store': 2, 'i64.store': 3, 'f32.store': 2, 'f64.store': 3,
+    'i64.load8_u': 0, 'i64.load16_u': 1, 'i64.load32_u': 2,
+    'i64.store8': 0, 'i64.store16': 1, 'i64.store32': 2,
+    'v128.load': 4, 'v128.store': 4,
+    'v128.load8x8_s': 3, 'v128.load8x8_u': 3, 'v128.load16x4_s': 3,
+    'v128.load16x4_u': 3, 'v128.load32x2_s': 3, 'v128.load32x2_u': 3,
+    'v128.load8_splat': 0, 'v128.load16_splat': 1, 'v128.load32_splat': 2,
+    'v128.load64_splat': 3, 'v128.load32_zero': 2, 'v128.load64_zero': 3,
+    'v128.load8_lane': 0, 'v128.load16_lane': 1, 'v128.load32_lane': 2,
+    'v128.load64_lane': 3, 'v128.store8_lane': 0, 'v128.store16_lane': 1,
+    'v128.store32_lane': 2, 'v128.store64_lane': 3,
+}
+
+# Lane type: (lane width, float format as (exponent bits, mantissa bits)).
+SHAPES = {
+    'i8x16': (8, None), 'i16x8': (16, None), 'i32x4': (32, None),
+    'i64x2': (64, None), 'f32x4': (32, (8, 23)), 'f64x2': (64, (11, 52)),
+}
+
+TOKEN = re.compile(r'\s+|;;[^\n]*|\(;.*?;\)|"(?:[^"\\]|\\.)*"|[()]|[^\s()";]+', re.S)
+STRING_ESCAPES = {'n': 0x0a, 't': 0x09, 'r': 0x0d, '"': 0x22, "'": 0x27, '\\': 0x5c}
+
+
+def parse(text):
+    """Parse one s-expression into nested lists of atoms. Strings are kept
+    with their quotes to tell them apart from other atoms."""
+    return parse_all(text)[0]
+
+
+def parse_all(text):
+    """Parse every top-level s-expression of text, e.g. a whole script, in a
+    single pass of the tokenizer."""
+    stack = [[]]
+    for match in TOKEN.finditer(text):
+        token = match.group()
+        if token[0].isspace() or token.startswith((';;', '(;')):
+            continue
+        if token == '(':
+            stack.append([])
+        elif token == ')':
+            form = stack.pop()
+            stack[-1].append(form)
+        else:
+            stack[-1].append(token)
+    return stack[0]
+
+
+def string_bytes(token):
+    """Bytes of a quoted string atom."""
+    out = bytearray()
+    body = token[1:-1]
+    i = 0
+    while i < len(body):
+        c = body[i]
+        if c != '\\':
+            out += c.encode()
+            i += 1
+        elif body[i + 1] in STRING_ESCAPES:
+            out.append(STRING_ESCAPES[body[i + 1]])
+            i += 2
+        elif body[i + 1] == 'u':
+            end = body.index('}', i)
+            out += chr(int(body[i + 3:end], 16)).encode()
+            i = end + 1
+        else:
+            out.append(int(body[i + 1:i + 3], 16))
+            i += 3
+    return bytes(out)
+
+
+def u32(n):
+    out = bytearray()
+    while True:
+        byte = n & 0x7f
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def sleb(n):
+    out = bytearray()
+    while True:
+        byte = n & 0x7f
+        n >>= 7
+        if (n == 0 and not byte & 0x40) or (n == -1 and byte & 0x40):
+            out.append(byte)
+            return bytes(out)
+        out.append(byte | 0x80)
+
+
+def vec(items):
+    return u32(len(items)) + b''.join(items)
+
+
+def name(token):
+    data = string_bytes(token)
+    return u32(len(data)) + data
+
+
+def section(sec_id, items):
+    if not items:
+        return b''
+    content = vec(items)
+    return bytes([sec_id]) + u32(len(content)) + content
+
+
+def int_value(token, width):
+    """Integer literal as an unsigned value of width bits."""
+    literal = token.replace('_', '')
+    digits = literal.lstrip('+-')
+    value = int(digits[2:], 16) if digits.startswith('0x') else int(digits)
+    if literal.startswith('-'):
+        value = -value
+    if not -(1 << (width - 1)) <= value < (1 << width):
+        raise EncodeError('integer out of range: ' + token)
+    return value & ((1 << width) - 1)
+
+
+def signed(value, width):
+    return value - (1 << width) if value >> (width - 1) else value
+
+
+def float_bits(token, fmt):
+    """Bit pattern of a float literal, rounded to nearest even."""
+    exp_bits, man_bits = fmt
+    bias = (1 << (exp_bits - 1)) - 1
+    literal = token.replace('_', '')
+    sign = 0
+    if literal[0] in '+-':
+        sign = int(literal[0] == '-')
+        literal = literal[1:]
+    sign <<= exp_bits + man_bits
+    inf = ((1 << exp_bits) - 1) << man_bits
+    if literal == 'inf':
+        return sign | inf
+    if literal.startswith('nan'):
+        payload = int(literal[4:], 16) if literal.startswith('nan:') else 1 << (man_bits - 1)
+        return sign | inf | payload
+
+    if literal.startswith('0x'):
+        mantissa, _, exp = literal[2:].lower().partition('p')
+        whole, _, frac = mantissa.partition('.')
+        value = Fraction(int(whole + frac or '0', 16), 16 ** len(frac))
+        value *= Fraction(2) ** int(exp or '0')
+    else:
+        value = Fraction(literal)
+    if value == 0:
+        return sign
+
+    # Exponent of the leading bit, clamped to the subnormal range.
+    exp = value.numerator.bit_length() - value.denominator.bit_length()
+    if Fraction(2) ** exp > value:
+        exp -= 1
+    exp = max(exp, 1 - bias)
+    scaled = value / Fraction(2) ** (exp - man_bits)
+    man = round(scaled)
+    if man == 1 << (man_bits + 1):
+        man >>= 1
+        exp += 1
+    if exp > bias:
+        raise EncodeError('float out of range: ' + token)
+    biased = exp + bias if man >> man_bits else 0
+    return sign | biased << man_bits | man & ((1 << man_bits) - 1)
+
+
+def v128_bytes(shape, lanes):
+    if shape not in SHAPES:
+        raise EncodeError('unknown shape: ' + shape)
+    width, fmt = SHAPES[shape]
+    if len(lanes) != 128 // width:
+        raise EncodeError('wrong lane count for ' + shape)
+    out = b''
+    for lane in lanes:
+        bits = float_bits(lane, fmt) if fmt else int_value(lane, width)
+        out += bits.to_bytes(width // 8, 'little')
+    return out
+
+
+class FuncEncoder:
+    """Encode the body of one function."""
+
+    def __init__(self, module, local_names):
+        self.module = module
+        self.local_names = local_names
+        self.labels = []
+        self.code = bytearray()
+
+    def index(self, token, names):
+        if token.startswith('$'):
+            if token not in names:
+                raise EncodeError('unknown identifier: ' + token)
+            return names[token]
+        return int(token)
+
+    def memarg(self, op, imms):
+        offset = 0
+        align = NATURAL_ALIGN[op]
+        while imms and imms[0].startswith(('offset=', 'align=')):
+            key, _, value = imms.pop(0).partition('=')
+            if key == 'offset':
+                offset = int(value.replace('_', ''), 0)
+            else:
+                align = int(value.replace('_', ''), 0).bit_length() - 1
+        return u32(align) + u32(offset)
+
+    def instr(self, op, imms):
+        """Encode a plain instruction, consuming its immediates from imms."""
+        code = self.code
+        if op in SIMD_OPCODES:
+            code += b'\xfd' + u32(SIMD_OPCODES[op])
+        elif op in OPCODES:
+            code.append(OPCODES[op])
+        else:
+            raise EncodeError('unsupported instruction: ' + op)
+
+        if op in NATURAL_ALIGN:
+            code += self.memarg(op, imms)
+        if op.endswith('_lane'):
+            code.append(int(imms.pop(0)))
+        elif op == 'v128.const':
+            shape = imms.pop(0)
+            count = 128 // SHAPES.get(shape, (128,))[0]
+            code += v128_bytes(shape, [imms.pop(0) for _ in range(count)])
+        elif op == 'i8x16.shuffle':
+            code += bytes(int(imms.pop(0)) for _ in range(16))
+        elif op.startswith('local.'):
+            code += u32(self.index(imms.pop(0), self.local_names))
+        elif op.startswith('global.'):
+            code += u32(self.index(imms.pop(0), self.module.global_names))
+        elif op in ('i32.const', 'i64.const'):
+            width = 32 if op == 'i32.const' else 64
+            code += sleb(signed(int_value(imms.pop(0), width), width))
+        elif op in ('f32.const', 'f64.const'):
+            width, fmt = SHAPES['f32x4' if op == 'f32.const' else 'f64x2']
+            code += float_bits(imms.pop(0), fmt).to_bytes(width // 8, 'little')
+
+    def block(self, op, items):
+        """Encode a block header: an optional label and result type."""
+        label = None
+        if items and isinstance(items[0], str) and items[0].startswith('$'):
+            label = items.pop(0)
+        results = []
+        while items and isinstance(items[0], list) and items[0][0] == 'result':
+            results += items.pop(0)[1:]
+        if len(results) > 1:
+            raise EncodeError('multi-value blocks are not supported')
+        self.code.append(OPCODES[op])
+        self.code.append(VAL_TYPES[results[0]] if results else 0x40)
+        self.labels.append(label)
+
+    def seq(self, items):
+        """Encode a sequence of folded and plain instructions."""
+        items = list(items)
+        while items:
+            item = items.pop(0)
+            if isinstance(item, list):
+                self.folded(item)
+            elif item == 'block':
+                self.block(item, items)
+            elif item == 'end':
+                self.labels.pop()
+                self.code.append(OPCODES['end'])
+            else:
+                imms = []
+                while items and isinstance(items[0], str) and items[0] not in OPCODES \
+                        and items[0] not in SIMD_OPCODES:
+                    imms.append(items.pop(0))
+                self.instr(item, imms)
+                if imms:
+                    raise EncodeError('unexpected immediate: ' + imms[0])
+
+    def folded(self, form):
+        op, rest = form[0], list(form[1:])
+        if op == 'block':
+            self.block(op, rest)
+            self.seq(rest)
+            self.labels.pop()
+            self.code.append(OPCODES['end'])
+            return
+        imms = []
+        while rest and isinstance(rest[0], str):
+            imms.append(rest.pop(0))
+        self.seq(rest)
+        self.instr(op, imms)
+        if imms:
+            raise EncodeError('unexpected immediate: ' + imms[0])
+
+
+class ModuleEncoder:
+    """Encode a parsed module form."""
+
+    def __init__(self, form):
+        self.types = []
+        self.funcs = []
+        self.memories = []
+        self.globals = []
+        self.global_names = {}
+        self.exports = []
+        self.codes = []
+        self.datas = []
+
+        fields = form[1:]
+        if fields and isinstance(fields[0], str) and fields[0].startswith('$'):
+            fields = fields[1:]
+        for field in fields:
+            if not isinstance(field, list):
+                raise EncodeError('unexpected module field: ' + field)
+            encode_field = getattr(self, 'field_' + str(field[0]), None)
+            if encode_field is None:
+                raise EncodeError('unsupported module field: {}'.format(field[0]))
+            try:
+                encode_field(field[1:])
+            except (KeyError, ValueError, IndexError, TypeError, AttributeError) as e:
+                # Forms the field encoders do not expect, e.g. an unknown
+                # value type, are outside of the subset too.
+                raise EncodeError('unsupported {} field: {!r}'.format(field[0], e)) from e
+
+    @staticmethod
+    def no_abbreviation(items, kind):
+        """Reject the inline import and data abbreviations, and type uses."""
+        if items and isinstance(items[0], list) and items[0][0] in ('import', 'data', 'type'):
+            raise EncodeError('unsupported inline {} in {}'.format(items[0][0], kind))
+
+    def exports_of(self, items, kind, index):
+        while items and isinstance(items[0], list) and items[0][0] == 'export':
+            self.exports.append(name(items.pop(0)[1]) + bytes([kind]) + u32(index))
+
+    def field_memory(self, items):
+        items = list(items)
+        if isinstance(items[0], str) and items[0].startswith('$'):
+            items.pop(0)
+        self.exports_of(items, 0x02, len(self.memories))
+        self.no_abbreviation(items, 'memory')
+        if not 1 <= len(items) <= 2 or not all(isinstance(n, str) for n in items):
+            raise EncodeError('unsupported memory limits')
+        limits = [int(n) for n in items]
+        if len(limits) == 1:
+            self.memories.append(b'\x00' + u32(limits[0]))
+        else:
+            self.memories.append(b'\x01' + u32(limits[0]) + u32(limits[1]))
+
+    def field_data(self, items):
+        if isinstance(items[0], str) and items[0].startswith('$'):
+            items = items[1:]
+        offset = items[0]
+        if not isinstance(offset, list):
+            raise EncodeError('passive data segments are not supported')
+        if offset[0] == 'offset':
+            offset = offset[1]
+        if offset[0] != 'i32.const' or len(offset) != 2:
+            raise EncodeError('unsupported data offset')
+        expr = FuncEncoder(self, {})
+        expr.instr('i32.const', [offset[1]])
+        data = b''.join(string_bytes(s) for s in items[1:])
+        self.datas.append(b'\x00' + bytes(expr.code) + b'\x0b' + u32(len(data)) + data)
+
+    def field_global(self, items):
+        items = list(items)
+        index = len(self.globals)
+        if isinstance(items[0], str) and items[0].startswith('$'):
+            self.global_names[items.pop(0)] = index
+        self.exports_of(items, 0x03, index)
+        self.no_abbreviation(items, 'global')
+        global_type = items.pop(0)
+        if isinstance(global_type, list):
+            if global_type[0] != 'mut':
+                raise EncodeError('unsupported global type')
+            global_type = bytes([VAL_TYPES[global_type[1]], 1])
+        else:
+            global_type = bytes([VAL_TYPES[global_type], 0])
+        init = FuncEncoder(self, {})
+        init.seq(items)
+        self.globals.append(global_type + bytes(init.code) + b'\x0b')
+
+    def field_func(self, items):
+        items = list(items)
+        if items and isinstance(items[0], str) and items[0].startswith('$'):
+            items.pop(0)
+        self.exports_of(items, 0x00, len(self.funcs))
+        self.no_abbreviation(items, 'func')
+
+        local_names = {}
+        params, results, locals_ = [], [], []
+        while items and isinstance(items[0], list) and items[0][0] in ('param', 'result', 'local'):
+            kind, decl = items[0][0], items.pop(0)[1:]
+            types = {'param': params, 'result': results, 'local': locals_}[kind]
+            if decl and decl[0].startswith('$'):
+                if kind == 'result':
+                    raise EncodeError('named result')
+                local_names[decl[0]] = len(params) + len(locals_)
+                decl = decl[1:]
+            types.extend(VAL_TYPES[t] for t in decl)
+
+        func_type = b'\x60' + vec([bytes([t]) for t in params]) + vec([bytes([t]) for t in results])
+        if func_type not in self.types:
+            self.types.append(func_type)
+        self.funcs.append(u32(self.types.index(func_type)))
+
+        body = FuncEncoder(self, local_names)
+        body.seq(items)
+        groups = []
+        for t in locals_:
+            if groups and groups[-1][1] == t:
+                groups[-1][0] += 1
+            else:
+                groups.append([1, t])
+        code = vec([u32(n) + bytes([t]) for n, t in groups]) + bytes(body.code) + b'\x0b'
+        self.codes.append(u32(len(code)) + code)
+
+    def sections(self):
+        """The header and the sections of the binary, in order."""
+        return [
+            b'\x00asm', b'\x01\x00\x00\x00',
+            section(1, self.types),
+            section(3, self.funcs),
+            section(5, self.memories),
+            section(6, self.globals),
+            section(7, self.exports),
+            section(10, self.codes),
+            section(11, self.datas),
+        ]
+
+
+def encode_module(text):
+    """Binary encoding of the text of a module form."""
+    return b''.join(ModuleEncoder(parse(text)).sections())
+
+
+def wast_string(data):
+    return '"' + ''.join(chr(b) if 0x20 <= b < 0x7f and b not in b'"\\' else '\\%02x' % b
+                         for b in data) + '"'
+
+
+def binary_form(module_id, sections):
+    """The (module binary ...) form of the encoded sections of a module, one
+    string per section."""
+    strings = [wast_string(s) for s in sections if s]
+    return '(module {}binary\n  {}\n)'.format(module_id + ' ' if module_id else '',
+                                               '\n  '.join(strings))
+
+
+def binary_module(text):
+    """The (module binary ...) form equivalent to a module form."""
+    form = parse(text)
+    module_id = form[1] if len(form) > 1 and isinstance(form[1], str) else None
+    return binary_form(module_id, ModuleEncoder(form).sections())
+
+
+def binary_modules(text):
+    """Replace the top-level modules of wast text with binary modules where
+    the encoder supports them."""
+    out = []
+    for interstitial, form in split_forms(text):
+        out.append(interstitial)
+        if form is None:
+            continue
+        if form.startswith('(module') and not re.match(r'\(module\s+(\$\S+\s+)?(binary|quote)\b', form):
+            try:
+                form = binary_module(form)
+            except EncodeError:
+                pass
+        out.append(form)
+    return ''.join(out)
+
+
+def binary_file(wast_filename):
+    with open(wast_filename) as fp:
+        text = fp.read()
+    encoded = binary_modules(text)
+    if encoded != text:
+        write_file(wast_filename, encoded)
+
+
+if __name__ == '__main__':
+    for wast_filename in sys.argv[1:]:
+        binary_file(wast_filename)
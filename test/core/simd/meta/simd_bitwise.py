@@ -6,6 +6,7 @@ This file is used for generating bitwise test cases
 
 from simd import SIMD
 from test_assert import AssertReturn, AssertInvalid
+from simd_output import write_wast
 
 
 class SimdBitWise(SIMD):
@@ -486,8 +487,7 @@ class SimdBitWise(SIMD):
         """
         Generate test case file
         """
-        with open('../simd_bitwise.wast', 'w+') as f_out:
-            f_out.write(self.get_all_cases())
+        write_wast('simd_bitwise.wast', self.get_all_cases())
 
 
 def gen_test_cases():
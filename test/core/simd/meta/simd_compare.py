@@ -10,6 +10,7 @@ via using variable test data set and subclass from sub test template
 import abc
 from simd import SIMD
 from test_assert import AssertReturn, AssertInvalid
+from simd_output import write_wast
 
 
 # Generate common comparison tests
@@ -407,6 +408,4 @@ class SimdCmpCase(object):
 
     # Generate test case file
     def gen_test_cases(self):
-        with open('../simd_{}_cmp.wast'.format(self.LANE_TYPE), 'w+') as f_out:
-            f_out.write(self.get_all_cases())
-            f_out.close()
+        write_wast('simd_{}_cmp.wast'.format(self.LANE_TYPE), self.get_all_cases())
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+
+"""
+Opcode and lane value coverage of the SIMD test scripts.
+
+Each .wast file is tokenized in a single pass into its top-level forms. The
+exported functions of every module are mapped to the SIMD instructions of
+their bodies, and the lanes of the constant arguments of each assertion
+invoking them are counted by value class, e.g. zero, min_s, denormal or
+canonical NaN. The report is a matrix of opcode x value class hit counts for
+integer and float lanes, followed by the opcodes no assertion reaches, to
+point new generator work at the gaps.
+"""
+
+import os
+import sys
+import glob
+import argparse
+from collections import Counter
+from functools import lru_cache
+
+from simd_binary import parse_all, int_value, float_bits, SIMD_OPCODES, EncodeError
+from simd_ir import SCALAR_FORMATS, LANE_TYPES
+from simd_output import output_dir
+
+
+INT_CLASSES = ('zero', 'min_s', 'max_s', 'max_u', 'other')
+FLOAT_CLASSES = ('+0', '-0', 'denormal', 'min_normal', 'max', 'inf', '-inf',
+                 'nan:canonical', 'nan:arithmetic', 'nan:signalling', 'other')
+
+SCALAR_CONSTS = {'i32.const': 'i32', 'i64.const': 'i64',
+                 'f32.const': 'f32', 'f64.const': 'f64'}
+
+
+@lru_cache(maxsize=None)
+def value_class(lane_type, literal):
+    """Value class of a lane literal, None if it is not a valid literal.
+    Literals repeat a lot across the files, so the classes are cached."""
+    try:
+        if lane_type in SCALAR_FORMATS:
+            return float_class(literal, SCALAR_FORMATS[lane_type])
+        return int_class(int_value(literal, int(lane_type[1:])), int(lane_type[1:]))
+    except (EncodeError, ValueError):
+        return None
+
+
+def int_class(value, width):
+    if value == 0:
+        return 'zero'
+    if value == (1 << width) - 1:
+        return 'max_u'
+    if value == 1 << (width - 1):
+        return 'min_s'
+    if value == (1 << (width - 1)) - 1:
+        return 'max_s'
+    return 'other'
+
+
+def float_class(literal, fmt):
+    if literal in ('nan:canonical', 'nan:arithmetic'):
+        return literal
+    exp_bits, man_bits = fmt
+    bits = float_bits(literal, fmt)
+    sign = bits >> (exp_bits + man_bits)
+    exp = bits >> man_bits & ((1 << exp_bits) - 1)
+    man = bits & ((1 << man_bits) - 1)
+    quiet = 1 << (man_bits - 1)
+    if exp == (1 << exp_bits) - 1:
+        if man == 0:
+            return '-inf' if sign else 'inf'
+        if man == quiet:
+            return 'nan:canonical'
+        return 'nan:arithmetic' if man & quiet else 'nan:signalling'
+    if exp == 0:
+        if man == 0:
+            return '-0' if sign else '+0'
+        return 'denormal'
+    if exp == 1 and man == 0:
+        return 'min_normal'
+    if exp == (1 << exp_bits) - 2 and man == (1 << man_bits) - 1:
+        return 'max'
+    return 'other'
+
+
+def body_ops(func):
+    """The SIMD instructions of a function, in order of appearance. A
+    v128.const is only counted when it is the only one."""
+    ops = []
+    stack = [func]
+    while stack:
+        for item in stack.pop():
+            if isinstance(item, list):
+                stack.append(item)
+            elif item in SIMD_OPCODES and item not in ops:
+                ops.append(item)
+    if len(ops) > 1 and 'v128.const' in ops:
+        ops.remove('v128.const')
+    return tuple(ops)
+
+
+def module_exports(module):
+    """{quoted export name: SIMD instructions of the function} of a module."""
+    funcs = [item for item in module[1:] if isinstance(item, list) and item[:1] == ['func']]
+    exports = {}
+    ids = {}
+    for func in funcs:
+        ops = body_ops(func)
+        if len(func) > 1 and isinstance(func[1], str) and func[1].startswith('$'):
+            ids[func[1]] = ops
+        for item in func[1:]:
+            if isinstance(item, list) and item[:1] == ['export']:
+                exports[item[1]] = ops
+    for item in module[1:]:
+        if isinstance(item, list) and item[:1] == ['export'] and len(item) > 2 \
+                and isinstance(item[2], list) and item[2][:1] == ['func']:
+            ref = item[2][1]
+            if ref in ids:
+                exports[item[1]] = ids[ref]
+            elif ref.isdigit() and int(ref) < len(funcs):
+                exports[item[1]] = body_ops(funcs[int(ref)])
+    return exports
+
+
+def const_lanes(form):
+    """(lane type, lane literals) of a constant form, or None."""
+    if not isinstance(form, list) or not form:
+        return None
+    if form[0] == 'v128.const' and len(form) > 2 and form[1] in LANE_TYPES:
+        return LANE_TYPES[form[1]], form[2:]
+    if form[0] in SCALAR_CONSTS and len(form) > 1:
+        return SCALAR_CONSTS[form[0]], form[1:2]
+    return None
+
+
+class Coverage:
+    """Hit counts of the value classes per opcode, over any number of
+    scripts. With results set, the expected values of assert_return are
+    counted instead of the arguments."""
+
+    def __init__(self, results=False):
+        self.results = results
+        self.asserts = Counter()
+        self.int_hits = {}
+        self.float_hits = {}
+
+    def scan(self, text):
+        modules = {}
+        exports = {}
+        for form in parse_all(text):
+            head = form[0]
+            if head == 'module':
+                exports = module_exports(form)
+                if len(form) > 1 and isinstance(form[1], str) and form[1].startswith('$'):
+                    modules[form[1]] = exports
+            elif head in ('assert_return', 'assert_trap', 'invoke'):
+                action = form if head == 'invoke' else form[1]
+                if action[:1] != ['invoke'] or self.results and head != 'assert_return':
+                    continue
+                rest = action[1:]
+                funcs = exports
+                if rest[0].startswith('$'):
+                    funcs, rest = modules.get(rest[0], {}), rest[1:]
+                ops = funcs.get(rest[0])
+                if ops:
+                    self.count(ops, form[2:] if self.results else rest[1:])
+
+    def count(self, ops, values):
+        for op in ops:
+            self.asserts[op] += 1
+        for value in values:
+            lanes = const_lanes(value)
+            if lanes is None:
+                continue
+            lane_type, literals = lanes
+            hits = self.float_hits if lane_type in SCALAR_FORMATS else self.int_hits
+            classes = Counter(value_class(lane_type, literal) for literal in literals)
+            classes.pop(None, None)
+            for op in ops:
+                hits.setdefault(op, Counter()).update(classes)
+
+    def uncovered(self):
+        return [op for op in SIMD_OPCODES if not self.asserts[op]]
+
+    def matrix(self, hits, classes):
+        """Rows of (opcode, [hit count per class]), in opcode order."""
+        return [(op, [hits[op][cls] for cls in classes])
+                for op in SIMD_OPCODES if op in hits]
+
+    def report(self, fp=sys.stdout):
+        for title, hits, classes in (('integer lanes', self.int_hits, INT_CLASSES),
+                                     ('float lanes', self.float_hits, FLOAT_CLASSES)):
+            rows = self.matrix(hits, classes)
+            if not rows:
+                continue
+            op_width = max(len(op) for op, _ in rows)
+            widths = [max(len(cls), 6) for cls in classes]
+            fp.write('{:<{}} {:>7} {}\n'.format(
+                title, op_width, 'asserts',
+                ' '.join('{:>{}}'.format(cls, w) for cls, w in zip(classes, widths))))
+            for op, counts in rows:
+                # Gaps are shown as '-' to stand out from the counts.
+                fp.write('{:<{}} {:>7} {}\n'.format(
+                    op, op_width, self.asserts[op],
+                    ' '.join('{:>{}}'.format(n or '-', w) for n, w in zip(counts, widths))))
+            fp.write('\n')
+        fp.write('not covered: {}\n'.format(' '.join(self.uncovered()) or 'none'))
+
+    def write_csv(self, fp=sys.stdout):
+        fp.write('lanes,opcode,class,hits\n')
+        for kind, hits, classes in (('int', self.int_hits, INT_CLASSES),
+                                    ('float', self.float_hits, FLOAT_CLASSES)):
+            for op, counts in self.matrix(hits, classes):
+                for cls, n in zip(classes, counts):
+                    fp.write('{},{},{},{}\n'.format(kind, op, cls, n))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Report the opcode and lane value coverage of the SIMD tests')
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                        help='.wast files to scan, defaults to the generated '
+                             'files in the output directory')
+    parser.add_argument('-r', '--results', dest='results', action='store_true',
+                        default=False,
+                        help='Count the expected results instead of the arguments')
+    parser.add_argument('--csv', dest='csv', action='store_true', default=False,
+                        help='Write the hit counts as CSV instead of a matrix')
+    args = parser.parse_args()
+
+    filenames = args.files or sorted(glob.glob(os.path.join(output_dir(), '*.wast')))
+    coverage = Coverage(args.results)
+    for filename in filenames:
+        with open(filename) as fp:
+            coverage.scan(fp.read())
+
+    if args.csv:
+        coverage.write_csv()
+    else:
+        coverage.report()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+"""
+Find and drop duplicate assert_return commands in the generated suites.
+
+Several generators share boundary tables, so the same assertion against the
+same module is often emitted more than once, within a file or across files.
+Each assertion is fingerprinted by the text of the module it runs against
+and its invoke, arguments and expected result, both with whitespace
+normalized. Constants are compared as spelled, not by their bits, since the
+different spellings of a value also test the text format.
+
+Assertions against modules with memories or globals are counted but never
+dropped, since a repeated invoke may observe a different state.
+"""
+
+import re
+import hashlib
+
+from simd_lane_pack import split_forms
+from simd_output import write_file
+
+
+STATEFUL = re.compile(r'\((memory|global)\b')
+
+
+def fingerprint(module, form):
+    text = ' '.join(form.split())
+    return hashlib.blake2b((module + '\0' + text).encode(), digest_size=16).digest()
+
+
+class FileStats:
+    __slots__ = ('assertions', 'in_file', 'cross_file', 'dropped')
+
+    def __init__(self):
+        self.assertions = 0
+        self.in_file = 0
+        self.cross_file = 0
+        self.dropped = 0
+
+
+class AssertionDedup:
+    """Output sink that fingerprints the assertions of each generated file,
+    optionally drops the repeated ones and writes the file."""
+
+    def __init__(self, drop=False, write=write_file):
+        self.drop = drop
+        self.write = write
+        # Fingerprint -> file it was first seen in.
+        self.seen = {}
+        self.stats = {}
+
+    def dedup(self, wast_filename, text):
+        stats = self.stats[wast_filename] = FileStats()
+        module = ''
+        stateful = False
+        file_keys = set()
+        out = []
+        for interstitial, form in split_forms(text):
+            if form is None:
+                out.append(interstitial)
+                break
+            if form.startswith('(module'):
+                module = ' '.join(form.split())
+                stateful = bool(STATEFUL.search(form))
+            elif form.startswith('(assert_return'):
+                stats.assertions += 1
+                key = fingerprint(module, form)
+                first = self.seen.setdefault(key, wast_filename)
+                if first != wast_filename or key in file_keys:
+                    if first == wast_filename:
+                        stats.in_file += 1
+                    else:
+                        stats.cross_file += 1
+                    if self.drop and not stateful:
+                        stats.dropped += 1
+                        # Comments above the dropped assertion are kept.
+                        if interstitial.strip():
+                            out.append(interstitial)
+                        continue
+                file_keys.add(key)
+            out.append(interstitial)
+            out.append(form)
+        return ''.join(out)
+
+    def __call__(self, wast_filename, text):
+        self.write(wast_filename, self.dedup(wast_filename, text))
+
+    def report(self):
+        lines = ['{:<48} {:>8} {:>8} {:>8} {:>8}'.format(
+            'file', 'asserts', 'in-file', 'x-file', 'dropped')]
+        total = FileStats()
+        for wast_filename, stats in self.stats.items():
+            lines.append('{:<48} {:>8} {:>8} {:>8} {:>8}'.format(
+                wast_filename, stats.assertions, stats.in_file,
+                stats.cross_file, stats.dropped))
+            for slot in FileStats.__slots__:
+                setattr(total, slot, getattr(total, slot) + getattr(stats, slot))
+        lines.append('{:<48} {:>8} {:>8} {:>8} {:>8}'.format(
+            'total', total.assertions, total.in_file, total.cross_file, total.dropped))
+        return '\n'.join(lines)
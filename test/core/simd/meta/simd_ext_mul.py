@@ -13,6 +13,7 @@ Subclasses need to define 3 attributes:
 """
 
 from simd_arithmetic import SimdArithmeticCase
+from simd_output import write_wast
 
 
 class SimdExtMulCase(SimdArithmeticCase):
@@ -35,10 +36,9 @@ class SimdExtMulCase(SimdArithmeticCase):
         return []
 
     def gen_test_cases(self):
-        wast_filename = '../simd_{wide}_extmul_{narrow}.wast'.format(
+        wast_filename = 'simd_{wide}_extmul_{narrow}.wast'.format(
                 wide=self.LANE_TYPE, narrow=self.SRC_LANE_TYPE)
-        with open(wast_filename, 'w') as fp:
-            fp.write(self.get_all_cases())
+        write_wast(wast_filename, self.get_all_cases())
 
 
 class SimdI16x8ExtMulCase(SimdExtMulCase):
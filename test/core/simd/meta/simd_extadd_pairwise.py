@@ -2,6 +2,7 @@
 
 from simd_arithmetic import SimdArithmeticCase, i16
 from simd_integer_op import ArithmeticOp
+from simd_output import write_wast
 
 
 class SimdExtAddPairwise(SimdArithmeticCase):
@@ -38,9 +39,8 @@ class SimdExtAddPairwise(SimdArithmeticCase):
         return ''
 
     def gen_test_cases(self):
-        wast_filename = '../simd_{}_extadd_pairwise_{}.wast'.format(self.LANE_TYPE, self.SRC_LANE_TYPE)
-        with open(wast_filename, 'w') as fp:
-            fp.write(self.get_all_cases())
+        wast_filename = 'simd_{}_extadd_pairwise_{}.wast'.format(self.LANE_TYPE, self.SRC_LANE_TYPE)
+        write_wast(wast_filename, self.get_all_cases())
 
 class SimdI16x8ExtAddPairwise(SimdExtAddPairwise):
     UNARY_OPS = ('extadd_pairwise_i8x16_s','extadd_pairwise_i8x16_u')
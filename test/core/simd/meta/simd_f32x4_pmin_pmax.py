@@ -8,6 +8,7 @@ from simd_f32x4_arith import Simdf32x4ArithmeticCase
 from simd_float_op import FloatingPointSimpleOp
 from simd import SIMD
 from test_assert import AssertReturn
+from simd_output import write_wast
 
 
 class Simdf32x4PminPmaxCase(Simdf32x4ArithmeticCase):
@@ -65,13 +66,12 @@ class Simdf32x4PminPmaxCase(Simdf32x4ArithmeticCase):
                 cases.append(tpl_assert.format(lane_type=lane_type, op=op, value=' '.join([self.v128_const('i32x4', '0')]*2)))
 
     def gen_test_cases(self):
-        wast_filename = '../simd_{lane_type}_pmin_pmax.wast'.format(lane_type=self.LANE_TYPE)
-        with open(wast_filename, 'w') as fp:
-            txt_test_case = self.get_all_cases()
-            txt_test_case = txt_test_case.replace(
-                    self.LANE_TYPE + ' arithmetic',
-                    self.LANE_TYPE + ' [pmin, pmax]')
-            fp.write(txt_test_case)
+        wast_filename = 'simd_{lane_type}_pmin_pmax.wast'.format(lane_type=self.LANE_TYPE)
+        txt_test_case = self.get_all_cases()
+        txt_test_case = txt_test_case.replace(
+                self.LANE_TYPE + ' arithmetic',
+                self.LANE_TYPE + ' [pmin, pmax]')
+        write_wast(wast_filename, txt_test_case)
 
 
 def gen_test_cases():
@@ -8,6 +8,7 @@ from simd_f32x4 import Simdf32x4Case
 from simd_f32x4_arith import Simdf32x4ArithmeticCase
 from test_assert import AssertReturn
 from simd import SIMD
+from simd_output import write_wast
 
 
 class Simdf64x2Case(Simdf32x4Case):
@@ -379,11 +380,10 @@ class Simdf64x2Case(Simdf32x4Case):
         return '\n'.join(cases)
 
     def gen_test_cases(self):
-        wast_filename = '../simd_{lane_type}.wast'.format(lane_type=self.LANE_TYPE)
-        with open(wast_filename, 'w') as fp:
-            txt_test_case = self.get_all_cases()
-            txt_test_case = txt_test_case.replace('f64x2 arithmetic', 'f64x2 [abs, min, max]')
-            fp.write(txt_test_case)
+        wast_filename = 'simd_{lane_type}.wast'.format(lane_type=self.LANE_TYPE)
+        txt_test_case = self.get_all_cases()
+        txt_test_case = txt_test_case.replace('f64x2 arithmetic', 'f64x2 [abs, min, max]')
+        write_wast(wast_filename, txt_test_case)
 
 
 def gen_test_cases():
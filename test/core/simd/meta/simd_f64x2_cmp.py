@@ -13,6 +13,7 @@ from simd_arithmetic import SimdArithmeticCase
 from simd_float_op import FloatingPointCmpOp
 from test_assert import AssertReturn
 from simd import SIMD
+from simd_output import write_wast
 
 
 class Simdf64x2CmpCase(SimdArithmeticCase):
@@ -204,11 +205,10 @@ class Simdf64x2CmpCase(SimdArithmeticCase):
                                                op=op))
 
     def gen_test_cases(self):
-        wast_filename = '../simd_{lane_type}_cmp.wast'.format(lane_type=self.LANE_TYPE)
-        with open(wast_filename, 'w') as fp:
-            txt_test_case = self.get_all_cases()
-            txt_test_case = txt_test_case.replace('f64x2 arithmetic', 'f64x2 comparison')
-            fp.write(txt_test_case)
+        wast_filename = 'simd_{lane_type}_cmp.wast'.format(lane_type=self.LANE_TYPE)
+        txt_test_case = self.get_all_cases()
+        txt_test_case = txt_test_case.replace('f64x2 arithmetic', 'f64x2 comparison')
+        write_wast(wast_filename, txt_test_case)
 
 
 def gen_test_cases():
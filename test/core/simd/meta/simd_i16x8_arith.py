@@ -172,5 +172,10 @@ def gen_test_cases():
     simd_i16x8_arith.gen_test_cases()
 
 
+def gen_exhaustive_test_cases():
+    simd_i16x8_arith = SimdI16x8ArithmeticCase()
+    simd_i16x8_arith.gen_exhaustive_test_cases()
+
+
 if __name__ == '__main__':
     gen_test_cases()
\ No newline at end of file
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 from simd_arithmetic import SimdArithmeticCase
+from simd_output import write_wast
 
 
 """Generate test cases for i16x8.mulr_sat_s
@@ -22,9 +23,8 @@ class SimdI16x8Q15MulRSatS(SimdArithmeticCase):
         return ''
 
     def gen_test_cases(self):
-        wast_filename = '../simd_i16x8_q15mulr_sat_s.wast'
-        with open(wast_filename, 'w') as fp:
-            fp.write(self.get_all_cases())
+        wast_filename = 'simd_i16x8_q15mulr_sat_s.wast'
+        write_wast(wast_filename, self.get_all_cases())
 
 
 def gen_test_cases():
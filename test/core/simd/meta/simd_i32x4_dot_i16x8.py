@@ -2,6 +2,7 @@
 
 from simd_arithmetic import SimdArithmeticCase, i16
 from simd_integer_op import ArithmeticOp
+from simd_output import write_wast
 
 
 class SimdI32x4DotI16x8TestCase(SimdArithmeticCase):
@@ -44,9 +45,8 @@ class SimdI32x4DotI16x8TestCase(SimdArithmeticCase):
         return ''
 
     def gen_test_cases(self):
-        wast_filename = '../simd_i32x4_dot_i16x8.wast'
-        with open(wast_filename, 'w') as fp:
-            fp.write(self.get_all_cases())
+        wast_filename = 'simd_i32x4_dot_i16x8.wast'
+        write_wast(wast_filename, self.get_all_cases())
 
 def gen_test_cases():
     simd_i16x8_arith = SimdI32x4DotI16x8TestCase()
@@ -144,5 +144,10 @@ def gen_test_cases():
     simd_i8x16_arith.gen_test_cases()
 
 
+def gen_exhaustive_test_cases():
+    simd_i8x16_arith = SimdI8x16ArithmeticCase()
+    simd_i8x16_arith.gen_exhaustive_test_cases()
+
+
 if __name__ == '__main__':
     gen_test_cases()
\ No newline at end of file
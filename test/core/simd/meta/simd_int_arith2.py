@@ -8,6 +8,7 @@ from simd import SIMD
 from test_assert import AssertReturn, AssertInvalid, AssertMalformed
 from simd_lane_value import LaneValue
 from simd_integer_op import ArithmeticOp
+from simd_output import write_wast
 
 
 class SimdLaneWiseInteger:
@@ -518,9 +519,8 @@ class SimdLaneWiseInteger:
 
     def gen_test_cases(self):
         """generate case file"""
-        wast_filename = '../simd_{lane_type}_arith2.wast'.format(lane_type=self.LANE_TYPE)
-        with open(wast_filename, 'w') as fp:
-            fp.write(self.get_all_cases())
+        wast_filename = 'simd_{lane_type}_arith2.wast'.format(lane_type=self.LANE_TYPE)
+        write_wast(wast_filename, self.get_all_cases())
 
 
 class Simdi64x2Case(SimdLaneWiseInteger):
@@ -7,6 +7,7 @@ Generates all integer-to-integer extension test cases.
 from simd import SIMD
 from simd_arithmetic import SimdArithmeticCase
 from test_assert import AssertReturn, AssertInvalid
+from simd_output import write_wast
 
 
 class SimdIntToIntExtend(SimdArithmeticCase):
@@ -96,9 +97,8 @@ class SimdIntToIntExtend(SimdArithmeticCase):
         return "\n".join(cases)
 
     def gen_test_cases(self):
-        wast_filename = "../simd_int_to_int_extend.wast"
-        with open(wast_filename, "w") as fp:
-            fp.write(self.get_all_cases())
+        wast_filename = "simd_int_to_int_extend.wast"
+        write_wast(wast_filename, self.get_all_cases())
 
     def get_combine_cases(self):
         return ""
@@ -15,6 +15,7 @@ from simd_arithmetic import SimdArithmeticCase
 from test_assert import AssertReturn
 from simd_float_op import FloatingPointOp, FloatingPointRoundingOp
 from simd_integer_op import ArithmeticOp
+from simd_output import write_wast
 
 
 class SimdConversionCase(SimdArithmeticCase):
@@ -135,11 +136,10 @@ class SimdConversionCase(SimdArithmeticCase):
         return test_data
 
     def gen_test_cases(self):
-        wast_filename = "../simd_{}_trunc_sat_{}.wast".format(
+        wast_filename = "simd_{}_trunc_sat_{}.wast".format(
             self.LANE_TYPE, self.SRC_LANE_TYPE
         )
-        with open(wast_filename, "w") as fp:
-            fp.write(self.get_all_cases())
+        write_wast(wast_filename, self.get_all_cases())
 
     def get_combine_cases(self):
         return ""
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+
+"""
+Intermediate representation of the generated test scripts, with renderers.
+
+The generators emit .wast text. A script is read back once into compact
+records for its modules, actions and assertions, with the expected values
+already computed, and any number of renderers can then consume it without
+running the generators again:
+
+    wast    the script text as generated
+    json    a command list in the wast2json layout, modules as .wasm files
+    binary  the script with its modules in the binary format
+
+Modules are encoded once, when the script is read, and both the json and
+the binary renderings are built from the encoded Module records.
+"""
+
+import os
+import json
+
+from simd_lane_pack import split_forms
+from simd_binary import (parse, string_bytes, int_value, float_bits, ModuleEncoder,
+                         binary_form, EncodeError)
+from simd_output import write_file
+
+
+SCALAR_FORMATS = {'f32': (8, 23), 'f64': (11, 52)}
+SCALAR_WIDTHS = {'i32': 32, 'i64': 64, 'f32': 32, 'f64': 64}
+LANE_TYPES = {'i8x16': 'i8', 'i16x8': 'i16', 'i32x4': 'i32', 'i64x2': 'i64',
+              'f32x4': 'f32', 'f64x2': 'f64'}
+
+
+class Const:
+    """A constant argument or expected value. value is the bit pattern as an
+    unsigned decimal string, or a NaN pattern, a list of them for v128."""
+    __slots__ = ('type', 'lane_type', 'value')
+
+    def __init__(self, type, lane_type, value):
+        self.type = type
+        self.lane_type = lane_type
+        self.value = value
+
+    @staticmethod
+    def from_form(form):
+        head = form[0]
+        if head == 'v128.const':
+            lane_type = LANE_TYPES[form[1]]
+            return Const('v128', lane_type, [lane_bits(lane_type, v) for v in form[2:]])
+        value_type = head.split('.')[0]
+        return Const(value_type, None, lane_bits(value_type, form[1]))
+
+    def to_json(self):
+        if self.type == 'v128':
+            return {'type': 'v128', 'lane_type': self.lane_type, 'value': self.value}
+        return {'type': self.type, 'value': self.value}
+
+
+def lane_bits(value_type, literal):
+    if literal.startswith('nan:') and literal[4:] in ('canonical', 'arithmetic'):
+        return literal
+    if value_type in SCALAR_FORMATS:
+        return str(float_bits(literal, SCALAR_FORMATS[value_type]))
+    return str(int_value(literal, int(value_type[1:])))
+
+
+class Module:
+    """A module form. kind is 'text', 'binary' or 'quote' for the
+    (module binary ...) and (module quote ...) forms. sections are the
+    encoded sections of the module, None for a quoted module or one outside
+    the subset simd_binary encodes. source is the text of a quoted module."""
+    __slots__ = ('line', 'name', 'text', 'kind', 'sections', 'source')
+
+    def __init__(self, line, name, text, kind, sections, source=None):
+        self.line = line
+        self.name = name
+        self.text = text
+        self.kind = kind
+        self.sections = sections
+        self.source = source
+
+    @staticmethod
+    def from_form(line, text, form):
+        name = form[1] if len(form) > 1 and isinstance(form[1], str) \
+            and form[1].startswith('$') else None
+        rest = form[2:] if name else form[1:]
+        strings = [s for s in rest[1:] if isinstance(s, str) and s.startswith('"')]
+        if rest and rest[0] == 'quote':
+            source = ''.join(unquote(s) for s in strings)
+            return Module(line, name, text, 'quote', None, source)
+        if rest and rest[0] == 'binary':
+            return Module(line, name, text, 'binary', [b''.join(map(string_bytes, strings))])
+        try:
+            sections = ModuleEncoder(form).sections()
+        except EncodeError:
+            sections = None
+        return Module(line, name, text, 'text', sections)
+
+
+class Action:
+    """An invoke of an exported function, or a get of an exported global."""
+    __slots__ = ('line', 'type', 'module', 'field', 'args')
+
+    def __init__(self, line, type, module, field, args):
+        self.line = line
+        self.type = type
+        self.module = module
+        self.field = field
+        self.args = args
+
+    def to_json(self):
+        action = {'type': self.type, 'field': self.field}
+        if self.module:
+            action['module'] = self.module
+        if self.type == 'invoke':
+            action['args'] = [arg.to_json() for arg in self.args]
+        return action
+
+
+class AssertReturn:
+    __slots__ = ('line', 'action', 'expected')
+
+    def __init__(self, line, action, expected):
+        self.line = line
+        self.action = action
+        self.expected = expected
+
+
+class AssertTrap:
+    __slots__ = ('line', 'kind', 'action', 'text')
+
+    def __init__(self, line, kind, action, text):
+        self.line = line
+        self.kind = kind
+        self.action = action
+        self.text = text
+
+
+class AssertModule:
+    """assert_invalid, assert_malformed and friends, on a Module."""
+    __slots__ = ('line', 'kind', 'module', 'text')
+
+    def __init__(self, line, kind, module, text):
+        self.line = line
+        self.kind = kind
+        self.module = module
+        self.text = text
+
+
+class Register:
+    __slots__ = ('line', 'name', 'module')
+
+    def __init__(self, line, name, module):
+        self.line = line
+        self.name = name
+        self.module = module
+
+
+class Script:
+    """A generated script: its commands, and the source text it was read
+    from split into (interstitial text, form) pieces."""
+    __slots__ = ('filename', 'commands', 'pieces')
+
+    def __init__(self, filename, commands, pieces):
+        self.filename = filename
+        self.commands = commands
+        self.pieces = pieces
+
+
+def unquote(token):
+    return string_bytes(token).decode()
+
+
+def read_action(line, form):
+    rest = form[1:]
+    module = None
+    if rest[0].startswith('$'):
+        module, rest = rest[0], rest[1:]
+    args = [Const.from_form(arg) for arg in rest[1:]]
+    return Action(line, form[0], module, unquote(rest[0]), args)
+
+
+def read_command(line, text):
+    form = parse(text)
+    head = form[0]
+    if head == 'module':
+        return Module.from_form(line, text, form)
+    if head in ('invoke', 'get'):
+        return read_action(line, form)
+    if head == 'assert_return':
+        return AssertReturn(line, read_action(line, form[1]),
+                            [Const.from_form(f) for f in form[2:]])
+    if head in ('assert_trap', 'assert_exhaustion') and form[1][0] != 'module':
+        return AssertTrap(line, head, read_action(line, form[1]), unquote(form[2]))
+    if head.startswith('assert_'):
+        # The module text is cut out of the command text, the message is
+        # the last string of the command.
+        start = text.index('(', 1)
+        end = text.rindex('"', 0, text.rindex('"'))
+        module = text[start:end].rstrip()
+        return AssertModule(line, head, Module.from_form(line, module, form[1]),
+                            unquote(form[-1]))
+    if head == 'register':
+        return Register(line, unquote(form[1]), form[2] if len(form) > 2 else None)
+    raise ValueError('unknown command: ' + head)
+
+
+def read_script(filename, text):
+    """Build the Script of generated wast text."""
+    pieces = split_forms(text)
+    commands = []
+    line = 1
+    for interstitial, form in pieces:
+        line += interstitial.count('\n')
+        if form is None:
+            break
+        commands.append(read_command(line, form))
+        line += form.count('\n')
+    return Script(filename, commands, pieces)
+
+
+def render_wast(script):
+    return ''.join(interstitial + (form or '') for interstitial, form in script.pieces)
+
+
+def render_binary(script):
+    """The script text with the top-level text modules that could be encoded
+    replaced by their (module binary ...) forms."""
+    out = []
+    for i, (interstitial, form) in enumerate(script.pieces):
+        out.append(interstitial)
+        cmd = script.commands[i] if i < len(script.commands) else None
+        if isinstance(cmd, Module) and cmd.kind == 'text' and cmd.sections is not None:
+            form = binary_form(cmd.name, cmd.sections)
+        out.append(form or '')
+    return ''.join(out)
+
+
+def module_file(module, basename, index, files):
+    """Add the binary of a Module to files, or its text if it could not be
+    encoded, and return (filename, module type)."""
+    if module.sections is None:
+        filename = '{}.{}.wat'.format(basename, index)
+        files[filename] = (module.source if module.kind == 'quote' else module.text).encode()
+        return filename, 'text'
+    filename = '{}.{}.wasm'.format(basename, index)
+    files[filename] = b''.join(module.sections)
+    return filename, 'binary'
+
+
+def render_json(script):
+    """The wast2json style command list of a script, and the module files
+    it refers to, as (json text, {filename: bytes})."""
+    basename = os.path.splitext(os.path.basename(script.filename))[0]
+    files = {}
+    commands = []
+    for cmd in script.commands:
+        if isinstance(cmd, Module):
+            filename, module_type = module_file(cmd, basename, len(files), files)
+            entry = {'type': 'module', 'line': cmd.line, 'filename': filename}
+            if cmd.name:
+                entry['name'] = cmd.name
+        elif isinstance(cmd, Action):
+            entry = {'type': 'action', 'line': cmd.line, 'action': cmd.to_json()}
+        elif isinstance(cmd, AssertReturn):
+            entry = {'type': 'assert_return', 'line': cmd.line,
+                     'action': cmd.action.to_json(),
+                     'expected': [value.to_json() for value in cmd.expected]}
+        elif isinstance(cmd, AssertTrap):
+            entry = {'type': cmd.kind, 'line': cmd.line,
+                     'action': cmd.action.to_json(), 'text': cmd.text}
+        elif isinstance(cmd, AssertModule):
+            filename, module_type = module_file(cmd.module, basename, len(files), files)
+            entry = {'type': cmd.kind, 'line': cmd.line, 'filename': filename,
+                     'text': cmd.text, 'module_type': module_type}
+        else:
+            entry = {'type': 'register', 'line': cmd.line, 'as': cmd.name}
+            if cmd.module:
+                entry['name'] = cmd.module
+        commands.append(entry)
+    text = json.dumps({'source_filename': os.path.basename(script.filename),
+                       'commands': commands}, indent=1)
+    return text + '\n', files
+
+
+RENDERERS = ('wast', 'json', 'binary')
+
+
+class ScriptRenderer:
+    """Output sink that reads each generated file into a Script once and
+    renders it in every requested format. The wast and binary renderings
+    replace the file, json goes to json_dir next to it."""
+
+    def __init__(self, formats, write, json_dir='json'):
+        self.formats = formats
+        self.write = write
+        self.json_dir = json_dir
+
+    def __call__(self, wast_filename, text):
+        script = read_script(wast_filename, text)
+        if 'binary' in self.formats:
+            self.write(wast_filename, render_binary(script))
+        elif 'wast' in self.formats:
+            self.write(wast_filename, render_wast(script))
+        if 'json' in self.formats:
+            json_dir = os.path.join(os.path.dirname(wast_filename), self.json_dir)
+            json_text, files = render_json(script)
+            basename = os.path.splitext(os.path.basename(wast_filename))[0]
+            self.write(os.path.join(json_dir, basename + '.json'), json_text)
+            for filename, data in files.items():
+                write_file(os.path.join(json_dir, filename), data)
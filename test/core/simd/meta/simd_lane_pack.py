@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+"""
+Pack independent splat assertions into the lanes of a single assertion.
+
+Most generators splat one scalar into all lanes, so a file tests N values with
+N assert_return commands. For lane-wise operations, consecutive assertions of
+the same export whose arguments and result are all splats of the same lane
+type are independent per lane, and up to lane-count of them can be checked by
+one assertion that puts each case into its own lane. A comment above every
+packed assertion maps the lanes back to the original scalar cases.
+
+Packing only happens inside a run of assertions, comments and module
+definitions are never moved across.
+"""
+
+import re
+import sys
+
+from simd import SIMD
+from test_assert import AssertReturn
+from simd_output import write_file
+
+
+LANE_COUNT = {'i8x16': 16, 'i16x8': 8, 'i32x4': 4, 'i64x2': 2, 'f32x4': 4, 'f64x2': 2}
+
+# Exports that move data between lanes even when all operands and the result
+# have the same shape.
+NON_LANE_WISE = ('swizzle', 'shuffle', 'narrow', 'dot', 'extadd', 'extmul',
+                 'extract_lane', 'replace_lane', 'bitmask', 'all_true', 'any_true')
+
+ASSERT_RETURN = re.compile(
+        r'\(assert_return\s+\(invoke\s+"([^"]*)"((?:\s*\(v128\.const\s+[^()]*\))+)\s*\)\s*'
+        r'(\(v128\.const\s+[^()]*\))\s*\)$')
+V128_CONST = re.compile(r'\(v128\.const\s+(\w+)\s+([^()]*)\)')
+
+
+def form_end(text, start):
+    """Index just after the s-expression opening at text[start]."""
+    depth = 0
+    i = start
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c == '"':
+            i += 1
+            while i < n and text[i] != '"':
+                i += 2 if text[i] == '\\' else 1
+        elif text.startswith(';;', i):
+            i = text.find('\n', i)
+            if i < 0:
+                return n
+        elif text.startswith('(;', i):
+            i = text.find(';)', i) + 1
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return n
+
+
+def split_forms(text):
+    """Split wast text into a list of (interstitial text, top-level form)
+    pairs, followed by ('trailing text', None)."""
+    pieces = []
+    start = i = 0
+    n = len(text)
+    while i < n:
+        if text.startswith(';;', i):
+            i = text.find('\n', i)
+            if i < 0:
+                i = n
+        elif text.startswith('(;', i):
+            i = text.find(';)', i) + 2
+        elif text[i] == '(':
+            end = form_end(text, i)
+            pieces.append((text[start:i], text[i:end]))
+            start = i = end
+        else:
+            i += 1
+    pieces.append((text[start:], None))
+    return pieces
+
+
+def splat_key(form):
+    """(export, lane type, [param values], result value) when the form is an
+    assert_return of splat v128 constants of a single lane type, else None."""
+    match = ASSERT_RETURN.match(form)
+    if not match:
+        return None
+    export, params, result = match.groups()
+    if any(name in export for name in NON_LANE_WISE):
+        return None
+
+    lane_type = None
+    values = []
+    for const in V128_CONST.findall(params) + V128_CONST.findall(result):
+        const_type, lanes = const[0], const[1].split()
+        if lane_type is None:
+            lane_type = const_type
+        if const_type != lane_type or lane_type not in LANE_COUNT:
+            return None
+        if len(lanes) != LANE_COUNT[lane_type] or len(set(lanes)) != 1:
+            return None
+        values.append(lanes[0])
+
+    return export, lane_type, values[:-1], values[-1]
+
+
+def pack_run(run):
+    """Render a run of splat cases of one export as packed assertions."""
+    export, lane_type = run[0][0], run[0][1]
+    lane_cnt = LANE_COUNT[lane_type]
+    packed = []
+    for i in range(0, len(run), lane_cnt):
+        chunk = run[i:i + lane_cnt]
+        mapping = ' | '.join('{} -> {}'.format(' '.join(params), ret)
+                             for _, _, params, ret in chunk)
+        # Fill the remaining lanes with the last case.
+        lanes = chunk + [chunk[-1]] * (lane_cnt - len(chunk))
+        params = [SIMD.v128_const([case[2][j] for case in lanes], lane_type)
+                  for j in range(len(chunk[0][2]))]
+        result = SIMD.v128_const([case[3] for case in lanes], lane_type)
+        packed.append(';; lanes: ' + mapping)
+        packed.append(str(AssertReturn(export, params, result)))
+    return '\n'.join(packed)
+
+
+def pack_assertions(text):
+    """Pack consecutive splat assertions of lane-wise exports in wast text."""
+    out = []
+    run = []
+    run_forms = []
+
+    def flush():
+        if len(run) > 1:
+            out.append(pack_run(run))
+        elif run_forms:
+            out.append(run_forms[0])
+        run.clear()
+        run_forms.clear()
+
+    for interstitial, form in split_forms(text):
+        key = splat_key(form) if form else None
+        if run and (key is None or key[:2] != run[0][:2] or interstitial.strip()):
+            flush()
+        if key is None:
+            out.append(interstitial)
+            if form:
+                out.append(form)
+            continue
+        # Whitespace inside a run is regenerated by pack_run.
+        if not run:
+            out.append(interstitial)
+        run.append(key)
+        run_forms.append(form)
+
+    flush()
+    return ''.join(out)
+
+
+def pack_file(wast_filename):
+    with open(wast_filename) as fp:
+        text = fp.read()
+    packed = pack_assertions(text)
+    if packed != text:
+        write_file(wast_filename, packed)
+
+
+if __name__ == '__main__':
+    for wast_filename in sys.argv[1:]:
+        pack_file(wast_filename)
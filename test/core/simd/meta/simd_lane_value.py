@@ -6,30 +6,38 @@ class LaneValue:
     Suppose a bit number of the lane is n, then:
     For signed integer:
         minimum = -pow(2, n - 1), maximum = pow(2, n - 1) - 1
-    The bit number of the lane can be 8, 16, 32, 64"""
-    def __init__(self, lane_width):
-        """lane_width: bit number of each lane in SIMD v128"""
-        self.lane_width = lane_width
-
-    @property
-    def min(self):
-        return -pow(2, self.lane_width - 1)
+    The bit number of the lane can be 8, 16, 32, 64
 
-    @property
-    def max(self):
-        return pow(2, self.lane_width - 1) - 1
+    Instances are immutable and interned, LaneValue(n) always returns the same
+    object for the same n, with all the bounds computed once."""
 
-    @property
-    def mask(self):
-        return pow(2, self.lane_width) - 1
+    __slots__ = ('lane_width', 'min', 'max', 'mask', 'mod', 'quarter')
 
-    @property
-    def mod(self):
-        return pow(2, self.lane_width)
+    _instances = {}
 
-    @property
-    def quarter(self):
-        return pow(2, self.lane_width - 2)
+    def __new__(cls, lane_width):
+        """lane_width: bit number of each lane in SIMD v128"""
+        lane = cls._instances.get(lane_width)
+        if lane is None:
+            lane = super().__new__(cls)
+            init = super(LaneValue, lane).__setattr__
+            init('lane_width', lane_width)
+            init('min', -(1 << (lane_width - 1)))
+            init('max', (1 << (lane_width - 1)) - 1)
+            init('mask', (1 << lane_width) - 1)
+            init('mod', 1 << lane_width)
+            init('quarter', 1 << (lane_width - 2))
+            cls._instances[lane_width] = lane
+        return lane
+
+    def __setattr__(self, name, value):
+        raise AttributeError('LaneValue is immutable')
+
+    def __reduce__(self):
+        return LaneValue, (self.lane_width,)
+
+    def __repr__(self):
+        return 'LaneValue({})'.format(self.lane_width)
 
     def sat_s(self, v):
         return max(self.min, min(v, self.max))
@@ -1,19 +1,25 @@
 #!/usr/bin/env python3
 
 from simd import SIMD
-from test_assert import AssertReturn, AssertInvalid
+from test_assert import AssertReturn, AssertTrap, AssertInvalid
+from simd_output import write_wast
+from simd_memory import LinearMemory, Trap, PAGE_SIZE, v128_bytes, v128_lanes
 
 def list_stringify(l):
     return list(map(lambda x: str(x), l))
 
 """Base class for generating SIMD load lane tests. Subclasses only to:
     - define self.LANE_LEN, self.LANE_TYPE, self.NUM_LANES, self.MAX_ALIGN
-    - override get_normal_case to provide test data  (consult comments for details)
+
+The expected results are computed with a model of the module's memory.
 
 It generates test cases that:
     - load to all valid lane indices
     - load using memarg offset
     - load with memarg alignment
+    - load at other addresses, for each memarg offset and alignment,
+      keeping the other lanes
+    - load out of bounds, at the end of the memory, for each memarg offset
     - load with invalid lane index
     - load with invalid memarg alignment
     - fails typecheck
@@ -22,11 +28,63 @@ class SimdLoadLane:
     def valid_alignments(self):
         return [a for a in range(1, self.MAX_ALIGN+1) if a & (a-1) == 0]
 
+    # Contents of the data segment at address 0
+    DATA = bytes(range(16))
+
+    # Initial value of the sweep cases, distinct from the data and from 0
+    SWEEP_VALUE = bytes(range(0xf0, 0x100))
+
+    def lane_bits(self):
+        return int(self.LANE_LEN)
+
+    def new_memory(self):
+        return LinearMemory(data={0: self.DATA})
+
     def get_case_data(self):
-        # return value should be a list of tuples:
+        # return value is a list of tuples:
         #   (address to load from : i32, initial value : v128, return value : v128)
         # e.g. [(0, [0], [0x0100, 0, 0, 0, 0, 0, 0, 0]), ... ]
-        raise Exception("Subclasses should override this to provide test data")
+        # where lane i is loaded from address i.
+        memory = self.new_memory()
+        bits = self.lane_bits()
+        return [(idx, [0], v128_lanes(memory.load_lane(idx, bytes(16), bits, idx), bits))
+                for idx in range(self.NUM_LANES)]
+
+    # Memarg offsets of the sweep cases: none, unaligned and close to the end
+    # of the memory
+    SWEEP_OFFSETS = [0, 1, PAGE_SIZE - 16]
+
+    def sweep_addresses(self, offset):
+        # The start of the memory, an unaligned address, the end of the data,
+        # the last address in bounds, the first ones past it and -1, for an
+        # access of one lane with the offset.
+        size = self.lane_bits() // 8
+        last = PAGE_SIZE - size - offset
+        addresses = [0, 1, len(self.DATA) - size - offset, last, last + 1, PAGE_SIZE - offset, -1]
+        return sorted({addr for addr in addresses if addr >= 0}) + [-1]
+
+    def get_sweep_case_data(self):
+        # return value is a list of tuples:
+        #   (lane index, offset, alignment, address : i32, initial value : v128,
+        #    return value : v128 or trap message)
+        # for each memarg offset and alignment, over the sweep addresses. The
+        # out of bounds ones are only used for the first and last lane.
+        memory = self.new_memory()
+        bits = self.lane_bits()
+        initial = v128_lanes(self.SWEEP_VALUE, bits)
+        cases = []
+        for idx in range(self.NUM_LANES):
+            for offset in self.SWEEP_OFFSETS:
+                for align in self.valid_alignments():
+                    for addr in self.sweep_addresses(offset):
+                        try:
+                            ret = v128_lanes(memory.load_lane(addr, self.SWEEP_VALUE, bits, idx, offset), bits)
+                        except Trap as trap:
+                            if idx not in (0, self.NUM_LANES - 1):
+                                continue
+                            ret = str(trap)
+                        cases.append((idx, offset, align, addr, initial, ret))
+        return cases
 
     def get_normal_case(self):
         s = SIMD()
@@ -56,6 +114,19 @@ class SimdLoadLane:
                 instr = "v128.load{lane_len}_lane_{idx}_align_{align}".format(lane_len=self.LANE_LEN, idx=addr, align=align)
                 cases.append(str(AssertReturn(instr, [i32_addr, v128_val], v128_result)))
 
+        # load at other addresses and out of bounds
+        cases.append('\n;; other addresses, out of bounds')
+        for (idx, offset, align, addr, val, ret) in self.get_sweep_case_data():
+            i32_addr = s.const(addr, "i32")
+            v128_val = s.v128_const(list_stringify(val), self.LANE_TYPE)
+            instr = "v128.load{lane_len}_lane_{idx}_sweep_offset_{offset}_align_{align}".format(
+                lane_len=self.LANE_LEN, idx=idx, offset=offset, align=align)
+            if isinstance(ret, str):
+                cases.append(str(AssertTrap(instr, [i32_addr, v128_val], ret)))
+            else:
+                v128_result = s.v128_const(list_stringify(ret), self.LANE_TYPE)
+                cases.append(str(AssertReturn(instr, [i32_addr, v128_val], v128_result)))
+
         return '\n'.join(cases)
 
     def gen_test_func_template(self):
@@ -63,7 +134,7 @@ class SimdLoadLane:
             ';; Tests for load lane operations.\n\n',
             '(module',
             '  (memory 1)',
-            '  (data (i32.const 0) "\\00\\01\\02\\03\\04\\05\\06\\07\\08\\09\\0A\\0B\\0C\\0D\\0E\\0F")',
+            '  (data (i32.const 0) "{}")'.format(''.join('\\{:02X}'.format(b) for b in self.DATA)),
             ]
 
         lane_indices = list(range(self.NUM_LANES))
@@ -93,6 +164,16 @@ class SimdLoadLane:
                     '    (v128.load{lane_len}_lane align={align} {idx} (local.get $address) (local.get $x)))'
                     .format(idx=idx, lane_len=self.LANE_LEN, align=align))
 
+        # sweep of memarg offset and alignment
+        for idx in lane_indices:
+            for offset in self.SWEEP_OFFSETS:
+                for align in self.valid_alignments():
+                    template.append(
+                        '  (func (export "v128.load{lane_len}_lane_{idx}_sweep_offset_{offset}_align_{align}")\n'
+                        '    (param $address i32) (param $x v128) (result v128)\n'
+                        '    (v128.load{lane_len}_lane offset={offset} align={align} {idx} (local.get $address) (local.get $x)))'
+                        .format(idx=idx, lane_len=self.LANE_LEN, offset=offset, align=align))
+
         template.append(')\n')
         return template
 
@@ -142,9 +223,8 @@ class SimdLoadLane:
         return self.gen_test_template().format(**case_data)
 
     def gen_test_cases(self):
-        wast_filename = '../simd_load{lane_type}_lane.wast'.format(lane_type=self.LANE_LEN)
-        with open(wast_filename, 'w') as fp:
-            fp.write(self.get_all_cases())
+        wast_filename = 'simd_load{lane_type}_lane.wast'.format(lane_type=self.LANE_LEN)
+        write_wast(wast_filename, self.get_all_cases())
 
 class SimdLoad8Lane(SimdLoadLane):
     LANE_LEN = '8'
@@ -152,24 +232,6 @@ class SimdLoad8Lane(SimdLoadLane):
     NUM_LANES = 16
     MAX_ALIGN = 1
 
-    def get_case_data(self):
-        return [
-            (0, [0], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (1, [0], [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (2, [0], [0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (3, [0], [0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (4, [0], [0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (5, [0], [0, 0, 0, 0, 0, 5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (6, [0], [0, 0, 0, 0, 0, 0, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (7, [0], [0, 0, 0, 0, 0, 0, 0, 7, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (8, [0], [0, 0, 0, 0, 0, 0, 0, 0, 8, 0, 0, 0, 0, 0, 0, 0]),
-            (9, [0], [0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0]),
-            (10, [0], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 0, 0, 0, 0, 0]),
-            (11, [0], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11, 0, 0, 0, 0]),
-            (12, [0], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 0, 0, 0]),
-            (13, [0], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 0, 0]),
-            (14, [0], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14, 0]),
-            (15, [0], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15])]
 
 class SimdLoad16Lane(SimdLoadLane):
     LANE_LEN = '16'
@@ -177,16 +239,6 @@ class SimdLoad16Lane(SimdLoadLane):
     NUM_LANES = 8
     MAX_ALIGN = 2
 
-    def get_case_data(self):
-        return [
-            (0, [0], [0x0100, 0, 0, 0, 0, 0, 0, 0]),
-            (1, [0], [0, 0x0201, 0, 0, 0, 0, 0, 0]),
-            (2, [0], [0, 0, 0x0302, 0, 0, 0, 0, 0]),
-            (3, [0], [0, 0, 0, 0x0403, 0, 0, 0, 0]),
-            (4, [0], [0, 0, 0, 0, 0x0504, 0, 0, 0]),
-            (5, [0], [0, 0, 0, 0, 0, 0x0605, 0, 0]),
-            (6, [0], [0, 0, 0, 0, 0, 0, 0x0706, 0]),
-            (7, [0], [0, 0, 0, 0, 0, 0, 0, 0x0807])]
 
 class SimdLoad32Lane(SimdLoadLane):
     LANE_LEN = '32'
@@ -194,12 +246,6 @@ class SimdLoad32Lane(SimdLoadLane):
     NUM_LANES = 4
     MAX_ALIGN = 4
 
-    def get_case_data(self):
-        return [
-            (0, [0], [0x03020100, 0, 0, 0,]),
-            (1, [0], [0, 0x04030201, 0, 0,]),
-            (2, [0], [0, 0, 0x05040302, 0,]),
-            (3, [0], [0, 0, 0, 0x06050403,])]
 
 class SimdLoad64Lane(SimdLoadLane):
     LANE_LEN = '64'
@@ -207,10 +253,6 @@ class SimdLoad64Lane(SimdLoadLane):
     NUM_LANES = 2
     MAX_ALIGN = 8
 
-    def get_case_data(self):
-        return [
-            (0, [0], [0x0706050403020100, 0]),
-            (1, [0], [0, 0x0807060504030201])]
 
 def gen_test_cases():
     simd_load8_lane = SimdLoad8Lane()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""
+A model of linear memory for the expected results of memory instructions.
+
+Memory is a little-endian bytearray of whole pages. Loads and stores take
+the i32 address operand and the memarg offset, and raise Trap when the
+access is out of bounds, like the instructions they model. The memarg
+alignment is only a hint and does not change any result, so the model does
+not take it.
+"""
+
+PAGE_SIZE = 0x10000
+
+
+class Trap(Exception):
+    """The modelled instruction traps, the message is the one expected by
+    assert_trap."""
+
+
+def v128_bytes(lanes, lane_bits):
+    """The 16 bytes of a v128 given its lanes as integers, signed or not."""
+    size = lane_bits // 8
+    mask = (1 << lane_bits) - 1
+    return b''.join((lane & mask).to_bytes(size, 'little') for lane in lanes)
+
+
+def v128_lanes(data, lane_bits):
+    """The lanes of a v128 as unsigned integers."""
+    size = lane_bits // 8
+    return [int.from_bytes(data[i:i + size], 'little') for i in range(0, 16, size)]
+
+
+class LinearMemory:
+
+    def __init__(self, pages=1, data=None):
+        """data: optional {offset: bytes} of active data segments"""
+        self.bytes = bytearray(pages * PAGE_SIZE)
+        self.view = memoryview(self.bytes)
+        for offset, segment in (data or {}).items():
+            self.view[offset:offset + len(segment)] = segment
+
+    def effective_address(self, address, offset, size):
+        # The address operand is an i32 interpreted as unsigned.
+        ea = (address & 0xffffffff) + offset
+        if ea + size > len(self.bytes):
+            raise Trap('out of bounds memory access')
+        return ea
+
+    def load(self, address, size, offset=0):
+        """Load size bytes as an unsigned integer."""
+        ea = self.effective_address(address, offset, size)
+        return int.from_bytes(self.view[ea:ea + size], 'little')
+
+    def store(self, address, data, offset=0):
+        ea = self.effective_address(address, offset, len(data))
+        self.view[ea:ea + len(data)] = data
+
+    def load_lane(self, address, vector, lane_bits, lane_idx, offset=0):
+        """v128.loadN_lane: vector with lane lane_idx replaced by the N bits
+        at the address."""
+        size = lane_bits // 8
+        ea = self.effective_address(address, offset, size)
+        result = bytearray(vector)
+        result[lane_idx * size:(lane_idx + 1) * size] = self.view[ea:ea + size]
+        return bytes(result)
+
+    def store_lane(self, address, vector, lane_bits, lane_idx, offset=0):
+        """v128.storeN_lane: store lane lane_idx of vector at the address."""
+        size = lane_bits // 8
+        self.store(address, vector[lane_idx * size:(lane_idx + 1) * size], offset)
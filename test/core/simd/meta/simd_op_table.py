@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+"""
+Precomputed results of the narrow-lane integer reference ops.
+
+The 8-bit binary ops and the 16-bit unary ops have at most 65536 operand
+combinations, so their results are computed once with ArithmeticOp into a
+compact array indexed by the operand bits. The tables are built lazily on
+first use and cached on disk, later runs map the cache file into memory
+instead of computing them again. Rebuilding a table removes the cache files
+of older sources.
+
+A table only holds the results for operands in the signed range of the
+source lane, spelled as decimal integers, which is what the exhaustive
+sweeps use. For other spellings, e.g. min_s returns its operand as given,
+call ArithmeticOp directly.
+"""
+
+import os
+import mmap
+import hashlib
+from array import array
+from functools import lru_cache
+
+from simd_integer_op import ArithmeticOp
+
+
+META_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(META_DIR, '.op_tables')
+
+# Widest source lanes that are tabulated, for binary and unary ops.
+BINARY_WIDTH = 8
+UNARY_WIDTH = 16
+
+# The cache file starts with the typecode, padded to keep the values aligned.
+HEADER_SIZE = 4
+
+# Array typecodes from the smallest to the largest.
+TYPECODES = ('b', 'B', 'h', 'H', 'i')
+
+
+@lru_cache(maxsize=None)
+def source_digest():
+    """Digest of the reference op implementations, a cache file built from
+    other sources is stale."""
+    digest = hashlib.sha1()
+    for mod_filename in ('simd_integer_op.py', 'simd_lane_value.py', 'simd_op_table.py'):
+        with open(os.path.join(META_DIR, mod_filename), 'rb') as fp:
+            digest.update(fp.read())
+    return digest.hexdigest()[:12]
+
+
+def prune_stale_tables():
+    """Remove the cache files built from other sources, which are never
+    read again."""
+    suffix = '_{}.bin'.format(source_digest())
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith('.bin') and not name.endswith(suffix):
+            try:
+                os.remove(os.path.join(CACHE_DIR, name))
+            except OSError:
+                pass
+
+
+def smallest_typecode(values):
+    lo, hi = min(values), max(values)
+    for typecode in TYPECODES:
+        bits = array(typecode).itemsize * 8
+        if typecode.islower():
+            if -(1 << (bits - 1)) <= lo and hi < 1 << (bits - 1):
+                return typecode
+        elif lo >= 0 and hi < 1 << bits:
+            return typecode
+    raise ValueError('table values out of range')
+
+
+class OpTable:
+    """The results of one op on every operand of a narrow source lane.
+
+    table[a, b] or table[a] returns the result as an int.
+    """
+
+    _tables = {}
+
+    def __init__(self, op, arity, src_lane, dst_lane):
+        self.op = op
+        self.arity = arity
+        self.width = src_lane.lane_width
+        self.src_lane = src_lane
+        self.dst_lane = dst_lane
+        self.mask = src_lane.mask
+        self.values = self.load()
+
+    @classmethod
+    def get(cls, op, arity, src_lane, dst_lane=None):
+        """The table of op, built or loaded on first use."""
+        dst_lane = dst_lane or src_lane
+        limit = BINARY_WIDTH if arity == 2 else UNARY_WIDTH
+        if src_lane.lane_width > limit:
+            raise ValueError('{}-bit lanes are too wide for a table'.format(src_lane.lane_width))
+        key = (op, arity, src_lane.lane_width, dst_lane.lane_width)
+        table = cls._tables.get(key)
+        if table is None:
+            table = cls._tables[key] = cls(op, arity, src_lane, dst_lane)
+        return table
+
+    def __getitem__(self, operands):
+        if self.arity == 1:
+            return self.values[operands & self.mask]
+        a, b = operands
+        return self.values[(a & self.mask) << self.width | b & self.mask]
+
+    def compute(self):
+        o = ArithmeticOp(self.op)
+        lane = self.src_lane
+        operands = range(lane.min, lane.max + 1)
+        # Operands are laid out by their bits, 0 first, -1 last.
+        operands = list(operands[-lane.min:]) + list(operands[:-lane.min])
+        if self.arity == 1:
+            return [int(o.unary_op(a, self.dst_lane)) for a in operands]
+        return [int(o.binary_op(a, b, lane, self.dst_lane))
+                for a in operands for b in operands]
+
+    def cache_filename(self):
+        return os.path.join(CACHE_DIR, '{}_{}_{}_{}_{}.bin'.format(
+            self.op, self.arity, self.width, self.dst_lane.lane_width, source_digest()))
+
+    def load(self):
+        """Map the cached table, building the cache file if needed. Falls
+        back to an in-memory table if the cache can not be written."""
+        filename = self.cache_filename()
+        if not os.path.exists(filename):
+            values = self.compute()
+            typecode = smallest_typecode(values)
+            data = array(typecode, values)
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                tmp_filename = '{}.{}.tmp'.format(filename, os.getpid())
+                with open(tmp_filename, 'wb') as fp:
+                    fp.write(typecode.encode().ljust(HEADER_SIZE, b'\0'))
+                    data.tofile(fp)
+                os.replace(tmp_filename, filename)
+                prune_stale_tables()
+            except OSError:
+                return data
+
+        with open(filename, 'rb') as fp:
+            mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        typecode = chr(mapped[0])
+        return memoryview(mapped)[HEADER_SIZE:].cast(typecode)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+"""
+Output of the generated .wast files.
+
+Every generator hands its text to write_wast() instead of opening the file
+itself, so the front-end scripts can redirect the output, e.g. the benchmark
+collects it in memory without touching the tree.
+
+The generators name their files relative to the output directory, which is
+the parent of this directory unless redirected. Files are written to a
+temporary file first and renamed over the target, so an interrupted run
+never leaves a partially written file behind.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+META_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Callable taking (wast_filename, text), None writes to the file system.
+_sink = None
+
+# Directory the generated files are written to, None for the default.
+_out_dir = None
+
+# List the names of the files written are appended to, None to not record them.
+_written = None
+
+_umask = os.umask(0)
+os.umask(_umask)
+
+
+def output_dir():
+    """The output directory, relative to the current directory if it is the
+    default one."""
+    if _out_dir is not None:
+        return _out_dir
+    return os.path.relpath(os.path.dirname(META_DIR))
+
+
+def write_file(filename, data):
+    """Atomically replace filename with data, a str or bytes."""
+    dirname = os.path.dirname(filename) or '.'
+    os.makedirs(dirname, exist_ok=True)
+    fd, tmp_filename = tempfile.mkstemp(
+            dir=dirname, prefix='.' + os.path.basename(filename) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb' if isinstance(data, bytes) else 'w') as fp:
+            fp.write(data)
+        os.chmod(tmp_filename, 0o666 & ~_umask)
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        os.unlink(tmp_filename)
+        raise
+    if _written is not None:
+        _written.append(filename)
+
+
+def write_wast(wast_filename, text):
+    """Write a generated file, wast_filename is relative to the output
+    directory."""
+    wast_filename = os.path.join(output_dir(), wast_filename)
+    if _sink is not None:
+        _sink(wast_filename, text)
+        return
+    write_file(wast_filename, text)
+
+
+@contextmanager
+def redirect_output(sink):
+    """Send every write_wast() call in the block to sink(wast_filename, text)."""
+    global _sink
+    saved = _sink
+    _sink = sink
+    try:
+        yield
+    finally:
+        _sink = saved
+
+
+@contextmanager
+def record_written(written):
+    """Append the name of every file write_file() writes in the block to the
+    list written, whichever sink the text went through."""
+    global _written
+    saved = _written
+    _written = written
+    try:
+        yield
+    finally:
+        _written = saved
+
+
+@contextmanager
+def redirect_output_dir(out_dir):
+    """Write the generated files of the block under out_dir, None keeps the
+    current output directory."""
+    global _out_dir
+    saved = _out_dir
+    if out_dir is not None:
+        _out_dir = out_dir
+    try:
+        yield
+    finally:
+        _out_dir = saved
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+
+"""
+Generate seeded random differential tests for SIMD instructions.
+
+Each family draws random lane vectors for its instructions and computes the
+expected results lane by lane with the same reference ops that the other
+generators use. The same (count, seed) pair always yields the same corpus, and
+each family has its own random stream, so adding instructions to one family
+does not change the others. The output is a stress corpus for engines and is
+written to ../random, it is not checked in.
+"""
+
+import os
+import random
+import struct
+
+from simd import SIMD
+from test_assert import AssertReturn
+from simd_arithmetic import SimdArithmeticCase
+from simd_integer_op import ArithmeticOp
+from simd_float_op import FloatingPointCmpOp, FloatingPointRoundingOp
+from simd_f32x4_arith import F32ArithOp
+from simd_f64x2_arith import F64ArithOp
+from simd_int_trunc_sat_float import SimdI32x4TruncSatF32x4Case, SimdI32x4TruncSatF64x2Case
+from simd_output import write_wast
+
+
+LANE_VALUE = SimdArithmeticCase.LANE_VALUE
+LANE_COUNT = {'i8x16': 16, 'i16x8': 8, 'i32x4': 4, 'i64x2': 2, 'f32x4': 4, 'f64x2': 2}
+INT_LANE_TYPES = ('i8x16', 'i16x8', 'i32x4', 'i64x2')
+FLOAT_LANE_TYPES = ('f32x4', 'f64x2')
+
+# (mantissa bits, smallest denormal, smallest normal) of each float lane.
+FLOAT_FORMAT = {
+    'f32x4': (23, '0x1p-149', '0x1p-126'),
+    'f64x2': (52, '0x1p-1074', '0x1p-1022'),
+}
+
+
+class F32RoundedArithOp(F32ArithOp):
+    """F32ArithOp rounding results to single precision before the overflow
+    check, so results just above the maximum round down to it instead of
+    becoming infinity. Single rounding of the double result is exact for
+    add, sub, mul and div."""
+
+    def get_valid_float(self, value, maximum_literals, hex_form=False):
+        try:
+            value = struct.unpack('f', struct.pack('f', value))[0]
+        except OverflowError:
+            return 'inf' if value > 0 else '-inf'
+        return super().get_valid_float(value, maximum_literals, hex_form)
+
+
+class SimdRandomCase:
+    """Base class of a random test family. Subclasses define FAMILY and
+    get_instructions(), which returns a list of
+        (instruction, [param lane type, ...], result lane type, compute)
+    where compute maps the list of parameter lane vectors to the list of
+    result lanes."""
+
+    FAMILY = ''
+
+    # Probability of drawing a boundary value instead of a uniform one.
+    BOUNDARY_RATE = 0.125
+
+    # Exponent range of random floats, tight enough that the arithmetic
+    # results stay well inside the range of both float formats.
+    FLOAT_EXPONENTS = (-60, 60)
+
+    TEST_FUNC_TEMPLATE_HEADER = (
+            ';; Random tests for {family} SIMD operations.\n'
+            ';; Generated by gen_tests.py --random {count} --seed {seed}, '
+            'expected results come from the reference ops.\n\n')
+
+    def __init__(self, count, seed):
+        self.count = count
+        self.seed = seed
+        self.rng = random.Random('{}-{}'.format(seed, self.FAMILY))
+
+    def get_instructions(self):
+        raise Exception('Subclasses should override this to provide instructions')
+
+    def draw_int(self, lane_type):
+        lane = LANE_VALUE[lane_type]
+        if self.rng.random() < self.BOUNDARY_RATE:
+            return self.rng.choice((0, 1, -1, lane.min, lane.min + 1, lane.max, lane.max - 1))
+        return self.rng.randint(lane.min, lane.max)
+
+    def float_specials(self, lane_type):
+        _, denormal, normal = FLOAT_FORMAT[lane_type]
+        return ('0x0p+0', '-0x0p+0', denormal, '-' + denormal, normal, '-' + normal, 'inf', '-inf')
+
+    def draw_float(self, lane_type):
+        """Draw a float exactly representable in the lane, in hex form."""
+        if self.rng.random() < self.BOUNDARY_RATE:
+            return self.rng.choice(self.float_specials(lane_type))
+        mantissa_bits = FLOAT_FORMAT[lane_type][0]
+        mantissa = self.rng.getrandbits(mantissa_bits) | (1 << mantissa_bits)
+        exponent = self.rng.randint(*self.FLOAT_EXPONENTS)
+        value = mantissa * pow(2.0, exponent - mantissa_bits)
+        return (-value if self.rng.getrandbits(1) else value).hex()
+
+    def draw(self, lane_type):
+        if lane_type in FLOAT_LANE_TYPES:
+            return self.draw_float(lane_type)
+        return self.draw_int(lane_type)
+
+    def draw_vector(self, lane_type):
+        return [self.draw(lane_type) for _ in range(LANE_COUNT[lane_type])]
+
+    def gen_test_func_template(self, instructions):
+        template = [self.TEST_FUNC_TEMPLATE_HEADER.format(
+                family=self.FAMILY, count=self.count, seed=self.seed), '(module']
+
+        for name, params, _, _ in instructions:
+            operands = ' '.join('(local.get {})'.format(i) for i in range(len(params)))
+            template.append('  (func (export "{name}") (param{params}) (result v128) '
+                            '({name} {operands}))'.format(
+                                    name=name, params=' v128' * len(params), operands=operands))
+
+        template.append(')\n')
+        return template
+
+    def get_normal_case(self, instructions):
+        cases = []
+        for name, params, result, compute in instructions:
+            cases.append('\n;; {}'.format(name))
+            for _ in range(self.count):
+                operands = [self.draw_vector(lane_type) for lane_type in params]
+                ret = compute(operands)
+                cases.append(str(AssertReturn(
+                        name,
+                        [SIMD.v128_const([str(v) for v in operand], lane_type)
+                         for operand, lane_type in zip(operands, params)],
+                        SIMD.v128_const([str(v) for v in ret], result))))
+        return '\n'.join(cases)
+
+    def get_all_cases(self):
+        instructions = self.get_instructions()
+        template = self.gen_test_func_template(instructions)
+        template.append(self.get_normal_case(instructions))
+        return '\n'.join(template) + '\n'
+
+    def gen_test_cases(self, out_dir):
+        wast_filename = os.path.join(out_dir, 'simd_random_{}.wast'.format(self.FAMILY))
+        write_wast(wast_filename, self.get_all_cases())
+
+
+def lane_wise(fn):
+    """Lift a per-lane function of one or more operands to whole vectors."""
+    return lambda operands: [fn(*lanes) for lanes in zip(*operands)]
+
+
+def int_binary(op, lane_type):
+    o = ArithmeticOp(op)
+    lane = LANE_VALUE[lane_type]
+    return lane_wise(lambda a, b: o.binary_op(a, b, lane))
+
+
+def int_unary(op, lane_type):
+    o = ArithmeticOp(op)
+    lane = LANE_VALUE[lane_type]
+    return lane_wise(lambda a: o.unary_op(a, lane))
+
+
+def canonical_nan(result):
+    return 'nan:canonical' if 'nan' in result else result
+
+
+class SimdRandomIntArith(SimdRandomCase):
+    FAMILY = 'int_arith'
+
+    def get_instructions(self):
+        instructions = []
+        for lane_type in INT_LANE_TYPES:
+            ops = ['add', 'sub']
+            if lane_type != 'i8x16':
+                ops.append('mul')
+            if lane_type != 'i64x2':
+                ops.extend(['min_s', 'min_u', 'max_s', 'max_u'])
+            if lane_type in ('i8x16', 'i16x8'):
+                ops.append('avgr_u')
+            for op in ops:
+                instructions.append(('{}.{}'.format(lane_type, op), [lane_type] * 2,
+                                     lane_type, int_binary(op, lane_type)))
+            for op in ('neg', 'abs'):
+                instructions.append(('{}.{}'.format(lane_type, op), [lane_type],
+                                     lane_type, int_unary(op, lane_type)))
+        return instructions
+
+
+class SimdRandomSatArith(SimdRandomCase):
+    FAMILY = 'sat_arith'
+
+    def get_instructions(self):
+        return [('{}.{}'.format(lane_type, op), [lane_type] * 2, lane_type,
+                 int_binary(op, lane_type))
+                for lane_type in ('i8x16', 'i16x8')
+                for op in ('add_sat_s', 'add_sat_u', 'sub_sat_s', 'sub_sat_u')]
+
+
+class SimdRandomCompare(SimdRandomCase):
+    FAMILY = 'compare'
+
+    INT_OPS = ('eq', 'ne', 'lt_s', 'lt_u', 'le_s', 'le_u', 'gt_s', 'gt_u', 'ge_s', 'ge_u')
+    I64X2_OPS = ('eq', 'ne', 'lt_s', 'le_s', 'gt_s', 'ge_s')
+    FLOAT_OPS = ('eq', 'ne', 'lt', 'le', 'gt', 'ge')
+    FLOAT_RESULT = {'f32x4': 'i32x4', 'f64x2': 'i64x2'}
+
+    @staticmethod
+    def int_compare(op, lane_type):
+        lane = LANE_VALUE[lane_type]
+        signed = not op.endswith('_u')
+        cmp = {
+            'eq': lambda a, b: a == b,
+            'ne': lambda a, b: a != b,
+            'lt': lambda a, b: a < b,
+            'le': lambda a, b: a <= b,
+            'gt': lambda a, b: a > b,
+            'ge': lambda a, b: a >= b,
+        }[op.split('_')[0]]
+
+        def compute(a, b):
+            a = ArithmeticOp.get_valid_value(a, lane, signed=signed)
+            b = ArithmeticOp.get_valid_value(b, lane, signed=signed)
+            return '-1' if cmp(a, b) else '0'
+
+        return lane_wise(compute)
+
+    def get_instructions(self):
+        instructions = []
+        for lane_type in INT_LANE_TYPES:
+            ops = self.I64X2_OPS if lane_type == 'i64x2' else self.INT_OPS
+            for op in ops:
+                instructions.append(('{}.{}'.format(lane_type, op), [lane_type] * 2,
+                                     lane_type, self.int_compare(op, lane_type)))
+        fop = FloatingPointCmpOp()
+        for lane_type in FLOAT_LANE_TYPES:
+            for op in self.FLOAT_OPS:
+                instructions.append(('{}.{}'.format(lane_type, op), [lane_type] * 2,
+                                     self.FLOAT_RESULT[lane_type],
+                                     lane_wise(lambda a, b, op=op: fop.binary_op(op, a, b))))
+        return instructions
+
+
+class SimdRandomFloatArith(SimdRandomCase):
+    FAMILY = 'float_arith'
+
+    FLOAT_OP = {'f32x4': F32RoundedArithOp(), 'f64x2': F64ArithOp()}
+
+    def get_instructions(self):
+        instructions = []
+        for lane_type in FLOAT_LANE_TYPES:
+            fop = self.FLOAT_OP[lane_type]
+            for op in ('add', 'sub', 'mul', 'div'):
+                instructions.append(('{}.{}'.format(lane_type, op), [lane_type] * 2, lane_type,
+                                     lane_wise(lambda a, b, fop=fop, op=op:
+                                               canonical_nan(fop.binary_op(op, a, b)))))
+            instructions.append(('{}.sqrt'.format(lane_type), [lane_type], lane_type,
+                                 lane_wise(lambda a, fop=fop: canonical_nan(fop.float_sqrt(a)))))
+            instructions.append(('{}.neg'.format(lane_type), [lane_type], lane_type,
+                                 lane_wise(lambda a, fop=fop: fop.float_neg(a))))
+        return instructions
+
+
+class SimdRandomRounding(SimdRandomCase):
+    FAMILY = 'rounding'
+
+    # Most of the interesting values have both integer and fraction bits.
+    FLOAT_EXPONENTS = (-4, 60)
+
+    def get_instructions(self):
+        fop = FloatingPointRoundingOp()
+        return [('{}.{}'.format(lane_type, op), [lane_type], lane_type,
+                 lane_wise(lambda a, op=op: fop.unary_op(op, a)))
+                for lane_type in FLOAT_LANE_TYPES
+                for op in ('ceil', 'floor', 'trunc', 'nearest')]
+
+
+class SimdRandomConversion(SimdRandomCase):
+    FAMILY = 'conversion'
+
+    # Around the i32 range, so that saturation is exercised on both sides.
+    FLOAT_EXPONENTS = (-4, 40)
+
+    def float_specials(self, lane_type):
+        # The trunc_sat reference op expects an explicit sign on +inf.
+        return tuple('+inf' if v == 'inf' else v for v in super().float_specials(lane_type))
+
+    @staticmethod
+    def trunc_sat(case, op):
+        op_name = 'i32x4.' + op
+        lane_cnt = LANE_COUNT[case.SRC_LANE_TYPE]
+
+        def compute(operands):
+            results = [case.conversion_op(op_name, v) for v in operands[0]]
+            return results + ['0'] * (LANE_COUNT['i32x4'] - lane_cnt)
+
+        return op_name, [case.SRC_LANE_TYPE], 'i32x4', compute
+
+    @staticmethod
+    def extend(dst, src, half, signed):
+        op_name = '{}.extend_{}_{}_{}'.format(dst, half, src, 's' if signed else 'u')
+        lane = LANE_VALUE[src]
+        lane_cnt = LANE_COUNT[dst]
+        start = 0 if half == 'low' else lane_cnt
+
+        def compute(operands):
+            return [ArithmeticOp.get_valid_value(v, lane, signed=signed)
+                    for v in operands[0][start:start + lane_cnt]]
+
+        return op_name, [src], dst, compute
+
+    def get_instructions(self):
+        instructions = []
+        for case in (SimdI32x4TruncSatF32x4Case(), SimdI32x4TruncSatF64x2Case()):
+            for op in case.UNARY_OPS:
+                instructions.append(self.trunc_sat(case, op))
+        for dst, src in (('i16x8', 'i8x16'), ('i32x4', 'i16x8'), ('i64x2', 'i32x4')):
+            for half in ('low', 'high'):
+                for signed in (True, False):
+                    instructions.append(self.extend(dst, src, half, signed))
+        return instructions
+
+
+class SimdRandomExtMul(SimdRandomCase):
+    FAMILY = 'extmul'
+
+    @staticmethod
+    def extmul(dst, src, half, sign):
+        op = 'extmul_{}_{}_{}'.format(half, src, sign)
+        o = ArithmeticOp(op)
+        src_lane, dst_lane = LANE_VALUE[src], LANE_VALUE[dst]
+        lane_cnt = LANE_COUNT[dst]
+        start = 0 if half == 'low' else lane_cnt
+
+        def compute(operands):
+            a, b = (v[start:start + lane_cnt] for v in operands)
+            return [o.binary_op(x, y, src_lane, dst_lane) for x, y in zip(a, b)]
+
+        return '{}.{}'.format(dst, op), [src] * 2, dst, compute
+
+    def get_instructions(self):
+        return [self.extmul(dst, src, half, sign)
+                for dst, src in (('i16x8', 'i8x16'), ('i32x4', 'i16x8'), ('i64x2', 'i32x4'))
+                for half in ('low', 'high')
+                for sign in ('s', 'u')]
+
+
+class SimdRandomDot(SimdRandomCase):
+    FAMILY = 'dot'
+
+    def get_instructions(self):
+        i16, i32 = LANE_VALUE['i16x8'], LANE_VALUE['i32x4']
+
+        def compute(operands):
+            products = [x * y for x, y in zip(*operands)]
+            return [ArithmeticOp.get_valid_value(products[i] + products[i + 1], i32)
+                    for i in range(0, len(products), 2)]
+
+        return [('i32x4.dot_i16x8_s', ['i16x8'] * 2, 'i32x4', compute)]
+
+
+class SimdRandomQ15MulR(SimdRandomCase):
+    FAMILY = 'q15mulr'
+
+    def get_instructions(self):
+        return [('i16x8.q15mulr_sat_s', ['i16x8'] * 2, 'i16x8',
+                 int_binary('q15mulr_sat_s', 'i16x8'))]
+
+
+FAMILIES = (
+    SimdRandomIntArith,
+    SimdRandomSatArith,
+    SimdRandomCompare,
+    SimdRandomFloatArith,
+    SimdRandomRounding,
+    SimdRandomConversion,
+    SimdRandomExtMul,
+    SimdRandomDot,
+    SimdRandomQ15MulR,
+)
+
+
+def gen_random_test_cases(count, seed, out_dir='random'):
+    for family in FAMILIES:
+        family(count, seed).gen_test_cases(out_dir)
+
+
+if __name__ == '__main__':
+    gen_random_test_cases(100, 0)
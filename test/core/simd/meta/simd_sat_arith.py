@@ -7,19 +7,20 @@ Generate saturating integer arithmetic operation cases.
 from simd_arithmetic import SimdArithmeticCase
 from test_assert import AssertReturn
 from simd import SIMD
+from simd_output import write_wast
 
 
 class SimdSaturateArithmeticCases(SimdArithmeticCase):
     UNARY_OPS = ()
     BINARY_OPS = ('add_sat_s', 'add_sat_u',
                   'sub_sat_s', 'sub_sat_u')
+    EXHAUSTIVE_FILENAME = 'simd_{lane_type}_sat_arith_exhaustive_{shard:02d}.wast'
     malformed_template = '(assert_malformed (module quote\n    "(func (result v128) ' \
                          '({lane_type}.{op} ({operand_1}) ({operand_2})))")\n    "unknown operator")'
 
     def gen_test_cases(self):
-        wast_filename = '../simd_{lane_type}_sat_arith.wast'.format(lane_type=self.LANE_TYPE)
-        with open(wast_filename, 'w') as fp:
-            fp.write(self.get_all_cases())
+        wast_filename = 'simd_{lane_type}_sat_arith.wast'.format(lane_type=self.LANE_TYPE)
+        write_wast(wast_filename, self.get_all_cases())
 
     def gen_test_template(self):
         return super().gen_test_template().replace('{invalid_cases}',
@@ -452,5 +453,10 @@ def gen_test_cases():
     simd_i16x8_sat_arith.gen_test_cases()
 
 
+def gen_exhaustive_test_cases():
+    simd_i8x16_sat_arith = SimdI8x16SaturateArithmeticCases()
+    simd_i8x16_sat_arith.gen_exhaustive_test_cases()
+
+
 if __name__ == '__main__':
     gen_test_cases()
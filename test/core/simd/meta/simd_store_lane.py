@@ -1,19 +1,26 @@
 #!/usr/bin/env python3
 
 from simd import SIMD
-from test_assert import AssertReturn, AssertInvalid
+from test_assert import AssertReturn, AssertTrap, AssertInvalid
+from simd_output import write_wast
+from simd_memory import LinearMemory, Trap, PAGE_SIZE, v128_lanes
 
 def list_stringify(l):
     return list(map(lambda x: str(x), l))
 
 """Base class for generating SIMD store lane tests. Subclasses only to:
     - define self.LANE_LEN, self.LANE_TYPE, self.NUM_LANES, self.MAX_ALIGN
-    - override get_normal_case to provide test data  (consult comments for details)
+
+The expected results are computed by running the body of each test function
+on a model of the module's memory, in the order of the assertions.
 
 It generates test cases that:
     - store to all valid lane indices
     - store using memarg offset
     - store with memarg alignment
+    - store at other addresses, for each memarg offset and alignment,
+      storing only the lane
+    - store out of bounds, at the end of the memory, for each memarg offset
     - store with invalid lane index
     - store with invalid memarg alignment
     - fails typecheck
@@ -22,40 +29,136 @@ class SimdStoreLane:
     def valid_alignments(self):
         return [a for a in range(1, self.MAX_ALIGN+1) if a & (a-1) == 0]
 
+    # Bytes stored by the lane i cases are VALUE[i:i + lane size]
+    VALUE = bytes(range(16))
+
+    # Value of the sweep cases, distinct from 0 in every lane
+    SWEEP_VALUE = bytes(range(0xf0, 0x100))
+
+    def lane_bits(self):
+        return int(self.LANE_LEN)
+
     def get_case_data(self):
-        # return value should be a list of tuples:
-        #   (address to store to : i32, v128, return value : v128)
+        # return value is a list of tuples:
+        #   (address to store to : i32, v128)
         # e.g. [(0, [0x0100, 0, 0, 0, 0, 0, 0, 0]), ... ]
-        # the expected result is return_value[address].
-        raise Exception("Subclasses should override this to provide test data")
+        # where lane i is stored to address i.
+        bits = self.lane_bits()
+        size = bits // 8
+        cases = []
+        for idx in range(self.NUM_LANES):
+            vector = bytearray(16)
+            vector[idx * size:(idx + 1) * size] = self.VALUE[idx:idx + size]
+            cases.append((idx, v128_lanes(vector, bits)))
+        return cases
+
+    # Memarg offsets of the sweep cases: none, unaligned and close to the end
+    # of the memory
+    SWEEP_OFFSETS = [0, 1, PAGE_SIZE - 16]
+
+    # Instructions the sweep functions load the stored lane back with, and
+    # reset it with, by lane size
+    LANE_LOAD = {1: 'i64.load8_u', 2: 'i64.load16_u', 4: 'i64.load32_u', 8: 'i64.load'}
+    LANE_STORE = {1: 'i64.store8', 2: 'i64.store16', 4: 'i64.store32', 8: 'i64.store'}
+
+    def sweep_addresses(self, offset):
+        # The start of the memory, an unaligned address, the last address in
+        # bounds, the first ones past it and -1, for an access of one lane
+        # with the offset.
+        size = self.lane_bits() // 8
+        last = PAGE_SIZE - size - offset
+        addresses = [0, 1, last, last + 1, PAGE_SIZE - offset]
+        return sorted({addr for addr in addresses if addr >= 0}) + [-1]
+
+    def get_sweep_case_data(self):
+        # return value is a list of tuples:
+        #   (lane index, offset, alignment, address : i32, v128)
+        # for each memarg offset and alignment, over the sweep addresses. The
+        # out of bounds ones are only used for the first and last lane.
+        size = self.lane_bits() // 8
+        value = v128_lanes(self.SWEEP_VALUE, self.lane_bits())
+        cases = []
+        for idx in range(self.NUM_LANES):
+            for offset in self.SWEEP_OFFSETS:
+                for align in self.valid_alignments():
+                    for addr in self.sweep_addresses(offset):
+                        if (addr & 0xffffffff) + offset + size > PAGE_SIZE and idx not in (0, self.NUM_LANES - 1):
+                            continue
+                        cases.append((idx, offset, align, addr, value))
+        return cases
+
+    def call(self, memory, kind, idx, addr, lanes):
+        """Run the body of the test function of lane idx: store the lane,
+        load an i64 back and reset the v128 at the address to 0. Returns the
+        i64, or the trap message."""
+        bits = self.lane_bits()
+        vector = b''.join(lane.to_bytes(bits // 8, 'little') for lane in lanes)
+        offset = idx if kind == 'offset' else 0
+        try:
+            memory.store_lane(addr, vector, bits, idx, offset)
+            ret = memory.load(addr, 8, offset)
+            if kind == 'align':
+                memory.store(0, bytes(16), idx)
+            else:
+                memory.store(addr, bytes(16), offset)
+        except Trap as trap:
+            return str(trap)
+        return ret
+
+    def call_sweep(self, memory, idx, offset, addr, lanes):
+        """Run the body of a sweep test function: store the lane, load it
+        back and reset it to 0. Returns the lane, or the trap message."""
+        bits = self.lane_bits()
+        size = bits // 8
+        vector = b''.join(lane.to_bytes(size, 'little') for lane in lanes)
+        try:
+            memory.store_lane(addr, vector, bits, idx, offset)
+            ret = memory.load(addr, size, offset)
+            memory.store(addr, bytes(size), offset)
+        except Trap as trap:
+            return str(trap)
+        return ret
 
     def get_normal_case(self):
         s = SIMD()
         cases = []
+        memory = LinearMemory()
+
+        def case(instr, params, ret):
+            if isinstance(ret, str):
+                cases.append(str(AssertTrap(instr, params, ret)))
+            else:
+                cases.append(str(AssertReturn(instr, params, s.const(ret, "i64"))))
 
         # store using arg
-        for (addr, ret) in self.get_case_data():
+        for (addr, val) in self.get_case_data():
             i32_addr = s.const(addr, "i32")
-            v128_val = s.v128_const(list_stringify(ret), self.LANE_TYPE)
-            result = s.const(ret[addr], "i64")
+            v128_val = s.v128_const(list_stringify(val), self.LANE_TYPE)
             instr = "v128.store{lane_len}_lane_{idx}".format(lane_len=self.LANE_LEN, idx=addr)
-            cases.append(str(AssertReturn(instr, [i32_addr, v128_val], result)))
+            case(instr, [i32_addr, v128_val], self.call(memory, 'arg', addr, addr, val))
 
         # store using offset
-        for (addr, ret) in self.get_case_data():
-            v128_val = s.v128_const(list_stringify(ret), self.LANE_TYPE)
-            result = s.const(ret[addr], "i64")
+        for (addr, val) in self.get_case_data():
+            v128_val = s.v128_const(list_stringify(val), self.LANE_TYPE)
             instr = "v128.store{lane_len}_lane_{idx}_offset_{idx}".format(lane_len=self.LANE_LEN, idx=addr)
-            cases.append(str(AssertReturn(instr, [v128_val], result)))
+            case(instr, [v128_val], self.call(memory, 'offset', addr, 0, val))
 
         # store using offset with alignment
-        for (addr, ret) in self.get_case_data():
+        for (addr, val) in self.get_case_data():
             for align in self.valid_alignments():
                 i32_addr = s.const(addr, "i32")
-                v128_val = s.v128_const(list_stringify(ret), self.LANE_TYPE)
-                result = s.const(ret[addr], "i64")
+                v128_val = s.v128_const(list_stringify(val), self.LANE_TYPE)
                 instr = "v128.store{lane_len}_lane_{idx}_align_{align}".format(lane_len=self.LANE_LEN, idx=addr, align=align)
-                cases.append(str(AssertReturn(instr, [i32_addr, v128_val], result)))
+                case(instr, [i32_addr, v128_val], self.call(memory, 'align', addr, addr, val))
+
+        # store at other addresses and out of bounds
+        cases.append('\n;; other addresses, out of bounds')
+        for (idx, offset, align, addr, val) in self.get_sweep_case_data():
+            i32_addr = s.const(addr, "i32")
+            v128_val = s.v128_const(list_stringify(val), self.LANE_TYPE)
+            instr = "v128.store{lane_len}_lane_{idx}_sweep_offset_{offset}_align_{align}".format(
+                lane_len=self.LANE_LEN, idx=idx, offset=offset, align=align)
+            case(instr, [i32_addr, v128_val], self.call_sweep(memory, idx, offset, addr, val))
 
         return '\n'.join(cases)
 
@@ -103,6 +206,22 @@ class SimdStoreLane:
                     '    (local.get $ret))'
                     .format(idx=idx, lane_len=self.LANE_LEN, align=align))
 
+        # sweep of memarg offset and alignment, loading back and resetting
+        # only the lane
+        size = self.lane_bits() // 8
+        for idx in lane_indices:
+            for offset in self.SWEEP_OFFSETS:
+                for align in self.valid_alignments():
+                    template.append(
+                        '  (func (export "v128.store{lane_len}_lane_{idx}_sweep_offset_{offset}_align_{align}")\n'
+                        '    (param $address i32) (param $x v128) (result i64) (local $ret i64)\n'
+                        '    (v128.store{lane_len}_lane offset={offset} align={align} {idx} (local.get $address) (local.get $x))\n'
+                        '    (local.set $ret ({load} offset={offset} (local.get $address)))\n'
+                        '    ({store} offset={offset} (local.get $address) (i64.const 0))\n'
+                        '    (local.get $ret))'
+                        .format(idx=idx, lane_len=self.LANE_LEN, offset=offset, align=align,
+                                load=self.LANE_LOAD[size], store=self.LANE_STORE[size]))
+
         template.append(')\n')
         return template
 
@@ -152,9 +271,8 @@ class SimdStoreLane:
         return self.gen_test_template().format(**case_data)
 
     def gen_test_cases(self):
-        wast_filename = '../simd_store{lane_type}_lane.wast'.format(lane_type=self.LANE_LEN)
-        with open(wast_filename, 'w') as fp:
-            fp.write(self.get_all_cases())
+        wast_filename = 'simd_store{lane_type}_lane.wast'.format(lane_type=self.LANE_LEN)
+        write_wast(wast_filename, self.get_all_cases())
 
 class SimdStore8Lane(SimdStoreLane):
     LANE_LEN = '8'
@@ -162,24 +280,6 @@ class SimdStore8Lane(SimdStoreLane):
     NUM_LANES = 16
     MAX_ALIGN = 1
 
-    def get_case_data(self):
-        return [
-            (0, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (1, [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (2, [0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (3, [0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (4, [0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (5, [0, 0, 0, 0, 0, 5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (6, [0, 0, 0, 0, 0, 0, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (7, [0, 0, 0, 0, 0, 0, 0, 7, 0, 0, 0, 0, 0, 0, 0, 0]),
-            (8, [0, 0, 0, 0, 0, 0, 0, 0, 8, 0, 0, 0, 0, 0, 0, 0]),
-            (9, [0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0]),
-            (10, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 0, 0, 0, 0, 0]),
-            (11, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11, 0, 0, 0, 0]),
-            (12, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 0, 0, 0]),
-            (13, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 0, 0]),
-            (14, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14, 0]),
-            (15, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15])]
 
 class SimdStore16Lane(SimdStoreLane):
     LANE_LEN = '16'
@@ -187,16 +287,6 @@ class SimdStore16Lane(SimdStoreLane):
     NUM_LANES = 8
     MAX_ALIGN = 2
 
-    def get_case_data(self):
-        return [
-            (0, [0x0100, 0, 0, 0, 0, 0, 0, 0]),
-            (1, [0, 0x0201, 0, 0, 0, 0, 0, 0]),
-            (2, [0, 0, 0x0302, 0, 0, 0, 0, 0]),
-            (3, [0, 0, 0, 0x0403, 0, 0, 0, 0]),
-            (4, [0, 0, 0, 0, 0x0504, 0, 0, 0]),
-            (5, [0, 0, 0, 0, 0, 0x0605, 0, 0]),
-            (6, [0, 0, 0, 0, 0, 0, 0x0706, 0]),
-            (7, [0, 0, 0, 0, 0, 0, 0, 0x0807])]
 
 class SimdStore32Lane(SimdStoreLane):
     LANE_LEN = '32'
@@ -204,12 +294,6 @@ class SimdStore32Lane(SimdStoreLane):
     NUM_LANES = 4
     MAX_ALIGN = 4
 
-    def get_case_data(self):
-        return [
-            (0, [0x03020100, 0, 0, 0,]),
-            (1, [0, 0x04030201, 0, 0,]),
-            (2, [0, 0, 0x05040302, 0,]),
-            (3, [0, 0, 0, 0x06050403,])]
 
 class SimdStore64Lane(SimdStoreLane):
     LANE_LEN = '64'
@@ -217,10 +301,6 @@ class SimdStore64Lane(SimdStoreLane):
     NUM_LANES = 2
     MAX_ALIGN = 8
 
-    def get_case_data(self):
-        return [
-            (0, [0x0706050403020100, 0]),
-            (1, [0, 0x0807060504030201])]
 
 def gen_test_cases():
     simd_store8_lane = SimdStore8Lane()
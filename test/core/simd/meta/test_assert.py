@@ -3,8 +3,8 @@
 
 """
 This python file is a tool class for test generation.
-Currently only the 'AssertReturn' class that is used
-to generate the 'assert_return' assertion.
+Currently the 'AssertReturn' and 'AssertTrap' classes that are used
+to generate the 'assert_return' and 'assert_trap' assertions.
 TODO: Add more assertions
 """
 
@@ -12,9 +12,7 @@ TODO: Add more assertions
 # Generate assert_return to test
 class AssertReturn:
 
-    op = ''
-    params = ''
-    expected_result = ''
+    __slots__ = ('op', 'params', 'expected_result')
 
     def __init__(self, op, params, expected_result):
 
@@ -51,6 +49,29 @@ class AssertReturn:
         return '{assert_head}{params}){expected_result})'.format(assert_head=assert_return, params=''.join(params), expected_result=''.join(results))
 
 
+# Generate assert_trap to test
+class AssertTrap:
+
+    __slots__ = ('op', 'params', 'message')
+
+    def __init__(self, op, params, message):
+        if isinstance(params, str):
+            params = [params]
+
+        self.op = op
+        self.params = params
+        self.message = message
+
+    def __str__(self):
+        assert_trap = '(assert_trap (invoke "{}"'.format(self.op)
+        head_len = len(assert_trap)
+        white_space = '\n ' + ' ' * head_len
+        params = white_space.join(self.params)
+        if params:
+            params = ' ' + params
+        return '{}{}){}"{}")'.format(assert_trap, params, white_space, self.message)
+
+
 # Generate assert_invalid to test
 class AssertInvalid:
 
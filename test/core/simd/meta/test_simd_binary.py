@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+
+"""
+Tests of the binary module encoder, run with:
+
+    python3 -m unittest test_simd_binary
+"""
+
+import unittest
+
+from simd_binary import (encode_module, binary_module, binary_modules, int_value,
+                         float_bits, string_bytes, EncodeError)
+
+
+HEADER = b'\x00asm\x01\x00\x00\x00'
+
+
+class IntValueTest(unittest.TestCase):
+
+    def test_decimal(self):
+        self.assertEqual(int_value('42', 32), 42)
+        self.assertEqual(int_value('+42', 32), 42)
+        self.assertEqual(int_value('1_000', 32), 1000)
+
+    def test_leading_zeros(self):
+        self.assertEqual(int_value('007', 8), 7)
+        self.assertEqual(int_value('-007', 8), 0xf9)
+
+    def test_hex(self):
+        self.assertEqual(int_value('0xff', 8), 0xff)
+        self.assertEqual(int_value('-0x1', 8), 0xff)
+        self.assertEqual(int_value('0x8000_0000', 32), 0x80000000)
+
+    def test_signed(self):
+        self.assertEqual(int_value('-1', 32), 0xffffffff)
+        self.assertEqual(int_value('-128', 8), 0x80)
+
+    def test_out_of_range(self):
+        for token in ('256', '-129', '0x1_0000'):
+            with self.assertRaises(EncodeError):
+                int_value(token, 8)
+
+
+class FloatBitsTest(unittest.TestCase):
+    F32 = (8, 23)
+    F64 = (11, 52)
+
+    def test_decimal(self):
+        self.assertEqual(float_bits('1.0', self.F32), 0x3f800000)
+        self.assertEqual(float_bits('-2', self.F32), 0xc0000000)
+        self.assertEqual(float_bits('0.1', self.F64), 0x3fb999999999999a)
+
+    def test_hex(self):
+        self.assertEqual(float_bits('0x1p-149', self.F32), 0x00000001)
+        self.assertEqual(float_bits('-0x1.fffffep127', self.F32), 0xff7fffff)
+
+    def test_zero_inf_nan(self):
+        self.assertEqual(float_bits('-0.0', self.F32), 0x80000000)
+        self.assertEqual(float_bits('inf', self.F32), 0x7f800000)
+        self.assertEqual(float_bits('-nan', self.F32), 0xffc00000)
+        self.assertEqual(float_bits('nan:0x200000', self.F32), 0x7fa00000)
+
+    def test_round_to_nearest_even(self):
+        # 1 + 2^-24 is halfway between 1 and the next f32, and rounds to 1.
+        self.assertEqual(float_bits('0x1.000001p0', self.F32), 0x3f800000)
+        self.assertEqual(float_bits('0x1.000003p0', self.F32), 0x3f800002)
+
+    def test_out_of_range(self):
+        with self.assertRaises(EncodeError):
+            float_bits('0x1p128', self.F32)
+
+
+class EncodeModuleTest(unittest.TestCase):
+
+    def test_empty(self):
+        self.assertEqual(encode_module('(module)'), HEADER)
+
+    def test_memory(self):
+        self.assertEqual(encode_module('(module (memory 1))'),
+                         HEADER + b'\x05\x03\x01\x00\x01')
+        self.assertEqual(encode_module('(module (memory $m 1 2))'),
+                         HEADER + b'\x05\x04\x01\x01\x01\x02')
+
+    def test_func(self):
+        self.assertEqual(
+            encode_module('(module (func (export "f") (param i32) (result i32)'
+                          ' (local.get 0)))'),
+            HEADER +
+            b'\x01\x06\x01\x60\x01\x7f\x01\x7f' +   # type
+            b'\x03\x02\x01\x00' +                   # func
+            b'\x07\x05\x01\x01f\x00\x00' +          # export
+            b'\x0a\x06\x01\x04\x00\x20\x00\x0b')    # code
+
+    def test_named_locals(self):
+        self.assertEqual(
+            encode_module('(module (func (param $x i64) (local $y i64) (local $z i64)'
+                          ' (local.set $z (local.get $x))))'),
+            HEADER +
+            b'\x01\x05\x01\x60\x01\x7e\x00' +
+            b'\x03\x02\x01\x00' +
+            b'\x0a\x0a\x01\x08\x01\x02\x7e\x20\x00\x21\x02\x0b')
+
+    def test_consts(self):
+        code = encode_module('(module (func (i32.const -1) (i64.const 0x80) (f32.const 1)'
+                             ' (drop) (drop) (drop)))')
+        self.assertTrue(code.endswith(
+            b'\x41\x7f\x42\x80\x01\x43\x00\x00\x80\x3f\x1a\x1a\x1a\x0b'))
+
+    def test_simd(self):
+        code = encode_module('(module (func (result v128)'
+                             ' (i32x4.add (v128.const i32x4 1 2 3 4)'
+                             ' (v128.const i8x16 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 -1))))')
+        self.assertTrue(code.endswith(
+            b'\xfd\x0c' + bytes([1, 0, 0, 0, 2, 0, 0, 0, 3, 0, 0, 0, 4, 0, 0, 0]) +
+            b'\xfd\x0c' + bytes(15) + b'\xff' +
+            b'\xfd\xae\x01\x0b'))
+
+    def test_memarg_and_lane(self):
+        code = encode_module('(module (memory 1) (func (param v128)'
+                             ' (v128.store16_lane offset=2 align=1 7 (i32.const 0)'
+                             ' (local.get 0))))')
+        self.assertTrue(code.endswith(b'\x41\x00\x20\x00\xfd\x59\x00\x02\x07\x0b'))
+
+    def test_block(self):
+        code = encode_module('(module (func (result i32)'
+                             ' (block $l (result i32) (i32.const 1))))')
+        self.assertTrue(code.endswith(b'\x02\x7f\x41\x01\x0b\x0b'))
+
+    def test_global_and_data(self):
+        self.assertEqual(
+            encode_module('(module (memory 1) (data (i32.const 16) "a\\01")'
+                          ' (global $g (mut i32) (i32.const 0))'
+                          ' (func (global.set $g (global.get $g))))'),
+            HEADER +
+            b'\x01\x04\x01\x60\x00\x00' +
+            b'\x03\x02\x01\x00' +
+            b'\x05\x03\x01\x00\x01' +
+            b'\x06\x06\x01\x7f\x01\x41\x00\x0b' +
+            b'\x0a\x08\x01\x06\x00\x23\x00\x24\x00\x0b' +
+            b'\x0b\x08\x01\x00\x41\x10\x0b\x02a\x01')
+
+    def test_string_bytes(self):
+        self.assertEqual(string_bytes('"a\\n\\"\\ff\\u{e9}"'), b'a\n"\xff\xc3\xa9')
+
+
+class FallbackTest(unittest.TestCase):
+    """Modules outside of the supported subset raise EncodeError, and are
+    left as text by binary_modules."""
+
+    UNSUPPORTED = [
+        '(module (memory (data "ab")))',
+        '(module (memory (import "m" "mem") 1))',
+        '(module (memory i64 1))',
+        '(module (func (import "m" "f")))',
+        '(module (func (type 0)))',
+        '(module (global (import "m" "g") i32))',
+        '(module (data "passive"))',
+        '(module (table 1 funcref))',
+        '(module (func (param i128)))',
+        '(module (func (call 0)))',
+        '(module (func (i32.const)))',
+        '(module (func (block (result i32 i32))))',
+    ]
+
+    def test_encode_error(self):
+        for text in self.UNSUPPORTED:
+            with self.subTest(text=text), self.assertRaises(EncodeError):
+                encode_module(text)
+
+    def test_left_as_text(self):
+        for text in self.UNSUPPORTED:
+            with self.subTest(text=text):
+                self.assertEqual(binary_modules(text), text)
+
+    def test_mixed_script(self):
+        script = ('(module $a (memory 1))\n'
+                  '(module $b (memory (data "ab")))\n'
+                  '(module binary "\\00asm\\01\\00\\00\\00")\n'
+                  '(assert_return (invoke $a "f") (i32.const 0))\n')
+        self.assertEqual(
+            binary_modules(script),
+            '(module $a binary\n'
+            '  "\\00asm"\n'
+            '  "\\01\\00\\00\\00"\n'
+            '  "\\05\\03\\01\\00\\01"\n'
+            ')\n'
+            '(module $b (memory (data "ab")))\n'
+            '(module binary "\\00asm\\01\\00\\00\\00")\n'
+            '(assert_return (invoke $a "f") (i32.const 0))\n')
+
+    def test_binary_module_id(self):
+        self.assertTrue(binary_module('(module $m)').startswith('(module $m binary'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+"""
+Tests of the test script IR and its renderers, run with:
+
+    python3 -m unittest test_simd_ir
+"""
+
+import json
+import unittest
+
+from simd_ir import AssertModule, read_script, render_wast, render_binary, render_json
+
+
+SCRIPT = '''\
+(module $m (memory 1))
+(module $n (memory (data "ab")))
+(module binary "\\00asm\\01\\00\\00\\00")
+(assert_malformed (module quote "(memory)") "malformed")
+(assert_return (invoke $m "f" (i32.const -1)) (i32.const 1))
+'''
+
+
+class ReadScriptTest(unittest.TestCase):
+
+    def setUp(self):
+        self.script = read_script('simd_test.wast', SCRIPT)
+
+    def test_modules(self):
+        m, n, b, malformed = self.script.commands[:4]
+        self.assertEqual((m.name, m.kind), ('$m', 'text'))
+        self.assertEqual([s for s in m.sections if s],
+                         [b'\x00asm', b'\x01\x00\x00\x00', b'\x05\x03\x01\x00\x01'])
+        self.assertEqual((n.kind, n.sections), ('text', None))
+        self.assertEqual((b.kind, b.sections), ('binary', [b'\x00asm\x01\x00\x00\x00']))
+        self.assertIsInstance(malformed, AssertModule)
+        self.assertEqual((malformed.module.kind, malformed.module.source), ('quote', '(memory)'))
+
+    def test_render_wast(self):
+        self.assertEqual(render_wast(self.script), SCRIPT)
+
+    def test_render_binary(self):
+        lines = render_binary(self.script).splitlines()
+        self.assertEqual(lines[:5], ['(module $m binary', '  "\\00asm"',
+                                     '  "\\01\\00\\00\\00"', '  "\\05\\03\\01\\00\\01"', ')'])
+        self.assertEqual(lines[5:], SCRIPT.splitlines()[1:])
+
+    def test_render_binary_uses_records(self):
+        module = self.script.commands[0]
+        module.sections = [b'\x00asm\x01\x00\x00\x00']
+        self.assertTrue(render_binary(self.script).startswith(
+            '(module $m binary\n  "\\00asm\\01\\00\\00\\00"\n)\n'))
+        module.sections = None
+        self.assertEqual(render_binary(self.script).splitlines()[:3], SCRIPT.splitlines()[:3])
+
+    def test_render_json(self):
+        text, files = render_json(self.script)
+        commands = json.loads(text)['commands']
+        self.assertEqual([(c['type'], c['filename']) for c in commands[:4]],
+                         [('module', 'simd_test.0.wasm'), ('module', 'simd_test.1.wat'),
+                          ('module', 'simd_test.2.wasm'),
+                          ('assert_malformed', 'simd_test.3.wat')])
+        self.assertEqual(files['simd_test.0.wasm'],
+                         b'\x00asm\x01\x00\x00\x00\x05\x03\x01\x00\x01')
+        self.assertEqual(files['simd_test.1.wat'], b'(module $n (memory (data "ab")))')
+        self.assertEqual(files['simd_test.3.wat'], b'(memory)')
+        self.assertEqual(commands[4]['action']['args'],
+                         [{'type': 'i32', 'value': '4294967295'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -100,6 +100,150 @@
   (func (export "v128.load16_lane_7_align_2")
     (param $address i32) (param $x v128) (result v128)
     (v128.load16_lane align=2 7 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_0_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_0_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=2 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_0_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_0_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=2 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_0_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_0_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=2 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_1_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_1_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=2 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_1_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_1_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=2 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_1_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_1_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=2 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_2_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=1 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_2_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=2 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_2_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=1 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_2_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=2 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_2_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=1 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_2_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=2 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_3_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=1 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_3_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=2 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_3_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=1 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_3_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=2 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_3_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=1 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_3_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=2 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_4_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=1 4 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_4_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=2 4 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_4_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=1 4 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_4_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=2 4 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_4_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=1 4 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_4_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=2 4 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_5_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=1 5 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_5_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=2 5 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_5_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=1 5 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_5_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=2 5 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_5_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=1 5 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_5_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=2 5 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_6_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=1 6 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_6_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=2 6 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_6_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=1 6 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_6_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=2 6 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_6_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=1 6 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_6_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=2 6 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_7_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=1 7 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_7_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=0 align=2 7 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_7_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=1 7 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_7_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=1 align=2 7 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_7_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=1 7 (local.get $address) (local.get $x)))
+  (func (export "v128.load16_lane_7_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load16_lane offset=65520 align=2 7 (local.get $address) (local.get $x)))
 )
 
 (assert_return (invoke "v128.load16_lane_0" (i32.const 0)
@@ -191,6 +335,644 @@
                                                     (v128.const i16x8 0 0 0 0 0 0 0 0))
                                                     (v128.const i16x8 0 0 0 0 0 0 0 2055))
 
+;; other addresses, out of bounds
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 256 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 513 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_0_align_1" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 3854 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_0_align_1" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 0 62450 62964 63478 63992 64506 65020 65534))
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_0_align_1" (i32.const 65535)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_0_align_1" (i32.const 65536)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_0_align_1" (i32.const -1)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 256 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 513 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_0_align_2" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 3854 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_0_align_2" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 0 62450 62964 63478 63992 64506 65020 65534))
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_0_align_2" (i32.const 65535)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_0_align_2" (i32.const 65536)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_0_align_2" (i32.const -1)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 513 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 770 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_1_align_1" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 3854 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_1_align_1" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 0 62450 62964 63478 63992 64506 65020 65534))
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_1_align_1" (i32.const 65534)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_1_align_1" (i32.const 65535)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_1_align_1" (i32.const -1)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 513 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 770 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_1_align_2" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 3854 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_1_align_2" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 0 62450 62964 63478 63992 64506 65020 65534))
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_1_align_2" (i32.const 65534)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_1_align_2" (i32.const 65535)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_1_align_2" (i32.const -1)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 0 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 0 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_65520_align_1" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 0 62450 62964 63478 63992 64506 65020 65534))
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_65520_align_1" (i32.const 15)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_65520_align_1" (i32.const 16)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_65520_align_1" (i32.const -1)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 0 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 0 62450 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_0_sweep_offset_65520_align_2" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 0 62450 62964 63478 63992 64506 65020 65534))
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_65520_align_2" (i32.const 15)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_65520_align_2" (i32.const 16)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_0_sweep_offset_65520_align_2" (i32.const -1)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 256 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 513 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_0_align_1" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 3854 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_0_align_1" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 0 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 256 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 513 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_0_align_2" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 3854 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_0_align_2" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 0 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 513 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 770 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_1_align_1" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 3854 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_1_align_1" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 0 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 513 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 770 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_1_align_2" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 3854 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_1_align_2" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 0 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 0 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 0 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_65520_align_1" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 0 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 0 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 0 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_1_sweep_offset_65520_align_2" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 0 62964 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 256 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 513 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_0_align_1" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 3854 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_0_align_1" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 0 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 256 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 513 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_0_align_2" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 3854 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_0_align_2" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 0 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 513 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 770 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_1_align_1" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 3854 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_1_align_1" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 0 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 513 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 770 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_1_align_2" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 3854 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_1_align_2" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 0 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 0 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 0 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_65520_align_1" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 0 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 0 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 0 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_2_sweep_offset_65520_align_2" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 0 63478 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 256 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 513 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_0_align_1" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 3854 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_0_align_1" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 0 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 256 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 513 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_0_align_2" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 3854 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_0_align_2" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 0 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 513 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 770 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_1_align_1" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 3854 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_1_align_1" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 0 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 513 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 770 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_1_align_2" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 3854 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_1_align_2" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 0 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 0 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 0 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_65520_align_1" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 0 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 0 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 0 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_3_sweep_offset_65520_align_2" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 0 63992 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 256 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 513 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_0_align_1" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 3854 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_0_align_1" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 0 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 256 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 513 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_0_align_2" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 3854 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_0_align_2" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 0 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 513 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 770 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_1_align_1" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 3854 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_1_align_1" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 0 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 513 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 770 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_1_align_2" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 3854 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_1_align_2" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 0 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 0 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 0 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_65520_align_1" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 0 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 0 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 0 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_4_sweep_offset_65520_align_2" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 0 64506 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 256 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 513 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_0_align_1" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 3854 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_0_align_1" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 0 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 256 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 513 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_0_align_2" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 3854 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_0_align_2" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 0 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 513 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 770 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_1_align_1" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 3854 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_1_align_1" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 0 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 513 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 770 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_1_align_2" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 3854 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_1_align_2" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 0 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 0 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 0 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_65520_align_1" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 0 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 0 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 0 65020 65534))
+(assert_return (invoke "v128.load16_lane_5_sweep_offset_65520_align_2" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 0 65020 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 256 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 513 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_0_align_1" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 3854 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_0_align_1" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 0 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 256 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 513 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_0_align_2" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 3854 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_0_align_2" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 0 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 513 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 770 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_1_align_1" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 3854 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_1_align_1" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 0 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 513 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 770 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_1_align_2" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 3854 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_1_align_2" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 0 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 0 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 0 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_65520_align_1" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 0 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 0 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 0 65534))
+(assert_return (invoke "v128.load16_lane_6_sweep_offset_65520_align_2" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 0 65534))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 256))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 513))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_0_align_1" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 3854))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_0_align_1" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 0))
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_0_align_1" (i32.const 65535)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_0_align_1" (i32.const 65536)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_0_align_1" (i32.const -1)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 256))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 513))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_0_align_2" (i32.const 14)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 3854))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_0_align_2" (i32.const 65534)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 0))
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_0_align_2" (i32.const 65535)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_0_align_2" (i32.const 65536)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_0_align_2" (i32.const -1)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 513))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 770))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_1_align_1" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 3854))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_1_align_1" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 0))
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_1_align_1" (i32.const 65534)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_1_align_1" (i32.const 65535)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_1_align_1" (i32.const -1)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 513))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 770))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_1_align_2" (i32.const 13)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 3854))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_1_align_2" (i32.const 65533)
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                   (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 0))
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_1_align_2" (i32.const 65534)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_1_align_2" (i32.const 65535)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_1_align_2" (i32.const -1)
+                                                                 (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 0))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 0))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_65520_align_1" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 0))
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_65520_align_1" (i32.const 15)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_65520_align_1" (i32.const 16)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_65520_align_1" (i32.const -1)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 0))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 0))
+(assert_return (invoke "v128.load16_lane_7_sweep_offset_65520_align_2" (i32.const 14)
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                       (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 0))
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_65520_align_2" (i32.const 15)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_65520_align_2" (i32.const 16)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load16_lane_7_sweep_offset_65520_align_2" (i32.const -1)
+                                                                     (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                     "out of bounds memory access")
+
 ;; type check
 (assert_invalid  (module (memory 1)
           (func (param $x v128) (result v128)
@@ -64,6 +64,114 @@
   (func (export "v128.load32_lane_3_align_4")
     (param $address i32) (param $x v128) (result v128)
     (v128.load32_lane align=4 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_0_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_0_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=2 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_0_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=4 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_0_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_0_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=2 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_0_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=4 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_0_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_0_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=2 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_0_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=4 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_1_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_1_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=2 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_1_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=4 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_1_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_1_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=2 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_1_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=4 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_1_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_1_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=2 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_1_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=4 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_2_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=1 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_2_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=2 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_2_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=4 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_2_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=1 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_2_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=2 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_2_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=4 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_2_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=1 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_2_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=2 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_2_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=4 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_3_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=1 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_3_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=2 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_3_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=0 align=4 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_3_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=1 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_3_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=2 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_3_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=1 align=4 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_3_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=1 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_3_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=2 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load32_lane_3_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load32_lane offset=65520 align=4 3 (local.get $address) (local.get $x)))
 )
 
 (assert_return (invoke "v128.load32_lane_0" (i32.const 0)
@@ -123,6 +231,566 @@
                                                     (v128.const i32x4 0 0 0 0))
                                                     (v128.const i32x4 0 0 0 100992003))
 
+;; other addresses, out of bounds
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 50462976 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 67305985 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_1" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 252579084 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_1" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_0_align_1" (i32.const 65533)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_0_align_1" (i32.const 65536)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_0_align_1" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 50462976 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 67305985 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_2" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 252579084 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_2" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_0_align_2" (i32.const 65533)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_0_align_2" (i32.const 65536)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_0_align_2" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_4" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 50462976 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_4" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 67305985 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_4" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 252579084 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_0_align_4" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_0_align_4" (i32.const 65533)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_0_align_4" (i32.const 65536)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_0_align_4" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 67305985 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 84148994 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_1" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 252579084 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_1" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_1_align_1" (i32.const 65532)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_1_align_1" (i32.const 65535)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_1_align_1" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 67305985 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 84148994 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_2" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 252579084 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_2" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_1_align_2" (i32.const 65532)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_1_align_2" (i32.const 65535)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_1_align_2" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_4" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 67305985 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_4" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 84148994 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_4" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 252579084 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_1_align_4" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_1_align_4" (i32.const 65532)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_1_align_4" (i32.const 65535)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_1_align_4" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_65520_align_1" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_65520_align_1" (i32.const 13)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_65520_align_1" (i32.const 16)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_65520_align_1" (i32.const -1)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_65520_align_2" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_65520_align_2" (i32.const 13)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_65520_align_2" (i32.const 16)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_65520_align_2" (i32.const -1)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_65520_align_4" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_65520_align_4" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_0_sweep_offset_65520_align_4" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 0 4160157172 4227529208 4294901244))
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_65520_align_4" (i32.const 13)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_65520_align_4" (i32.const 16)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_0_sweep_offset_65520_align_4" (i32.const -1)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 50462976 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 67305985 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_1" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 252579084 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_1" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 50462976 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 67305985 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_2" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 252579084 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_2" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_4" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 50462976 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_4" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 67305985 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_4" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 252579084 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_0_align_4" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 67305985 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 84148994 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_1" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 252579084 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_1" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 67305985 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 84148994 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_2" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 252579084 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_2" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_4" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 67305985 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_4" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 84148994 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_4" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 252579084 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_1_align_4" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_65520_align_1" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_65520_align_2" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_65520_align_4" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_65520_align_4" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_1_sweep_offset_65520_align_4" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 0 4227529208 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 50462976 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 67305985 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_1" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 252579084 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_1" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 50462976 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 67305985 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_2" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 252579084 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_2" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_4" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 50462976 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_4" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 67305985 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_4" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 252579084 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_0_align_4" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 67305985 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 84148994 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_1" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 252579084 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_1" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 67305985 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 84148994 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_2" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 252579084 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_2" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_4" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 67305985 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_4" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 84148994 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_4" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 252579084 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_1_align_4" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_65520_align_1" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_65520_align_2" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_65520_align_4" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_65520_align_4" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_2_sweep_offset_65520_align_4" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 0 4294901244))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 50462976))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 67305985))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_1" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 252579084))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_1" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_0_align_1" (i32.const 65533)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_0_align_1" (i32.const 65536)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_0_align_1" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 50462976))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 67305985))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_2" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 252579084))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_2" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_0_align_2" (i32.const 65533)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_0_align_2" (i32.const 65536)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_0_align_2" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_4" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 50462976))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_4" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 67305985))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_4" (i32.const 12)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 252579084))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_0_align_4" (i32.const 65532)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_0_align_4" (i32.const 65533)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_0_align_4" (i32.const 65536)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_0_align_4" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 67305985))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 84148994))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_1" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 252579084))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_1" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_1_align_1" (i32.const 65532)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_1_align_1" (i32.const 65535)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_1_align_1" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 67305985))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 84148994))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_2" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 252579084))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_2" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_1_align_2" (i32.const 65532)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_1_align_2" (i32.const 65535)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_1_align_2" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_4" (i32.const 0)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 67305985))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_4" (i32.const 1)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 84148994))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_4" (i32.const 11)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 252579084))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_1_align_4" (i32.const 65531)
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                   (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_1_align_4" (i32.const 65532)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_1_align_4" (i32.const 65535)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_1_align_4" (i32.const -1)
+                                                                 (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_65520_align_1" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_65520_align_1" (i32.const 13)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_65520_align_1" (i32.const 16)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_65520_align_1" (i32.const -1)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_65520_align_2" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_65520_align_2" (i32.const 13)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_65520_align_2" (i32.const 16)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_65520_align_2" (i32.const -1)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_65520_align_4" (i32.const 0)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_65520_align_4" (i32.const 1)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_return (invoke "v128.load32_lane_3_sweep_offset_65520_align_4" (i32.const 12)
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                       (v128.const i32x4 4092785136 4160157172 4227529208 0))
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_65520_align_4" (i32.const 13)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_65520_align_4" (i32.const 16)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load32_lane_3_sweep_offset_65520_align_4" (i32.const -1)
+                                                                     (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                     "out of bounds memory access")
+
 ;; type check
 (assert_invalid  (module (memory 1)
           (func (param $x v128) (result v128)
@@ -40,6 +40,78 @@
   (func (export "v128.load64_lane_1_align_8")
     (param $address i32) (param $x v128) (result v128)
     (v128.load64_lane align=8 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=0 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=0 align=2 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=0 align=4 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_0_align_8")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=0 align=8 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=1 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=1 align=2 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=1 align=4 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_1_align_8")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=1 align=8 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=65520 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=65520 align=2 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=65520 align=4 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_0_sweep_offset_65520_align_8")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=65520 align=8 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=0 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=0 align=2 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=0 align=4 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_0_align_8")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=0 align=8 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=1 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=1 align=2 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=1 align=4 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_1_align_8")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=1 align=8 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=65520 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=65520 align=2 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=65520 align=4 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load64_lane_1_sweep_offset_65520_align_8")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load64_lane offset=65520 align=8 1 (local.get $address) (local.get $x)))
 )
 
 (assert_return (invoke "v128.load64_lane_0" (i32.const 0)
@@ -77,6 +149,488 @@
                                                     (v128.const i64x2 0 0))
                                                     (v128.const i64x2 0 578437695752307201))
 
+;; other addresses, out of bounds
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 506097522914230528 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 578437695752307201 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_1" (i32.const 8)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 1084818905618843912 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_1" (i32.const 65528)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_1" (i32.const 65529)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_1" (i32.const 65536)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_1" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 506097522914230528 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 578437695752307201 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_2" (i32.const 8)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 1084818905618843912 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_2" (i32.const 65528)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_2" (i32.const 65529)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_2" (i32.const 65536)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_2" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_4" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 506097522914230528 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_4" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 578437695752307201 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_4" (i32.const 8)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 1084818905618843912 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_4" (i32.const 65528)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_4" (i32.const 65529)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_4" (i32.const 65536)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_4" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_8" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 506097522914230528 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_8" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 578437695752307201 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_8" (i32.const 8)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 1084818905618843912 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_0_align_8" (i32.const 65528)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_8" (i32.const 65529)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_8" (i32.const 65536)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_0_align_8" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 578437695752307201 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 650777868590383874 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_1" (i32.const 7)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 1084818905618843912 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_1" (i32.const 65527)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_1" (i32.const 65528)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_1" (i32.const 65535)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_1" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 578437695752307201 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 650777868590383874 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_2" (i32.const 7)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 1084818905618843912 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_2" (i32.const 65527)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_2" (i32.const 65528)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_2" (i32.const 65535)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_2" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_4" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 578437695752307201 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_4" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 650777868590383874 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_4" (i32.const 7)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 1084818905618843912 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_4" (i32.const 65527)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_4" (i32.const 65528)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_4" (i32.const 65535)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_4" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_8" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 578437695752307201 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_8" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 650777868590383874 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_8" (i32.const 7)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 1084818905618843912 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_1_align_8" (i32.const 65527)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_8" (i32.const 65528)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_8" (i32.const 65535)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_1_align_8" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_1" (i32.const 8)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_1" (i32.const 9)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_1" (i32.const 16)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_1" (i32.const -1)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_2" (i32.const 8)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_2" (i32.const 9)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_2" (i32.const 16)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_2" (i32.const -1)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_4" (i32.const 0)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_4" (i32.const 1)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_4" (i32.const 8)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_4" (i32.const 9)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_4" (i32.const 16)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_4" (i32.const -1)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_8" (i32.const 0)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_8" (i32.const 1)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_return (invoke "v128.load64_lane_0_sweep_offset_65520_align_8" (i32.const 8)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 0 18446460386757245432))
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_8" (i32.const 9)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_8" (i32.const 16)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_0_sweep_offset_65520_align_8" (i32.const -1)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 506097522914230528))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 578437695752307201))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_1" (i32.const 8)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 1084818905618843912))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_1" (i32.const 65528)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_1" (i32.const 65529)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_1" (i32.const 65536)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_1" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_2" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 506097522914230528))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_2" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 578437695752307201))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_2" (i32.const 8)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 1084818905618843912))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_2" (i32.const 65528)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_2" (i32.const 65529)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_2" (i32.const 65536)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_2" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_4" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 506097522914230528))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_4" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 578437695752307201))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_4" (i32.const 8)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 1084818905618843912))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_4" (i32.const 65528)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_4" (i32.const 65529)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_4" (i32.const 65536)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_4" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_8" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 506097522914230528))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_8" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 578437695752307201))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_8" (i32.const 8)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 1084818905618843912))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_0_align_8" (i32.const 65528)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_8" (i32.const 65529)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_8" (i32.const 65536)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_0_align_8" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 578437695752307201))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 650777868590383874))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_1" (i32.const 7)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 1084818905618843912))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_1" (i32.const 65527)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_1" (i32.const 65528)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_1" (i32.const 65535)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_1" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_2" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 578437695752307201))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_2" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 650777868590383874))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_2" (i32.const 7)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 1084818905618843912))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_2" (i32.const 65527)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_2" (i32.const 65528)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_2" (i32.const 65535)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_2" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_4" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 578437695752307201))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_4" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 650777868590383874))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_4" (i32.const 7)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 1084818905618843912))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_4" (i32.const 65527)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_4" (i32.const 65528)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_4" (i32.const 65535)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_4" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_8" (i32.const 0)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 578437695752307201))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_8" (i32.const 1)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 650777868590383874))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_8" (i32.const 7)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 1084818905618843912))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_1_align_8" (i32.const 65527)
+                                                                   (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                   (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_8" (i32.const 65528)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_8" (i32.const 65535)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_1_align_8" (i32.const -1)
+                                                                 (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_1" (i32.const 8)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_1" (i32.const 9)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_1" (i32.const 16)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_1" (i32.const -1)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_2" (i32.const 0)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_2" (i32.const 1)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_2" (i32.const 8)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_2" (i32.const 9)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_2" (i32.const 16)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_2" (i32.const -1)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_4" (i32.const 0)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_4" (i32.const 1)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_4" (i32.const 8)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_4" (i32.const 9)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_4" (i32.const 16)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_4" (i32.const -1)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_8" (i32.const 0)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_8" (i32.const 1)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_return (invoke "v128.load64_lane_1_sweep_offset_65520_align_8" (i32.const 8)
+                                                                       (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                       (v128.const i64x2 17867739004052632048 0))
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_8" (i32.const 9)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_8" (i32.const 16)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load64_lane_1_sweep_offset_65520_align_8" (i32.const -1)
+                                                                     (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                     "out of bounds memory access")
+
 ;; type check
 (assert_invalid  (module (memory 1)
           (func (param $x v128) (result v128)
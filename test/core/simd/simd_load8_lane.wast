@@ -148,6 +148,150 @@
   (func (export "v128.load8_lane_15_align_1")
     (param $address i32) (param $x v128) (result v128)
     (v128.load8_lane align=1 15 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_0_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_0_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_0_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 0 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_1_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_1_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_1_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 1 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_2_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_2_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_2_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 2 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_3_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_3_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_3_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 3 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_4_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 4 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_4_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 4 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_4_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 4 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_5_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 5 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_5_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 5 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_5_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 5 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_6_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 6 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_6_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 6 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_6_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 6 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_7_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 7 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_7_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 7 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_7_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 7 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_8_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 8 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_8_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 8 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_8_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 8 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_9_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 9 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_9_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 9 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_9_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 9 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_10_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 10 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_10_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 10 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_10_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 10 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_11_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 11 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_11_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 11 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_11_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 11 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_12_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 12 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_12_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 12 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_12_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 12 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_13_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 13 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_13_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 13 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_13_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 13 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_14_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 14 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_14_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 14 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_14_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 14 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_15_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=0 align=1 15 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_15_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=1 align=1 15 (local.get $address) (local.get $x)))
+  (func (export "v128.load8_lane_15_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result v128)
+    (v128.load8_lane offset=65520 align=1 15 (local.get $address) (local.get $x)))
 )
 
 (assert_return (invoke "v128.load8_lane_0" (i32.const 0)
@@ -279,6 +423,572 @@
                                                     (v128.const i8x16 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0))
                                                     (v128.const i8x16 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 15))
 
+;; other addresses, out of bounds
+(assert_return (invoke "v128.load8_lane_0_sweep_offset_0_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 0 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_0_sweep_offset_0_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 1 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_0_sweep_offset_0_align_1" (i32.const 15)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 15 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_0_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 0 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_trap (invoke "v128.load8_lane_0_sweep_offset_0_align_1" (i32.const 65536)
+                                                                (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                "out of bounds memory access")
+(assert_trap (invoke "v128.load8_lane_0_sweep_offset_0_align_1" (i32.const -1)
+                                                                (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                "out of bounds memory access")
+(assert_return (invoke "v128.load8_lane_0_sweep_offset_1_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 1 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_0_sweep_offset_1_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 2 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_0_sweep_offset_1_align_1" (i32.const 14)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 15 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_0_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 0 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_trap (invoke "v128.load8_lane_0_sweep_offset_1_align_1" (i32.const 65535)
+                                                                (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                "out of bounds memory access")
+(assert_trap (invoke "v128.load8_lane_0_sweep_offset_1_align_1" (i32.const -1)
+                                                                (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                "out of bounds memory access")
+(assert_return (invoke "v128.load8_lane_0_sweep_offset_65520_align_1" (i32.const 0)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 0 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_0_sweep_offset_65520_align_1" (i32.const 1)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 0 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_0_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 0 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_trap (invoke "v128.load8_lane_0_sweep_offset_65520_align_1" (i32.const 16)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    "out of bounds memory access")
+(assert_trap (invoke "v128.load8_lane_0_sweep_offset_65520_align_1" (i32.const -1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    "out of bounds memory access")
+(assert_return (invoke "v128.load8_lane_1_sweep_offset_0_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 0 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_1_sweep_offset_0_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 1 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_1_sweep_offset_0_align_1" (i32.const 15)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 15 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_1_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 0 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_1_sweep_offset_1_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 1 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_1_sweep_offset_1_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 2 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_1_sweep_offset_1_align_1" (i32.const 14)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 15 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_1_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 0 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_1_sweep_offset_65520_align_1" (i32.const 0)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 0 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_1_sweep_offset_65520_align_1" (i32.const 1)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 0 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_1_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 0 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_2_sweep_offset_0_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 0 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_2_sweep_offset_0_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 1 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_2_sweep_offset_0_align_1" (i32.const 15)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 15 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_2_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 0 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_2_sweep_offset_1_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 1 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_2_sweep_offset_1_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 2 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_2_sweep_offset_1_align_1" (i32.const 14)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 15 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_2_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 0 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_2_sweep_offset_65520_align_1" (i32.const 0)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 0 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_2_sweep_offset_65520_align_1" (i32.const 1)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 0 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_2_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 0 243 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_3_sweep_offset_0_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 0 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_3_sweep_offset_0_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 1 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_3_sweep_offset_0_align_1" (i32.const 15)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 15 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_3_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 0 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_3_sweep_offset_1_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 1 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_3_sweep_offset_1_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 2 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_3_sweep_offset_1_align_1" (i32.const 14)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 15 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_3_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 0 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_3_sweep_offset_65520_align_1" (i32.const 0)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 0 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_3_sweep_offset_65520_align_1" (i32.const 1)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 0 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_3_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 0 244 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_4_sweep_offset_0_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 0 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_4_sweep_offset_0_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 1 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_4_sweep_offset_0_align_1" (i32.const 15)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 15 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_4_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 0 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_4_sweep_offset_1_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 1 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_4_sweep_offset_1_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 2 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_4_sweep_offset_1_align_1" (i32.const 14)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 15 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_4_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 0 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_4_sweep_offset_65520_align_1" (i32.const 0)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 0 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_4_sweep_offset_65520_align_1" (i32.const 1)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 0 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_4_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 0 245 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_5_sweep_offset_0_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 0 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_5_sweep_offset_0_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 1 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_5_sweep_offset_0_align_1" (i32.const 15)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 15 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_5_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 0 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_5_sweep_offset_1_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 1 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_5_sweep_offset_1_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 2 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_5_sweep_offset_1_align_1" (i32.const 14)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 15 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_5_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 0 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_5_sweep_offset_65520_align_1" (i32.const 0)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 0 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_5_sweep_offset_65520_align_1" (i32.const 1)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 0 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_5_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 0 246 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_6_sweep_offset_0_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 0 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_6_sweep_offset_0_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 1 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_6_sweep_offset_0_align_1" (i32.const 15)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 15 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_6_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 0 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_6_sweep_offset_1_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 1 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_6_sweep_offset_1_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 2 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_6_sweep_offset_1_align_1" (i32.const 14)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 15 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_6_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 0 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_6_sweep_offset_65520_align_1" (i32.const 0)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 0 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_6_sweep_offset_65520_align_1" (i32.const 1)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 0 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_6_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 0 247 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_7_sweep_offset_0_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 0 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_7_sweep_offset_0_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 1 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_7_sweep_offset_0_align_1" (i32.const 15)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 15 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_7_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 0 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_7_sweep_offset_1_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 1 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_7_sweep_offset_1_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 2 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_7_sweep_offset_1_align_1" (i32.const 14)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 15 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_7_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 0 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_7_sweep_offset_65520_align_1" (i32.const 0)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 0 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_7_sweep_offset_65520_align_1" (i32.const 1)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 0 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_7_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 0 248 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_8_sweep_offset_0_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 0 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_8_sweep_offset_0_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 1 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_8_sweep_offset_0_align_1" (i32.const 15)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 15 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_8_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 0 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_8_sweep_offset_1_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 1 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_8_sweep_offset_1_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 2 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_8_sweep_offset_1_align_1" (i32.const 14)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 15 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_8_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 0 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_8_sweep_offset_65520_align_1" (i32.const 0)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 0 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_8_sweep_offset_65520_align_1" (i32.const 1)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 0 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_8_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 0 249 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_9_sweep_offset_0_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 0 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_9_sweep_offset_0_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 1 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_9_sweep_offset_0_align_1" (i32.const 15)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 15 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_9_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 0 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_9_sweep_offset_1_align_1" (i32.const 0)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 1 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_9_sweep_offset_1_align_1" (i32.const 1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 2 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_9_sweep_offset_1_align_1" (i32.const 14)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 15 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_9_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 0 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_9_sweep_offset_65520_align_1" (i32.const 0)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 0 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_9_sweep_offset_65520_align_1" (i32.const 1)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 0 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_9_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 0 250 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_10_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 0 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_10_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 1 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_10_sweep_offset_0_align_1" (i32.const 15)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 15 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_10_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 0 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_10_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 1 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_10_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 2 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_10_sweep_offset_1_align_1" (i32.const 14)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 15 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_10_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 0 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_10_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 0 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_10_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 0 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_10_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 0 251 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_11_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 0 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_11_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 1 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_11_sweep_offset_0_align_1" (i32.const 15)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 15 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_11_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 0 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_11_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 1 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_11_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 2 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_11_sweep_offset_1_align_1" (i32.const 14)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 15 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_11_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 0 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_11_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 0 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_11_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 0 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_11_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 0 252 253 254 255))
+(assert_return (invoke "v128.load8_lane_12_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 0 253 254 255))
+(assert_return (invoke "v128.load8_lane_12_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 1 253 254 255))
+(assert_return (invoke "v128.load8_lane_12_sweep_offset_0_align_1" (i32.const 15)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 15 253 254 255))
+(assert_return (invoke "v128.load8_lane_12_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 0 253 254 255))
+(assert_return (invoke "v128.load8_lane_12_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 1 253 254 255))
+(assert_return (invoke "v128.load8_lane_12_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 2 253 254 255))
+(assert_return (invoke "v128.load8_lane_12_sweep_offset_1_align_1" (i32.const 14)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 15 253 254 255))
+(assert_return (invoke "v128.load8_lane_12_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 0 253 254 255))
+(assert_return (invoke "v128.load8_lane_12_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 0 253 254 255))
+(assert_return (invoke "v128.load8_lane_12_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 0 253 254 255))
+(assert_return (invoke "v128.load8_lane_12_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 0 253 254 255))
+(assert_return (invoke "v128.load8_lane_13_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 0 254 255))
+(assert_return (invoke "v128.load8_lane_13_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 1 254 255))
+(assert_return (invoke "v128.load8_lane_13_sweep_offset_0_align_1" (i32.const 15)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 15 254 255))
+(assert_return (invoke "v128.load8_lane_13_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 0 254 255))
+(assert_return (invoke "v128.load8_lane_13_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 1 254 255))
+(assert_return (invoke "v128.load8_lane_13_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 2 254 255))
+(assert_return (invoke "v128.load8_lane_13_sweep_offset_1_align_1" (i32.const 14)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 15 254 255))
+(assert_return (invoke "v128.load8_lane_13_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 0 254 255))
+(assert_return (invoke "v128.load8_lane_13_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 0 254 255))
+(assert_return (invoke "v128.load8_lane_13_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 0 254 255))
+(assert_return (invoke "v128.load8_lane_13_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 0 254 255))
+(assert_return (invoke "v128.load8_lane_14_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 0 255))
+(assert_return (invoke "v128.load8_lane_14_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 1 255))
+(assert_return (invoke "v128.load8_lane_14_sweep_offset_0_align_1" (i32.const 15)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 15 255))
+(assert_return (invoke "v128.load8_lane_14_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 0 255))
+(assert_return (invoke "v128.load8_lane_14_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 1 255))
+(assert_return (invoke "v128.load8_lane_14_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 2 255))
+(assert_return (invoke "v128.load8_lane_14_sweep_offset_1_align_1" (i32.const 14)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 15 255))
+(assert_return (invoke "v128.load8_lane_14_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 0 255))
+(assert_return (invoke "v128.load8_lane_14_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 0 255))
+(assert_return (invoke "v128.load8_lane_14_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 0 255))
+(assert_return (invoke "v128.load8_lane_14_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 0 255))
+(assert_return (invoke "v128.load8_lane_15_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 0))
+(assert_return (invoke "v128.load8_lane_15_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 1))
+(assert_return (invoke "v128.load8_lane_15_sweep_offset_0_align_1" (i32.const 15)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 15))
+(assert_return (invoke "v128.load8_lane_15_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 0))
+(assert_trap (invoke "v128.load8_lane_15_sweep_offset_0_align_1" (i32.const 65536)
+                                                                 (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load8_lane_15_sweep_offset_0_align_1" (i32.const -1)
+                                                                 (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load8_lane_15_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 1))
+(assert_return (invoke "v128.load8_lane_15_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 2))
+(assert_return (invoke "v128.load8_lane_15_sweep_offset_1_align_1" (i32.const 14)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 15))
+(assert_return (invoke "v128.load8_lane_15_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 0))
+(assert_trap (invoke "v128.load8_lane_15_sweep_offset_1_align_1" (i32.const 65535)
+                                                                 (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.load8_lane_15_sweep_offset_1_align_1" (i32.const -1)
+                                                                 (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.load8_lane_15_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 0))
+(assert_return (invoke "v128.load8_lane_15_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 0))
+(assert_return (invoke "v128.load8_lane_15_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 0))
+(assert_trap (invoke "v128.load8_lane_15_sweep_offset_65520_align_1" (i32.const 16)
+                                                                     (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.load8_lane_15_sweep_offset_65520_align_1" (i32.const -1)
+                                                                     (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                     "out of bounds memory access")
+
 ;; type check
 (assert_invalid  (module (memory 1)
           (func (param $x v128) (result v128)
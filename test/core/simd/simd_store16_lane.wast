@@ -188,6 +188,294 @@
     (local.set $ret (i64.load (local.get $address)))
     (v128.store offset=7 (i32.const 0) (global.get $zero))
     (local.get $ret))
+  (func (export "v128.store16_lane_0_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_0_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=2 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_0_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_0_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=2 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_0_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_0_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=2 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_1_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_1_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=2 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_1_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_1_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=2 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_1_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_1_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=2 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_2_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=1 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_2_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=2 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_2_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=1 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_2_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=2 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_2_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=1 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_2_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=2 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_3_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=1 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_3_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=2 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_3_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=1 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_3_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=2 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_3_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=1 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_3_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=2 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_4_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=1 4 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_4_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=2 4 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_4_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=1 4 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_4_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=2 4 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_4_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=1 4 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_4_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=2 4 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_5_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=1 5 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_5_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=2 5 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_5_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=1 5 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_5_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=2 5 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_5_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=1 5 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_5_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=2 5 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_6_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=1 6 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_6_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=2 6 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_6_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=1 6 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_6_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=2 6 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_6_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=1 6 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_6_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=2 6 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_7_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=1 7 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_7_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=0 align=2 7 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=0 (local.get $address)))
+    (i64.store16 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_7_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=1 7 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_7_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=1 align=2 7 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=1 (local.get $address)))
+    (i64.store16 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_7_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=1 7 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store16_lane_7_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store16_lane offset=65520 align=2 7 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load16_u offset=65520 (local.get $address)))
+    (i64.store16 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
 )
 
 (assert_return (invoke "v128.store16_lane_0" (i32.const 0)
@@ -279,6 +567,548 @@
                                                      (v128.const i16x8 0 0 0 0 0 0 0 2055))
                                                      (i64.const 2055))
 
+;; other addresses, out of bounds
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_0_align_1" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_0_align_1" (i32.const 65536)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_0_align_1" (i32.const -1)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_0_align_2" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_0_align_2" (i32.const 65535)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_0_align_2" (i32.const 65536)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_0_align_2" (i32.const -1)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_1_align_1" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_1_align_1" (i32.const 65535)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_1_align_1" (i32.const -1)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_1_align_2" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 61936))
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_1_align_2" (i32.const 65534)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_1_align_2" (i32.const 65535)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_1_align_2" (i32.const -1)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_65520_align_1" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 61936))
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_65520_align_1" (i32.const 16)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_65520_align_1" (i32.const -1)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 61936))
+(assert_return (invoke "v128.store16_lane_0_sweep_offset_65520_align_2" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 61936))
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_65520_align_2" (i32.const 15)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_65520_align_2" (i32.const 16)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_0_sweep_offset_65520_align_2" (i32.const -1)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_0_align_1" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_0_align_2" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_1_align_1" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_1_align_2" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_65520_align_1" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_1_sweep_offset_65520_align_2" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62450))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_0_align_1" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_0_align_2" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_1_align_1" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_1_align_2" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_65520_align_1" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_2_sweep_offset_65520_align_2" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 62964))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_0_align_1" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_0_align_2" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_1_align_1" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_1_align_2" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_65520_align_1" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_3_sweep_offset_65520_align_2" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63478))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_0_align_1" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_0_align_2" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_1_align_1" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_1_align_2" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_65520_align_1" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_4_sweep_offset_65520_align_2" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 63992))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_0_align_1" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_0_align_2" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_1_align_1" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_1_align_2" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_65520_align_1" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_5_sweep_offset_65520_align_2" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 64506))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_0_align_1" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_0_align_2" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_1_align_1" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_1_align_2" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_65520_align_1" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_6_sweep_offset_65520_align_2" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65020))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_0_align_1" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_0_align_1" (i32.const 65535)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_0_align_1" (i32.const 65536)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_0_align_1" (i32.const -1)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_0_align_2" (i32.const 65534)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_0_align_2" (i32.const 65535)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_0_align_2" (i32.const 65536)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_0_align_2" (i32.const -1)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_1_align_1" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_1_align_1" (i32.const 65534)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_1_align_1" (i32.const 65535)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_1_align_1" (i32.const -1)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_1_align_2" (i32.const 65533)
+                                                                    (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                    (i64.const 65534))
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_1_align_2" (i32.const 65534)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_1_align_2" (i32.const 65535)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_1_align_2" (i32.const -1)
+                                                                  (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_65520_align_1" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65534))
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_65520_align_1" (i32.const 15)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_65520_align_1" (i32.const 16)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_65520_align_1" (i32.const -1)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65534))
+(assert_return (invoke "v128.store16_lane_7_sweep_offset_65520_align_2" (i32.const 14)
+                                                                        (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                        (i64.const 65534))
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_65520_align_2" (i32.const 15)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_65520_align_2" (i32.const 16)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store16_lane_7_sweep_offset_65520_align_2" (i32.const -1)
+                                                                      (v128.const i16x8 61936 62450 62964 63478 63992 64506 65020 65534))
+                                                                      "out of bounds memory access")
+
 ;; type check
 (assert_invalid  (module (memory 1)
           (func (param $x v128) (result v128)
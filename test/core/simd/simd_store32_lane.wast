@@ -120,6 +120,222 @@
     (local.set $ret (i64.load (local.get $address)))
     (v128.store offset=3 (i32.const 0) (global.get $zero))
     (local.get $ret))
+  (func (export "v128.store32_lane_0_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_0_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=2 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_0_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=4 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_0_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_0_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=2 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_0_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=4 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_0_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_0_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=2 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_0_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=4 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_1_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_1_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=2 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_1_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=4 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_1_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_1_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=2 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_1_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=4 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_1_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_1_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=2 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_1_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=4 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_2_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=1 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_2_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=2 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_2_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=4 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_2_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=1 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_2_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=2 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_2_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=4 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_2_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=1 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_2_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=2 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_2_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=4 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_3_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=1 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_3_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=2 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_3_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=0 align=4 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=0 (local.get $address)))
+    (i64.store32 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_3_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=1 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_3_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=2 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_3_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=1 align=4 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=1 (local.get $address)))
+    (i64.store32 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_3_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=1 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_3_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=2 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store32_lane_3_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store32_lane offset=65520 align=4 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load32_u offset=65520 (local.get $address)))
+    (i64.store32 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
 )
 
 (assert_return (invoke "v128.store32_lane_0" (i32.const 0)
@@ -179,6 +395,494 @@
                                                      (v128.const i32x4 0 0 0 100992003))
                                                      (i64.const 100992003))
 
+;; other addresses, out of bounds
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_0_align_1" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_0_align_1" (i32.const 65533)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_0_align_1" (i32.const 65536)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_0_align_1" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_0_align_2" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_0_align_2" (i32.const 65533)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_0_align_2" (i32.const 65536)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_0_align_2" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_0_align_4" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_0_align_4" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_0_align_4" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_0_align_4" (i32.const 65533)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_0_align_4" (i32.const 65536)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_0_align_4" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_1_align_1" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_1_align_1" (i32.const 65532)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_1_align_1" (i32.const 65535)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_1_align_1" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_1_align_2" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_1_align_2" (i32.const 65532)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_1_align_2" (i32.const 65535)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_1_align_2" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_1_align_4" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_1_align_4" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_1_align_4" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4092785136))
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_1_align_4" (i32.const 65532)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_1_align_4" (i32.const 65535)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_1_align_4" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_65520_align_1" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4092785136))
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_65520_align_1" (i32.const 13)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_65520_align_1" (i32.const 16)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_65520_align_1" (i32.const -1)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_65520_align_2" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4092785136))
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_65520_align_2" (i32.const 13)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_65520_align_2" (i32.const 16)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_65520_align_2" (i32.const -1)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_65520_align_4" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_65520_align_4" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4092785136))
+(assert_return (invoke "v128.store32_lane_0_sweep_offset_65520_align_4" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4092785136))
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_65520_align_4" (i32.const 13)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_65520_align_4" (i32.const 16)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_0_sweep_offset_65520_align_4" (i32.const -1)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_0_align_1" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_0_align_2" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_0_align_4" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_0_align_4" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_0_align_4" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_1_align_1" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_1_align_2" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_1_align_4" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_1_align_4" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_1_align_4" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_65520_align_1" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_65520_align_2" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_65520_align_4" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_65520_align_4" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_1_sweep_offset_65520_align_4" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4160157172))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_0_align_1" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_0_align_2" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_0_align_4" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_0_align_4" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_0_align_4" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_1_align_1" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_1_align_2" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_1_align_4" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_1_align_4" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_1_align_4" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_65520_align_1" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_65520_align_2" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_65520_align_4" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_65520_align_4" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_2_sweep_offset_65520_align_4" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4227529208))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_0_align_1" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_0_align_1" (i32.const 65533)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_0_align_1" (i32.const 65536)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_0_align_1" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_0_align_2" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_0_align_2" (i32.const 65533)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_0_align_2" (i32.const 65536)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_0_align_2" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_0_align_4" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_0_align_4" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_0_align_4" (i32.const 65532)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_0_align_4" (i32.const 65533)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_0_align_4" (i32.const 65536)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_0_align_4" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_1_align_1" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_1_align_1" (i32.const 65532)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_1_align_1" (i32.const 65535)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_1_align_1" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_1_align_2" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_1_align_2" (i32.const 65532)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_1_align_2" (i32.const 65535)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_1_align_2" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_1_align_4" (i32.const 0)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_1_align_4" (i32.const 1)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_1_align_4" (i32.const 65531)
+                                                                    (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                    (i64.const 4294901244))
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_1_align_4" (i32.const 65532)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_1_align_4" (i32.const 65535)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_1_align_4" (i32.const -1)
+                                                                  (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_65520_align_1" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4294901244))
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_65520_align_1" (i32.const 13)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_65520_align_1" (i32.const 16)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_65520_align_1" (i32.const -1)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_65520_align_2" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4294901244))
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_65520_align_2" (i32.const 13)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_65520_align_2" (i32.const 16)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_65520_align_2" (i32.const -1)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_65520_align_4" (i32.const 0)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_65520_align_4" (i32.const 1)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4294901244))
+(assert_return (invoke "v128.store32_lane_3_sweep_offset_65520_align_4" (i32.const 12)
+                                                                        (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                        (i64.const 4294901244))
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_65520_align_4" (i32.const 13)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_65520_align_4" (i32.const 16)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store32_lane_3_sweep_offset_65520_align_4" (i32.const -1)
+                                                                      (v128.const i32x4 4092785136 4160157172 4227529208 4294901244))
+                                                                      "out of bounds memory access")
+
 ;; type check
 (assert_invalid  (module (memory 1)
           (func (param $x v128) (result v128)
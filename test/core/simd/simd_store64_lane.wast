@@ -74,6 +74,150 @@
     (local.set $ret (i64.load (local.get $address)))
     (v128.store offset=1 (i32.const 0) (global.get $zero))
     (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=0 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=0 (local.get $address)))
+    (i64.store offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=0 align=2 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=0 (local.get $address)))
+    (i64.store offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=0 align=4 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=0 (local.get $address)))
+    (i64.store offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_0_align_8")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=0 align=8 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=0 (local.get $address)))
+    (i64.store offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=1 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=1 (local.get $address)))
+    (i64.store offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=1 align=2 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=1 (local.get $address)))
+    (i64.store offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=1 align=4 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=1 (local.get $address)))
+    (i64.store offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_1_align_8")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=1 align=8 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=1 (local.get $address)))
+    (i64.store offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=65520 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=65520 (local.get $address)))
+    (i64.store offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=65520 align=2 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=65520 (local.get $address)))
+    (i64.store offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=65520 align=4 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=65520 (local.get $address)))
+    (i64.store offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_0_sweep_offset_65520_align_8")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=65520 align=8 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=65520 (local.get $address)))
+    (i64.store offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=0 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=0 (local.get $address)))
+    (i64.store offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_0_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=0 align=2 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=0 (local.get $address)))
+    (i64.store offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_0_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=0 align=4 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=0 (local.get $address)))
+    (i64.store offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_0_align_8")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=0 align=8 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=0 (local.get $address)))
+    (i64.store offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=1 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=1 (local.get $address)))
+    (i64.store offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_1_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=1 align=2 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=1 (local.get $address)))
+    (i64.store offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_1_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=1 align=4 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=1 (local.get $address)))
+    (i64.store offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_1_align_8")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=1 align=8 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=1 (local.get $address)))
+    (i64.store offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=65520 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=65520 (local.get $address)))
+    (i64.store offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_65520_align_2")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=65520 align=2 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=65520 (local.get $address)))
+    (i64.store offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_65520_align_4")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=65520 align=4 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=65520 (local.get $address)))
+    (i64.store offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store64_lane_1_sweep_offset_65520_align_8")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store64_lane offset=65520 align=8 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load offset=65520 (local.get $address)))
+    (i64.store offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
 )
 
 (assert_return (invoke "v128.store64_lane_0" (i32.const 0)
@@ -111,6 +255,440 @@
                                                      (v128.const i64x2 0 578437695752307201))
                                                      (i64.const 578437695752307201))
 
+;; other addresses, out of bounds
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_1" (i32.const 65528)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_1" (i32.const 65529)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_1" (i32.const 65536)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_1" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_2" (i32.const 65528)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_2" (i32.const 65529)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_2" (i32.const 65536)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_2" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_4" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_4" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_4" (i32.const 65528)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_4" (i32.const 65529)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_4" (i32.const 65536)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_4" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_8" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_8" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_0_align_8" (i32.const 65528)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_8" (i32.const 65529)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_8" (i32.const 65536)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_0_align_8" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_1" (i32.const 65527)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_1" (i32.const 65528)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_1" (i32.const 65535)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_1" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_2" (i32.const 65527)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_2" (i32.const 65528)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_2" (i32.const 65535)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_2" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_4" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_4" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_4" (i32.const 65527)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_4" (i32.const 65528)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_4" (i32.const 65535)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_4" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_8" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_8" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_1_align_8" (i32.const 65527)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_8" (i32.const 65528)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_8" (i32.const 65535)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_1_align_8" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_1" (i32.const 8)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_1" (i32.const 9)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_1" (i32.const 16)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_1" (i32.const -1)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_2" (i32.const 8)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_2" (i32.const 9)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_2" (i32.const 16)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_2" (i32.const -1)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_4" (i32.const 0)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_4" (i32.const 1)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_4" (i32.const 8)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_4" (i32.const 9)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_4" (i32.const 16)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_4" (i32.const -1)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_8" (i32.const 0)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_8" (i32.const 1)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_return (invoke "v128.store64_lane_0_sweep_offset_65520_align_8" (i32.const 8)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 17867739004052632048))
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_8" (i32.const 9)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_8" (i32.const 16)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_0_sweep_offset_65520_align_8" (i32.const -1)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_1" (i32.const 65528)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_1" (i32.const 65529)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_1" (i32.const 65536)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_1" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_2" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_2" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_2" (i32.const 65528)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_2" (i32.const 65529)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_2" (i32.const 65536)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_2" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_4" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_4" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_4" (i32.const 65528)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_4" (i32.const 65529)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_4" (i32.const 65536)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_4" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_8" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_8" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_0_align_8" (i32.const 65528)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_8" (i32.const 65529)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_8" (i32.const 65536)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_0_align_8" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_1" (i32.const 65527)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_1" (i32.const 65528)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_1" (i32.const 65535)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_1" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_2" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_2" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_2" (i32.const 65527)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_2" (i32.const 65528)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_2" (i32.const 65535)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_2" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_4" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_4" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_4" (i32.const 65527)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_4" (i32.const 65528)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_4" (i32.const 65535)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_4" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_8" (i32.const 0)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_8" (i32.const 1)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_1_align_8" (i32.const 65527)
+                                                                    (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                    (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_8" (i32.const 65528)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_8" (i32.const 65535)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_1_align_8" (i32.const -1)
+                                                                  (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_1" (i32.const 8)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_1" (i32.const 9)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_1" (i32.const 16)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_1" (i32.const -1)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_2" (i32.const 0)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_2" (i32.const 1)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_2" (i32.const 8)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_2" (i32.const 9)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_2" (i32.const 16)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_2" (i32.const -1)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_4" (i32.const 0)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_4" (i32.const 1)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_4" (i32.const 8)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_4" (i32.const 9)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_4" (i32.const 16)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_4" (i32.const -1)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_8" (i32.const 0)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_8" (i32.const 1)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_return (invoke "v128.store64_lane_1_sweep_offset_65520_align_8" (i32.const 8)
+                                                                        (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                        (i64.const 18446460386757245432))
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_8" (i32.const 9)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_8" (i32.const 16)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store64_lane_1_sweep_offset_65520_align_8" (i32.const -1)
+                                                                      (v128.const i64x2 17867739004052632048 18446460386757245432))
+                                                                      "out of bounds memory access")
+
 ;; type check
 (assert_invalid  (module (memory 1)
           (func (param $x v128) (result v128)
@@ -276,6 +276,294 @@
     (local.set $ret (i64.load (local.get $address)))
     (v128.store offset=15 (i32.const 0) (global.get $zero))
     (local.get $ret))
+  (func (export "v128.store8_lane_0_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_0_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_0_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 0 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_1_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_1_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_1_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 1 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_2_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_2_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_2_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 2 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_3_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_3_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_3_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 3 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_4_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 4 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_4_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 4 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_4_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 4 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_5_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 5 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_5_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 5 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_5_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 5 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_6_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 6 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_6_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 6 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_6_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 6 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_7_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 7 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_7_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 7 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_7_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 7 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_8_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 8 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_8_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 8 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_8_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 8 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_9_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 9 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_9_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 9 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_9_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 9 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_10_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 10 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_10_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 10 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_10_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 10 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_11_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 11 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_11_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 11 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_11_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 11 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_12_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 12 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_12_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 12 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_12_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 12 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_13_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 13 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_13_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 13 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_13_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 13 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_14_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 14 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_14_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 14 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_14_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 14 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_15_sweep_offset_0_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=0 align=1 15 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=0 (local.get $address)))
+    (i64.store8 offset=0 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_15_sweep_offset_1_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=1 align=1 15 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=1 (local.get $address)))
+    (i64.store8 offset=1 (local.get $address) (i64.const 0))
+    (local.get $ret))
+  (func (export "v128.store8_lane_15_sweep_offset_65520_align_1")
+    (param $address i32) (param $x v128) (result i64) (local $ret i64)
+    (v128.store8_lane offset=65520 align=1 15 (local.get $address) (local.get $x))
+    (local.set $ret (i64.load8_u offset=65520 (local.get $address)))
+    (i64.store8 offset=65520 (local.get $address) (i64.const 0))
+    (local.get $ret))
 )
 
 (assert_return (invoke "v128.store8_lane_0" (i32.const 0)
@@ -407,6 +695,476 @@
                                                      (v128.const i8x16 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 15))
                                                      (i64.const 15))
 
+;; other addresses, out of bounds
+(assert_return (invoke "v128.store8_lane_0_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 240))
+(assert_return (invoke "v128.store8_lane_0_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 240))
+(assert_return (invoke "v128.store8_lane_0_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 240))
+(assert_trap (invoke "v128.store8_lane_0_sweep_offset_0_align_1" (i32.const 65536)
+                                                                 (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.store8_lane_0_sweep_offset_0_align_1" (i32.const -1)
+                                                                 (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.store8_lane_0_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 240))
+(assert_return (invoke "v128.store8_lane_0_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 240))
+(assert_return (invoke "v128.store8_lane_0_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 240))
+(assert_trap (invoke "v128.store8_lane_0_sweep_offset_1_align_1" (i32.const 65535)
+                                                                 (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                 "out of bounds memory access")
+(assert_trap (invoke "v128.store8_lane_0_sweep_offset_1_align_1" (i32.const -1)
+                                                                 (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                 "out of bounds memory access")
+(assert_return (invoke "v128.store8_lane_0_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 240))
+(assert_return (invoke "v128.store8_lane_0_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 240))
+(assert_return (invoke "v128.store8_lane_0_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 240))
+(assert_trap (invoke "v128.store8_lane_0_sweep_offset_65520_align_1" (i32.const 16)
+                                                                     (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                     "out of bounds memory access")
+(assert_trap (invoke "v128.store8_lane_0_sweep_offset_65520_align_1" (i32.const -1)
+                                                                     (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                     "out of bounds memory access")
+(assert_return (invoke "v128.store8_lane_1_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 241))
+(assert_return (invoke "v128.store8_lane_1_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 241))
+(assert_return (invoke "v128.store8_lane_1_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 241))
+(assert_return (invoke "v128.store8_lane_1_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 241))
+(assert_return (invoke "v128.store8_lane_1_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 241))
+(assert_return (invoke "v128.store8_lane_1_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 241))
+(assert_return (invoke "v128.store8_lane_1_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 241))
+(assert_return (invoke "v128.store8_lane_1_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 241))
+(assert_return (invoke "v128.store8_lane_1_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 241))
+(assert_return (invoke "v128.store8_lane_2_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 242))
+(assert_return (invoke "v128.store8_lane_2_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 242))
+(assert_return (invoke "v128.store8_lane_2_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 242))
+(assert_return (invoke "v128.store8_lane_2_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 242))
+(assert_return (invoke "v128.store8_lane_2_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 242))
+(assert_return (invoke "v128.store8_lane_2_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 242))
+(assert_return (invoke "v128.store8_lane_2_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 242))
+(assert_return (invoke "v128.store8_lane_2_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 242))
+(assert_return (invoke "v128.store8_lane_2_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 242))
+(assert_return (invoke "v128.store8_lane_3_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 243))
+(assert_return (invoke "v128.store8_lane_3_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 243))
+(assert_return (invoke "v128.store8_lane_3_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 243))
+(assert_return (invoke "v128.store8_lane_3_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 243))
+(assert_return (invoke "v128.store8_lane_3_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 243))
+(assert_return (invoke "v128.store8_lane_3_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 243))
+(assert_return (invoke "v128.store8_lane_3_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 243))
+(assert_return (invoke "v128.store8_lane_3_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 243))
+(assert_return (invoke "v128.store8_lane_3_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 243))
+(assert_return (invoke "v128.store8_lane_4_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 244))
+(assert_return (invoke "v128.store8_lane_4_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 244))
+(assert_return (invoke "v128.store8_lane_4_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 244))
+(assert_return (invoke "v128.store8_lane_4_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 244))
+(assert_return (invoke "v128.store8_lane_4_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 244))
+(assert_return (invoke "v128.store8_lane_4_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 244))
+(assert_return (invoke "v128.store8_lane_4_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 244))
+(assert_return (invoke "v128.store8_lane_4_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 244))
+(assert_return (invoke "v128.store8_lane_4_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 244))
+(assert_return (invoke "v128.store8_lane_5_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 245))
+(assert_return (invoke "v128.store8_lane_5_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 245))
+(assert_return (invoke "v128.store8_lane_5_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 245))
+(assert_return (invoke "v128.store8_lane_5_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 245))
+(assert_return (invoke "v128.store8_lane_5_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 245))
+(assert_return (invoke "v128.store8_lane_5_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 245))
+(assert_return (invoke "v128.store8_lane_5_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 245))
+(assert_return (invoke "v128.store8_lane_5_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 245))
+(assert_return (invoke "v128.store8_lane_5_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 245))
+(assert_return (invoke "v128.store8_lane_6_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 246))
+(assert_return (invoke "v128.store8_lane_6_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 246))
+(assert_return (invoke "v128.store8_lane_6_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 246))
+(assert_return (invoke "v128.store8_lane_6_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 246))
+(assert_return (invoke "v128.store8_lane_6_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 246))
+(assert_return (invoke "v128.store8_lane_6_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 246))
+(assert_return (invoke "v128.store8_lane_6_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 246))
+(assert_return (invoke "v128.store8_lane_6_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 246))
+(assert_return (invoke "v128.store8_lane_6_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 246))
+(assert_return (invoke "v128.store8_lane_7_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 247))
+(assert_return (invoke "v128.store8_lane_7_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 247))
+(assert_return (invoke "v128.store8_lane_7_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 247))
+(assert_return (invoke "v128.store8_lane_7_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 247))
+(assert_return (invoke "v128.store8_lane_7_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 247))
+(assert_return (invoke "v128.store8_lane_7_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 247))
+(assert_return (invoke "v128.store8_lane_7_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 247))
+(assert_return (invoke "v128.store8_lane_7_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 247))
+(assert_return (invoke "v128.store8_lane_7_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 247))
+(assert_return (invoke "v128.store8_lane_8_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 248))
+(assert_return (invoke "v128.store8_lane_8_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 248))
+(assert_return (invoke "v128.store8_lane_8_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 248))
+(assert_return (invoke "v128.store8_lane_8_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 248))
+(assert_return (invoke "v128.store8_lane_8_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 248))
+(assert_return (invoke "v128.store8_lane_8_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 248))
+(assert_return (invoke "v128.store8_lane_8_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 248))
+(assert_return (invoke "v128.store8_lane_8_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 248))
+(assert_return (invoke "v128.store8_lane_8_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 248))
+(assert_return (invoke "v128.store8_lane_9_sweep_offset_0_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 249))
+(assert_return (invoke "v128.store8_lane_9_sweep_offset_0_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 249))
+(assert_return (invoke "v128.store8_lane_9_sweep_offset_0_align_1" (i32.const 65535)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 249))
+(assert_return (invoke "v128.store8_lane_9_sweep_offset_1_align_1" (i32.const 0)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 249))
+(assert_return (invoke "v128.store8_lane_9_sweep_offset_1_align_1" (i32.const 1)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 249))
+(assert_return (invoke "v128.store8_lane_9_sweep_offset_1_align_1" (i32.const 65534)
+                                                                   (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                   (i64.const 249))
+(assert_return (invoke "v128.store8_lane_9_sweep_offset_65520_align_1" (i32.const 0)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 249))
+(assert_return (invoke "v128.store8_lane_9_sweep_offset_65520_align_1" (i32.const 1)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 249))
+(assert_return (invoke "v128.store8_lane_9_sweep_offset_65520_align_1" (i32.const 15)
+                                                                       (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                       (i64.const 249))
+(assert_return (invoke "v128.store8_lane_10_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 250))
+(assert_return (invoke "v128.store8_lane_10_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 250))
+(assert_return (invoke "v128.store8_lane_10_sweep_offset_0_align_1" (i32.const 65535)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 250))
+(assert_return (invoke "v128.store8_lane_10_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 250))
+(assert_return (invoke "v128.store8_lane_10_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 250))
+(assert_return (invoke "v128.store8_lane_10_sweep_offset_1_align_1" (i32.const 65534)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 250))
+(assert_return (invoke "v128.store8_lane_10_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 250))
+(assert_return (invoke "v128.store8_lane_10_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 250))
+(assert_return (invoke "v128.store8_lane_10_sweep_offset_65520_align_1" (i32.const 15)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 250))
+(assert_return (invoke "v128.store8_lane_11_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 251))
+(assert_return (invoke "v128.store8_lane_11_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 251))
+(assert_return (invoke "v128.store8_lane_11_sweep_offset_0_align_1" (i32.const 65535)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 251))
+(assert_return (invoke "v128.store8_lane_11_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 251))
+(assert_return (invoke "v128.store8_lane_11_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 251))
+(assert_return (invoke "v128.store8_lane_11_sweep_offset_1_align_1" (i32.const 65534)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 251))
+(assert_return (invoke "v128.store8_lane_11_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 251))
+(assert_return (invoke "v128.store8_lane_11_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 251))
+(assert_return (invoke "v128.store8_lane_11_sweep_offset_65520_align_1" (i32.const 15)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 251))
+(assert_return (invoke "v128.store8_lane_12_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 252))
+(assert_return (invoke "v128.store8_lane_12_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 252))
+(assert_return (invoke "v128.store8_lane_12_sweep_offset_0_align_1" (i32.const 65535)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 252))
+(assert_return (invoke "v128.store8_lane_12_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 252))
+(assert_return (invoke "v128.store8_lane_12_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 252))
+(assert_return (invoke "v128.store8_lane_12_sweep_offset_1_align_1" (i32.const 65534)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 252))
+(assert_return (invoke "v128.store8_lane_12_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 252))
+(assert_return (invoke "v128.store8_lane_12_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 252))
+(assert_return (invoke "v128.store8_lane_12_sweep_offset_65520_align_1" (i32.const 15)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 252))
+(assert_return (invoke "v128.store8_lane_13_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 253))
+(assert_return (invoke "v128.store8_lane_13_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 253))
+(assert_return (invoke "v128.store8_lane_13_sweep_offset_0_align_1" (i32.const 65535)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 253))
+(assert_return (invoke "v128.store8_lane_13_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 253))
+(assert_return (invoke "v128.store8_lane_13_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 253))
+(assert_return (invoke "v128.store8_lane_13_sweep_offset_1_align_1" (i32.const 65534)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 253))
+(assert_return (invoke "v128.store8_lane_13_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 253))
+(assert_return (invoke "v128.store8_lane_13_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 253))
+(assert_return (invoke "v128.store8_lane_13_sweep_offset_65520_align_1" (i32.const 15)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 253))
+(assert_return (invoke "v128.store8_lane_14_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 254))
+(assert_return (invoke "v128.store8_lane_14_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 254))
+(assert_return (invoke "v128.store8_lane_14_sweep_offset_0_align_1" (i32.const 65535)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 254))
+(assert_return (invoke "v128.store8_lane_14_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 254))
+(assert_return (invoke "v128.store8_lane_14_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 254))
+(assert_return (invoke "v128.store8_lane_14_sweep_offset_1_align_1" (i32.const 65534)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 254))
+(assert_return (invoke "v128.store8_lane_14_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 254))
+(assert_return (invoke "v128.store8_lane_14_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 254))
+(assert_return (invoke "v128.store8_lane_14_sweep_offset_65520_align_1" (i32.const 15)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 254))
+(assert_return (invoke "v128.store8_lane_15_sweep_offset_0_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 255))
+(assert_return (invoke "v128.store8_lane_15_sweep_offset_0_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 255))
+(assert_return (invoke "v128.store8_lane_15_sweep_offset_0_align_1" (i32.const 65535)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 255))
+(assert_trap (invoke "v128.store8_lane_15_sweep_offset_0_align_1" (i32.const 65536)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store8_lane_15_sweep_offset_0_align_1" (i32.const -1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store8_lane_15_sweep_offset_1_align_1" (i32.const 0)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 255))
+(assert_return (invoke "v128.store8_lane_15_sweep_offset_1_align_1" (i32.const 1)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 255))
+(assert_return (invoke "v128.store8_lane_15_sweep_offset_1_align_1" (i32.const 65534)
+                                                                    (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                    (i64.const 255))
+(assert_trap (invoke "v128.store8_lane_15_sweep_offset_1_align_1" (i32.const 65535)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  "out of bounds memory access")
+(assert_trap (invoke "v128.store8_lane_15_sweep_offset_1_align_1" (i32.const -1)
+                                                                  (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                  "out of bounds memory access")
+(assert_return (invoke "v128.store8_lane_15_sweep_offset_65520_align_1" (i32.const 0)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 255))
+(assert_return (invoke "v128.store8_lane_15_sweep_offset_65520_align_1" (i32.const 1)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 255))
+(assert_return (invoke "v128.store8_lane_15_sweep_offset_65520_align_1" (i32.const 15)
+                                                                        (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                        (i64.const 255))
+(assert_trap (invoke "v128.store8_lane_15_sweep_offset_65520_align_1" (i32.const 16)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      "out of bounds memory access")
+(assert_trap (invoke "v128.store8_lane_15_sweep_offset_65520_align_1" (i32.const -1)
+                                                                      (v128.const i8x16 240 241 242 243 244 245 246 247 248 249 250 251 252 253 254 255))
+                                                                      "out of bounds memory access")
+
 ;; type check
 (assert_invalid  (module (memory 1)
           (func (param $x v128) (result v128)
@@ -424,4 +1182,4 @@
   (module (memory 1)
           (func (param $x v128) (result v128)
           (v128.store8_lane align=2 0 (i32.const 0) (local.get $x))))
-  "alignment must not be larger than natural")
+  "alignment must not be larger than natural")
\ No newline at end of file